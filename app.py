@@ -28,6 +28,9 @@ pages = {
         st.Page("pages/global_results.py",
                 title="Global Results",
                 icon=":material/table_view:"),
+        st.Page("pages/experiments.py",
+                title="Experiments",
+                icon=":material/science:"),
         st.Page("pages/prompts.py",
                 title="Prompts",
                 icon=":material/code:")
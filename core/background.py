@@ -0,0 +1,136 @@
+import threading
+from typing import Any, Callable
+
+
+class BackgroundRun:
+    """Advance a director to termination on a worker thread, one round at a time.
+
+    The worker never touches Streamlit state: finished rounds are queued and the
+    page drains them on its own reruns.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        director: Any,
+        execute_round: Callable[[Any], dict[str, Any]],
+        finalize: Callable[[Any], dict[str, Any] | None] | None = None,
+    ):
+        self.run_id = run_id
+        self.director = director
+        self._execute_round = execute_round
+        self._finalize = finalize
+        self._lock = threading.Lock()
+        self._pending_rounds: list[dict[str, Any]] = []
+        self._cancel_requested = threading.Event()
+        self.rounds_completed = 0
+        self.final_evaluation: dict[str, Any] | None = None
+        self.error: str | None = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"negotiation-run-{run_id}",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        # Takes effect between rounds; an in-flight LLM call is allowed to finish.
+        self._cancel_requested.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Return the rounds finished since the previous call."""
+        with self._lock:
+            pending = self._pending_rounds
+            self._pending_rounds = []
+        return pending
+
+    def _run(self) -> None:
+        try:
+            while not self.cancelled and self.director.can_advance():
+                round_item = self._execute_round(self.director)
+                with self._lock:
+                    self._pending_rounds.append(round_item)
+                    self.rounds_completed += 1
+            if not self.cancelled and self.director.is_terminated and self._finalize is not None:
+                self.final_evaluation = self._finalize(self.director)
+        except Exception as exc:
+            self.error = f"{type(exc).__name__}: {exc}"
+
+
+# Process-wide registry so a run survives page navigation within the session.
+_RUNS: dict[str, BackgroundRun] = {}
+_RUNS_LOCK = threading.Lock()
+
+
+def start_background_run(
+    run_id: str,
+    director: Any,
+    execute_round: Callable[[Any], dict[str, Any]],
+    finalize: Callable[[Any], dict[str, Any] | None] | None = None,
+) -> BackgroundRun:
+    with _RUNS_LOCK:
+        existing = _RUNS.get(run_id)
+        if existing is not None and existing.is_running():
+            return existing
+        background_run = BackgroundRun(run_id, director, execute_round, finalize)
+        _RUNS[run_id] = background_run
+    background_run.start()
+    return background_run
+
+
+def start_branch_runs(
+    run_id: str,
+    director: Any,
+    at_round: int,
+    count: int,
+    execute_round: Callable[[Any, str], dict[str, Any]],
+    finalize: Callable[[Any], dict[str, Any] | None] | None = None,
+    evaluation: dict[str, Any] | None = None,
+) -> list[BackgroundRun]:
+    """Fork `director` after `at_round` into `count` continuations, each on its own worker.
+
+    The forks share the history prefix (see NegotiationDirector.fork), so only
+    the rounds after `at_round` are generated and judged again. Branch run ids
+    are "<run_id>:branch-<n>", from 1; `execute_round` gets the fork and its id.
+    """
+    branch_runs = []
+    for index in range(1, count + 1):
+        branch_id = branch_run_id(run_id, index)
+        branch_runs.append(
+            start_background_run(
+                branch_id,
+                director.fork(at_round, evaluation),
+                lambda fork, branch_id=branch_id: execute_round(fork, branch_id),
+                finalize,
+            )
+        )
+    return branch_runs
+
+
+def branch_run_id(run_id: str, index: int) -> str:
+    return f"{run_id}:branch-{index}"
+
+
+def get_background_run(run_id: str | None) -> BackgroundRun | None:
+    if not run_id:
+        return None
+    with _RUNS_LOCK:
+        return _RUNS.get(run_id)
+
+
+def discard_background_run(run_id: str | None) -> None:
+    if not run_id:
+        return
+    with _RUNS_LOCK:
+        background_run = _RUNS.pop(run_id, None)
+    if background_run is not None:
+        background_run.cancel()
@@ -0,0 +1,188 @@
+import itertools
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+from core.negotiation_space import NegotiationSpace, build_negotiation_space
+
+
+# Upper bound on the number of offers scored per scenario.
+GRID_POINTS = 250_000
+MAX_GRID_LEVELS = 64
+
+
+@dataclass(frozen=True)
+class BargainingAnalysis:
+    """Pareto frontier, zone of possible agreement and Nash point of one scenario.
+
+    Offers are canonical vectors of the negotiation space (see
+    NegotiationSpace.own_values); utilities are 0 at an agent's reservation
+    values and 1 at its aspirations, so the disagreement point is the origin.
+    """
+
+    agent_names: tuple[str, ...]
+    grid_points: int
+    frontier_offers: np.ndarray
+    frontier_utilities: np.ndarray
+    zopa_share: float
+    zopa_bounds: np.ndarray
+    nash_offer: np.ndarray | None
+    nash_utilities: np.ndarray | None
+
+    @property
+    def has_zopa(self) -> bool:
+        return self.nash_offer is not None
+
+
+def _breakpoints(space: NegotiationSpace, column: int) -> np.ndarray:
+    # Utilities are piecewise linear with kinks at every reservation and
+    # aspiration value, so those levels (in the canonical frame) are always on the grid.
+    issue = space.issues[column]
+    points = [issue.low, issue.high]
+    others = max(len(space.agent_ids) - 1, 1)
+    for agent in range(len(space.agent_ids)):
+        for value in (space.reservations[agent, column], space.aspirations[agent, column]):
+            if issue.kind == "share" and agent != 0:
+                value = issue.high - value * others
+            points.append(value)
+    return np.clip(np.array(points, dtype=float), issue.low, issue.high)
+
+
+def _levels(space: NegotiationSpace, column: int, steps: int) -> np.ndarray:
+    if not space.weights[:, column].any():
+        # Nobody cares about this issue: any single value will do.
+        return np.array([space.issues[column].low])
+    issue = space.issues[column]
+    return np.unique(np.concatenate([_breakpoints(space, column), np.linspace(issue.low, issue.high, steps)]))
+
+
+def _blocks(space: NegotiationSpace, steps: int) -> list[tuple[list[int], np.ndarray]]:
+    """(columns, feasible value rows) per independent block of issues.
+
+    A budget-like group is one block: all but its last category are gridded
+    and the last one takes the remainder, keeping only rows inside its bounds.
+    """
+    grouped = {column for _total, columns in space.category_groups for column in columns}
+    blocks = [
+        ([column], _levels(space, column, steps)[:, np.newaxis])
+        for column in range(len(space.issues))
+        if column not in grouped
+    ]
+    for total, columns in space.category_groups:
+        free, last = columns[:-1], columns[-1]
+        rows = np.array(list(itertools.product(*(_levels(space, column, steps) for column in free))), dtype=float)
+        remainder = total - rows.sum(axis=1)
+        feasible = (remainder >= space.lows[last] - 1e-9) & (remainder <= space.highs[last] + 1e-9)
+        blocks.append((list(columns), np.column_stack([rows[feasible], remainder[feasible]])))
+    return blocks
+
+
+def offer_grid(space: NegotiationSpace, max_points: int = GRID_POINTS) -> np.ndarray:
+    """Feasible canonical offers over the negotiable ranges, shaped (P, n_issues).
+
+    Levels per issue are refined (breakpoints plus evenly spaced values) for
+    as long as the full grid stays within `max_points`.
+    """
+    best = _blocks(space, 2)
+    for steps in range(3, MAX_GRID_LEVELS + 1):
+        blocks = _blocks(space, steps)
+        if int(np.prod([len(rows) for _columns, rows in blocks], dtype=float)) > max_points:
+            break
+        best = blocks
+
+    sizes = [len(rows) for _columns, rows in best]
+    grid = np.empty((int(np.prod(sizes)), len(space.issues)))
+    # Mixed-radix indexing: block b varies every prod(sizes[b + 1:]) rows.
+    positions = np.arange(len(grid))
+    for index, (columns, rows) in enumerate(best):
+        stride = int(np.prod(sizes[index + 1:]))
+        grid[:, columns] = rows[(positions // stride) % sizes[index]]
+    return grid
+
+
+def pareto_mask(utilities: np.ndarray) -> np.ndarray:
+    """Rows of `utilities` (P, n_agents) not weakly dominated by another row."""
+    points, inverse = np.unique(np.round(utilities, 9), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    if points.shape[1] == 2:
+        # Two agents: sweep by the first utility, descending; a point survives
+        # only if it beats every point with a higher first utility on the second.
+        order = np.lexsort((-points[:, 1], -points[:, 0]))
+        second = points[order, 1]
+        best_before = np.concatenate([[-np.inf], np.maximum.accumulate(second)[:-1]])
+        keep = np.zeros(len(points), dtype=bool)
+        keep[order] = second > best_before
+    else:
+        keep = np.zeros(len(points), dtype=bool)
+        kept: list[int] = []
+        for index in np.argsort(-points.sum(axis=1), kind="stable"):
+            candidate = points[index]
+            if kept and np.any(np.all(points[kept] >= candidate, axis=1)):
+                continue
+            kept.append(index)
+            keep[index] = True
+    return keep[inverse]
+
+
+def analyze_bargaining(space: NegotiationSpace, max_points: int = GRID_POINTS) -> BargainingAnalysis:
+    grid = offer_grid(space, max_points)
+    utilities = space.utilities(grid)
+    acceptable = space.acceptable(grid).all(axis=-1)
+
+    frontier = pareto_mask(utilities)
+    # One offer per frontier utility vector is enough to describe it.
+    _unique, first = np.unique(np.round(utilities[frontier], 9), axis=0, return_index=True)
+    frontier_offers = grid[frontier][first]
+    frontier_utilities = utilities[frontier][first]
+    order = np.argsort(frontier_utilities[:, 0], kind="stable")
+
+    zopa_bounds = np.full((len(space.issues), 2), np.nan)
+    nash_offer = nash_utilities = None
+    if acceptable.any():
+        zopa = grid[acceptable]
+        zopa_bounds = np.column_stack([zopa.min(axis=0), zopa.max(axis=0)])
+        zopa_utilities = utilities[acceptable]
+        # Nash bargaining: maximize the product of gains over the disagreement point (0).
+        products = zopa_utilities.prod(axis=1)
+        best = int(np.argmax(products)) if products.max() > 0 else int(np.argmax(zopa_utilities.sum(axis=1)))
+        nash_offer, nash_utilities = zopa[best], zopa_utilities[best]
+
+    return BargainingAnalysis(
+        agent_names=space.agent_names,
+        grid_points=len(grid),
+        frontier_offers=frontier_offers[order],
+        frontier_utilities=frontier_utilities[order],
+        zopa_share=float(acceptable.mean()) if len(grid) else 0.0,
+        zopa_bounds=zopa_bounds,
+        nash_offer=nash_offer,
+        nash_utilities=nash_utilities,
+    )
+
+
+def frontier_distance(analysis: BargainingAnalysis, utilities: Any) -> np.ndarray:
+    """Shortfall of outcomes (..., n_agents) from the Pareto frontier.
+
+    The distance to the closest frontier point counting only the utility every
+    agent could still gain there: 0 when no frontier point dominates the
+    outcome, up to sqrt(n_agents) for an outcome worth nothing to anyone.
+    """
+    utilities = np.asarray(utilities, dtype=float)
+    shortfall = np.maximum(analysis.frontier_utilities - utilities[..., np.newaxis, :], 0.0)
+    return np.sqrt((shortfall**2).sum(axis=-1)).min(axis=-1)
+
+
+_ANALYSES: dict[str, BargainingAnalysis] = {}
+_ANALYSES_LOCK = Lock()
+
+
+def scenario_bargaining(scenario: dict[str, Any], content_hash: str) -> BargainingAnalysis:
+    """Bargaining analysis of a scenario, computed once per content hash for the process."""
+    with _ANALYSES_LOCK:
+        cached = _ANALYSES.get(content_hash)
+    if cached is not None:
+        return cached
+    analysis = analyze_bargaining(build_negotiation_space(scenario))
+    with _ANALYSES_LOCK:
+        return _ANALYSES.setdefault(content_hash, analysis)
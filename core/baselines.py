@@ -0,0 +1,289 @@
+import re
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from core.negotiation_space import NegotiationSpace, build_negotiation_space
+from core.proposals import ParsedProposal, ProposalParser, format_proposal
+
+
+# Concession exponent e of the time-dependent tactics: target(t) = 1 - t ** (1 / e).
+# e < 1 holds out until the deadline (Boulware), e > 1 concedes early (Conceder).
+TIME_DEPENDENT_EXPONENTS = {"boulware": 0.2, "conceder": 2.0}
+BASELINE_STRATEGIES = ("boulware", "conceder", "tit_for_tat", "hardliner")
+AUTHOR_TAG = re.compile(r"^\[([^\]\n]+)\]\s", re.MULTILINE)
+
+
+def target_utility(strategy: str, t: float, received_utilities: list[float]) -> float:
+    """Utility an agent still demands at normalized time t in [0, 1].
+
+    `received_utilities` are the agent's own utilities of the offers it has
+    received so far, oldest first.
+    """
+    if strategy == "hardliner":
+        return 1.0
+    if strategy == "tit_for_tat":
+        # Concede exactly as much (in own utility) as the opponent has conceded.
+        if len(received_utilities) < 2:
+            return 1.0
+        return float(np.clip(1.0 - (received_utilities[-1] - received_utilities[0]), 0.0, 1.0))
+    exponent = TIME_DEPENDENT_EXPONENTS.get(strategy, 1.0)
+    return 1.0 - min(max(t, 0.0), 1.0) ** (1.0 / exponent)
+
+
+@dataclass
+class BaselineMove:
+    action: str
+    own_values: list[float]
+
+
+class BaselineAgent:
+    """Rule-based stand-in for AgentRuntime: same `spec` and `reply()`.
+
+    Offers are computed on the scenario's negotiation space (see
+    core/negotiation_space.py) and written as the PROPOSAL block the LLM
+    agents are prompted to use, so both kinds of agents can share a table.
+    An acceptable offer is answered with AGREEMENT_REACHED, a turn past the
+    deadline with IMPASSE, the same markers NegotiationDirector.run() stops on.
+
+    Per-turn arithmetic uses plain floats over a handful of issues, which is
+    several times faster than NumPy calls on arrays this small.
+    """
+
+    def __init__(
+        self,
+        spec: Any,
+        scenario: dict[str, Any],
+        strategy: str,
+        space: NegotiationSpace | None = None,
+    ):
+        if strategy not in BASELINE_STRATEGIES:
+            raise ValueError(f"Unknown baseline strategy: {strategy}")
+        self.spec = spec
+        self.strategy = strategy
+        self.space = space or build_negotiation_space(scenario)
+        index = self.space.agent_index(spec.id)
+        if index is None:
+            raise ValueError(f"Agent {spec.id} is not part of the scenario.")
+        self.index = index
+        rules = scenario.get("negotiation_rules", {})
+        max_rounds = rules.get("max_rounds", 10) if isinstance(rules, dict) else 10
+        self.deadline = max_rounds if isinstance(max_rounds, int) and max_rounds > 0 else 10
+        self._parser: ProposalParser | None = None
+
+        space = self.space
+        total_weight = float(space.weights[index].sum()) or 1.0
+        self._reservations = space.reservations[index].tolist()
+        self._aspirations = space.aspirations[index].tolist()
+        self._terms = [
+            (
+                reservation,
+                1.0 / (aspiration - reservation) if aspiration != reservation else 0.0,
+                aspiration == reservation,
+                direction,
+                weight / total_weight,
+            )
+            for reservation, aspiration, direction, weight in zip(
+                self._reservations,
+                self._aspirations,
+                space.directions[index].tolist(),
+                space.weights[index].tolist(),
+            )
+        ]
+        self._indifferent = [weight == 0 for weight in space.weights[index].tolist()]
+        self._bounds = list(zip(space.lows.tolist(), space.highs.tolist()))
+        self._steps = [100.0 if high - low >= 10000 else 1.0 for low, high in self._bounds]
+        self.reset()
+
+    def reset(self) -> None:
+        self.turn = 0
+        self.received_utilities: list[float] = []
+        self.last_move: BaselineMove | None = None
+
+    @property
+    def parser(self) -> ProposalParser:
+        if self._parser is None:
+            self._parser = ProposalParser(self.space)
+        return self._parser
+
+    def utility(self, own: list[float]) -> float:
+        """Same value as NegotiationSpace.own_utility; missing (NaN) terms score 0."""
+        total = 0.0
+        for value, (reservation, scale, flat, direction, weight) in zip(own, self._terms):
+            if weight == 0 or value != value:
+                continue
+            gap = value - reservation
+            if flat:
+                total += weight if direction * gap >= 0 else 0.0
+            else:
+                total += weight * min(max(gap * scale, 0.0), 1.0)
+        return total
+
+    def acceptable(self, own: list[float]) -> bool:
+        # NaN compares False, so an offer silent on a term we care about is not acceptable.
+        return all(
+            weight == 0 or direction * (value - reservation) >= -1e-9
+            for value, (reservation, _scale, _flat, direction, weight) in zip(own, self._terms)
+        )
+
+    def respond(self, offer: list[float] | None) -> BaselineMove:
+        """Answer an offer given in this agent's own frame (None on the opening turn)."""
+        t = self.turn / max(self.deadline - 1, 1)
+        self.turn += 1
+        if offer is not None:
+            self.received_utilities.append(self.utility(offer))
+        target = target_utility(self.strategy, t, self.received_utilities)
+
+        # AC_next: accept when the offer is worth at least what we would ask for next.
+        if offer is not None and self.acceptable(offer) and self.received_utilities[-1] >= target - 1e-9:
+            move = BaselineMove("accept", list(offer))
+        elif t > 1.0:
+            # Past the deadline there is nothing left to concede.
+            move = BaselineMove("impasse", self._proposal(target, offer))
+        else:
+            move = BaselineMove("offer", self._proposal(target, offer))
+        self.last_move = move
+        return move
+
+    def _proposal(self, target: float, offer: list[float] | None) -> list[float]:
+        own = [
+            reservation + target * (aspiration - reservation)
+            for reservation, aspiration in zip(self._reservations, self._aspirations)
+        ]
+        # Terms this agent has no goal on follow the counterpart's last offer.
+        if offer is not None:
+            own = [
+                offered if indifferent and offered == offered else value
+                for value, offered, indifferent in zip(own, offer, self._indifferent)
+            ]
+        for total, columns in self.space.category_groups:
+            ordered = sorted(columns, key=lambda column: not self._indifferent[column])
+            for column in ordered:
+                slack = total - sum(own[c] for c in columns)
+                if abs(slack) < 1e-9:
+                    break
+                low, high = self._bounds[column]
+                own[column] = min(max(own[column] + slack, low), high)
+        return [round(value / step) * step for value, step in zip(own, self._steps)]
+
+    def reply(self, message: str) -> str:
+        author_index, parsed = self._read_offer(message)
+        offer = None
+        if parsed.values:
+            offer = self.space.from_author(parsed.values, author_index, self.index).tolist()
+        move = self.respond(offer)
+        choices = self.space.preferred_options[self.index]
+        if move.action == "accept":
+            choices = self._accepted_choices(parsed.choices, choices)
+        proposal = format_proposal(self.space, move.own_values, choices)
+        if move.action == "accept":
+            return f"I accept these terms.\n\n{proposal}\n\nAGREEMENT_REACHED"
+        if move.action == "impasse":
+            return f"This is my final position; I cannot go further.\n\n{proposal}\n\nIMPASSE"
+        return f"Here is my offer.\n\n{proposal}"
+
+    def _accepted_choices(self, offered: dict[str, Any], own: dict[str, Any]) -> dict[str, Any]:
+        # Restate the accepted categorical terms from our side of the table.
+        accepted = dict(own)
+        for issue in self.space.categorical_issues:
+            if issue.key not in offered:
+                continue
+            if issue.kind == "areas":
+                accepted[issue.key] = tuple(area for area in issue.options if area not in offered[issue.key])
+            else:
+                accepted[issue.key] = offered[issue.key]
+        return accepted
+
+    def _read_offer(self, message: str) -> tuple[int, ParsedProposal]:
+        # Simultaneous rounds relay "[Name] ..." segments: read the latest one by someone else.
+        segments = []
+        tags = list(AUTHOR_TAG.finditer(message))
+        for position, tag in enumerate(tags):
+            end = tags[position + 1].start() if position + 1 < len(tags) else len(message)
+            author = self.space.agent_index(tag.group(1).strip())
+            if author is not None and author != self.index:
+                segments.append((author, message[tag.end():end]))
+        if not segments:
+            # A plain relayed message comes from the previous speaker.
+            segments = [((self.index - 1) % max(len(self.space.agent_ids), 1), message)]
+        for author, text in reversed(segments):
+            parsed = self.parser.parse(text)
+            if parsed.values:
+                return author, parsed
+        return segments[-1][0], ParsedProposal()
+
+
+@dataclass
+class BaselineOutcome:
+    agreement: bool
+    rounds: int
+    offer: np.ndarray
+    utilities: np.ndarray
+
+
+def run_baseline_negotiation(
+    space: NegotiationSpace,
+    strategies: dict[str, str],
+    max_rounds: int = 10,
+) -> BaselineOutcome:
+    """Negotiate locally between baseline agents, exchanging offer vectors directly.
+
+    No text, LLM or judge is involved, so thousands of runs take about a
+    second. Agents speak in scenario order once per round; an offer stands
+    until every other agent has accepted it in turn.
+    """
+    scenario = {"negotiation_rules": {"max_rounds": max_rounds}}
+    agents = [
+        BaselineAgent(_BaselineSpec(id=agent_id, name=name), scenario, strategies.get(agent_id, "boulware"), space=space)
+        for agent_id, name in zip(space.agent_ids, space.agent_names)
+    ]
+    convert = _frame_converter(space)
+
+    standing: tuple[int, list[float]] | None = None
+    acceptances = 0
+    for round_index in range(max_rounds):
+        for agent in agents:
+            offer = convert(standing[1], standing[0], agent.index) if standing is not None else None
+            move = agent.respond(offer)
+            if move.action == "accept":
+                acceptances += 1
+                if acceptances >= len(agents) - 1:
+                    return _outcome(space, True, round_index + 1, standing)
+            elif move.action == "impasse":
+                return _outcome(space, False, round_index + 1, (agent.index, move.own_values))
+            else:
+                standing, acceptances = (agent.index, move.own_values), 0
+    return _outcome(space, False, max_rounds, standing)
+
+
+def _frame_converter(space: NegotiationSpace):
+    # Scalar version of NegotiationSpace.to_canonical (and back via own_values) for the per-turn loop.
+    share_columns = [column for column, issue in enumerate(space.issues) if issue.kind == "share"]
+    highs = space.highs.tolist()
+    others = max(len(space.agent_ids) - 1, 1)
+
+    def convert(own: list[float], from_index: int, to_index: int) -> list[float]:
+        if from_index == to_index or not share_columns:
+            return own
+        converted = list(own)
+        for column in share_columns:
+            first = own[column] if from_index == 0 else highs[column] - own[column] * others
+            converted[column] = first if to_index == 0 else (highs[column] - first) / others
+        return converted
+
+    return convert
+
+
+def _outcome(space: NegotiationSpace, agreement: bool, rounds: int, standing) -> BaselineOutcome:
+    if standing is None:
+        offer = np.full(len(space.issues), np.nan)
+    else:
+        offer = space.to_canonical(np.array(standing[1], dtype=float), standing[0])
+    return BaselineOutcome(agreement, rounds, offer, space.utilities(offer))
+
+
+@dataclass
+class _BaselineSpec:
+    id: str
+    name: str
@@ -0,0 +1,290 @@
+import itertools
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from core.director import NegotiationDirector
+from core.experiments import ExperimentCell
+from core.judging import STATUS_JUDGE_MAX_TOKENS
+
+
+# Approximate list prices in USD per million (input, output) tokens.
+MODEL_PRICING = {
+    "claude-opus-4-6": (5.0, 25.0),
+    "claude-sonnet-4-5-20250929": (3.0, 15.0),
+    "claude-haiku-4-5-20251001": (1.0, 5.0),
+}
+# Typical (seconds to first token, output tokens per second).
+MODEL_SPEED = {
+    "claude-opus-4-6": (2.0, 40.0),
+    "claude-sonnet-4-5-20250929": (1.2, 60.0),
+    "claude-haiku-4-5-20251001": (0.6, 120.0),
+}
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+CHARS_PER_TOKEN = 4
+# Used until past runs give a measured message length.
+DEFAULT_MESSAGE_TOKENS = 200
+ROUND_JUDGE_OUTPUT_TOKENS = 40
+METRIC_OUTPUT_TOKENS = 25
+FINAL_JUDGE_OUTPUT_TOKENS = 500
+STATUS_JUDGE_OUTPUT_TOKENS = 12
+DEFAULT_ESCALATION_RATE = 0.5
+# Cells estimated per vectorized batch when filtering a design stream.
+ESTIMATE_CHUNK = 2_000
+ESTIMATE_COLUMNS = ["input_tokens", "output_tokens", "cost_usd", "run_cost_usd", "run_seconds", "wall_seconds"]
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class ScenarioProfile:
+    """Prompt sizes of one scenario, in tokens, plus what past runs measured.
+
+    Judge prompt sizes are for an empty dialogue; the estimator adds the
+    transcript, which grows by one message per agent and round.
+    `judge_seconds` is the median wall time of a round judgement in past
+    runs, None when nothing was recorded.
+    """
+
+    agents: int
+    agent_system_tokens: dict[str, int]
+    round_judge_tokens: int
+    status_judge_tokens: int
+    final_judge_tokens: int
+    metrics: int
+    message_tokens: float = DEFAULT_MESSAGE_TOKENS
+    judge_seconds: float | None = None
+    escalation_rate: float | None = None
+
+
+def scenario_profile(scenario: dict[str, Any], history: dict[str, float | None] | None = None) -> ScenarioProfile:
+    """Profile a scenario by rendering its prompts; `history` is load_call_history() output."""
+    history = history or {}
+    # No model is called: agents build their chains on the first turn only.
+    director = NegotiationDirector({**scenario, "negotiation_rules": {}}, llm_factory=None)
+    metrics = scenario.get("metrics", {})
+    metrics_json = json.dumps(metrics, ensure_ascii=True)
+    round_prompt = director._build_round_judge_prompt(
+        metrics_json, *director._build_round_judge_schema_and_rules(metrics, False)
+    )
+    final_prompt = director._build_final_judge_prompt(
+        metrics_json, *director._build_final_judge_schema_and_rules(metrics)
+    )
+    message_chars = history.get("message_chars")
+    judge_latency_ms = history.get("judge_latency_ms")
+    return ScenarioProfile(
+        agents=len(director.agents),
+        agent_system_tokens={agent.spec.id: estimate_tokens(agent.system_prompt) for agent in director.agents},
+        round_judge_tokens=estimate_tokens(round_prompt),
+        status_judge_tokens=estimate_tokens(director._build_status_judge_prompt()),
+        final_judge_tokens=estimate_tokens(final_prompt),
+        metrics=len(metrics),
+        message_tokens=message_chars / CHARS_PER_TOKEN if message_chars else DEFAULT_MESSAGE_TOKENS,
+        judge_seconds=judge_latency_ms / 1000.0 if judge_latency_ms else None,
+        escalation_rate=history.get("escalation_rate"),
+    )
+
+
+def _model(rules: dict[str, Any], key: str, default: str) -> str:
+    return str(rules.get(key, "") or "").strip() or default
+
+
+def _price(model: str) -> tuple[float, float]:
+    return MODEL_PRICING.get(model, MODEL_PRICING[DEFAULT_MODEL])
+
+
+def _call_seconds(model: str, output_tokens: float) -> float:
+    first_token, tokens_per_second = MODEL_SPEED.get(model, MODEL_SPEED[DEFAULT_MODEL])
+    return first_token + output_tokens / tokens_per_second
+
+
+def run_config(
+    profile: ScenarioProfile,
+    rules: dict[str, Any],
+    done_rounds: int = 0,
+    runs: int = 1,
+    parallel: int = 1,
+) -> dict[str, float]:
+    """Numeric row describing `runs` runs of a scenario under `rules`, for estimate_runs.
+
+    Model names are resolved to prices and call times here, so the
+    estimate itself is plain array arithmetic over many rows.
+    """
+    agents_model = _model(rules, "agents_model", DEFAULT_MODEL)
+    judge_model = _model(rules, "judge_model", DEFAULT_MODEL)
+    final_model = _model(rules, "final_judge_model", judge_model)
+    baselines = rules.get("baseline_agents") if isinstance(rules.get("baseline_agents"), dict) else {}
+    llm_system_tokens = [tokens for agent_id, tokens in profile.agent_system_tokens.items() if agent_id not in baselines]
+
+    size = rules.get("judge_ensemble_size", 1)
+    size = size if isinstance(size, int) and size > 1 else 1
+    ensemble_models = [str(model).strip() for model in rules.get("judge_ensemble_models", []) if str(model).strip()]
+    judge_models = [(ensemble_models or [judge_model])[index % len(ensemble_models or [judge_model])] for index in range(size)]
+    judge_output = ROUND_JUDGE_OUTPUT_TOKENS + METRIC_OUTPUT_TOKENS * profile.metrics
+    # An ensemble waits for its slowest judge.
+    judge_seconds = profile.judge_seconds or max(_call_seconds(model, judge_output) for model in judge_models)
+    cascade_model = str(rules.get("judge_cascade_model", "") or "").strip()
+    annotate_every = rules.get("judge_annotate_every", 1)
+
+    return {
+        "max_rounds": int(rules.get("max_rounds", 10)),
+        "done_rounds": done_rounds,
+        "agents": profile.agents,
+        "llm_agents": len(llm_system_tokens),
+        "simultaneous": str(rules.get("turn_protocol", "sequential")) == "simultaneous",
+        "message_tokens": profile.message_tokens,
+        "agent_system_tokens": float(np.mean(llm_system_tokens)) if llm_system_tokens else 0.0,
+        "agent_input_price": _price(agents_model)[0],
+        "agent_output_price": _price(agents_model)[1],
+        "agent_seconds": _call_seconds(agents_model, profile.message_tokens),
+        "round_judge_tokens": profile.round_judge_tokens,
+        "judge_output_tokens": judge_output,
+        "judges": size,
+        "judge_input_price": float(np.mean([_price(model)[0] for model in judge_models])),
+        "judge_output_price": float(np.mean([_price(model)[1] for model in judge_models])),
+        "judge_seconds": judge_seconds,
+        "cascade": bool(cascade_model),
+        "escalation_rate": profile.escalation_rate if profile.escalation_rate is not None else DEFAULT_ESCALATION_RATE,
+        "cheap_input_price": _price(cascade_model or judge_model)[0],
+        "cheap_output_price": _price(cascade_model or judge_model)[1],
+        "cheap_seconds": _call_seconds(cascade_model or judge_model, judge_output),
+        "annotate_every": annotate_every if isinstance(annotate_every, int) and annotate_every > 1 else 1,
+        "status_judge_tokens": profile.status_judge_tokens,
+        "status_input_price": _price(judge_model)[0],
+        "status_output_price": _price(judge_model)[1],
+        "status_seconds": _call_seconds(judge_model, min(STATUS_JUDGE_OUTPUT_TOKENS, STATUS_JUDGE_MAX_TOKENS)),
+        "final_judge_tokens": profile.final_judge_tokens,
+        "final_input_price": _price(final_model)[0],
+        "final_output_price": _price(final_model)[1],
+        "final_seconds": _call_seconds(final_model, FINAL_JUDGE_OUTPUT_TOKENS),
+        "runs": runs,
+        "parallel": max(parallel, 1),
+    }
+
+
+def _round_sums(first: np.ndarray, last: np.ndarray, every: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(count, sum of round numbers) of the judged rounds in (first, last].
+
+    Judged rounds are the multiples of `every` plus the last round.
+    """
+    k_last, k_first = last // every, first // every
+    extra = (last % every != 0) & (last > first)
+    count = k_last - k_first + extra
+    total = every * (k_last * (k_last + 1) - k_first * (k_first + 1)) / 2 + np.where(extra, last, 0)
+    return count, total
+
+
+def estimate_runs(configs: pd.DataFrame) -> pd.DataFrame:
+    """Projected tokens, dollars and wall time for rows built by run_config.
+
+    Rounds run from `done_rounds` to `max_rounds` (an upper bound: runs
+    often end earlier) and the final judge closes each run. Agents see
+    their system prompt and the previous message (the whole previous round
+    when simultaneous); judges see the transcript so far, `message_tokens`
+    per message. Cascades pay the screening call every judged round and
+    the configured judges on `escalation_rate` of them; two-tier judges
+    pay a status call every round. Vectorized: every column is an array.
+    """
+    c = {column: configs[column].to_numpy() for column in configs.columns}
+    last, first = c["max_rounds"].astype(float), np.minimum(c["done_rounds"], c["max_rounds"]).astype(float)
+    rounds = last - first
+    transcript_per_round = c["agents"] * c["message_tokens"]
+    # Sum of transcript sizes over the remaining rounds, and over the judged ones.
+    transcript_sum = transcript_per_round * (last * (last + 1) - first * (first + 1)) / 2
+    judged, judged_round_sum = _round_sums(first, last, c["annotate_every"].astype(float))
+    judged_transcript = transcript_per_round * judged_round_sum
+
+    agent_calls = rounds * c["llm_agents"]
+    agent_input = agent_calls * (
+        c["agent_system_tokens"] + c["message_tokens"] * np.where(c["simultaneous"], c["agents"], 1)
+    )
+    agent_output = agent_calls * c["message_tokens"]
+
+    judge_input_once = judged * c["round_judge_tokens"] + judged_transcript
+    judge_output_once = judged * c["judge_output_tokens"]
+    judge_share = np.where(c["cascade"], c["escalation_rate"], 1.0) * c["judges"]
+    cheap_share = c["cascade"].astype(float)
+    two_tier = c["annotate_every"] > 1
+    status_input = np.where(two_tier, rounds * c["status_judge_tokens"] + transcript_sum, 0.0)
+    status_output = np.where(two_tier, rounds * STATUS_JUDGE_OUTPUT_TOKENS, 0.0)
+    final_input = c["final_judge_tokens"] + transcript_per_round * last
+
+    input_tokens = agent_input + (judge_share + cheap_share) * judge_input_once + status_input + final_input
+    output_tokens = agent_output + (judge_share + cheap_share) * judge_output_once + status_output + FINAL_JUDGE_OUTPUT_TOKENS
+    cost = (
+        agent_input * c["agent_input_price"]
+        + agent_output * c["agent_output_price"]
+        + judge_share * (judge_input_once * c["judge_input_price"] + judge_output_once * c["judge_output_price"])
+        + cheap_share * (judge_input_once * c["cheap_input_price"] + judge_output_once * c["cheap_output_price"])
+        + status_input * c["status_input_price"]
+        + status_output * c["status_output_price"]
+        + final_input * c["final_input_price"]
+        + FINAL_JUDGE_OUTPUT_TOKENS * c["final_output_price"]
+    ) / 1e6
+
+    agent_round_seconds = np.where(c["simultaneous"], np.minimum(c["llm_agents"], 1), c["llm_agents"]) * c["agent_seconds"]
+    judged_seconds = np.where(
+        c["cascade"], c["cheap_seconds"] + c["escalation_rate"] * c["judge_seconds"], c["judge_seconds"]
+    )
+    # Two-tier checkpoints run the status call alongside the annotation.
+    run_seconds = (
+        rounds * agent_round_seconds
+        + judged * np.where(two_tier, np.maximum(judged_seconds, c["status_seconds"]), judged_seconds)
+        + np.where(two_tier, (rounds - judged) * c["status_seconds"], 0.0)
+        + c["final_seconds"]
+    )
+    runs = c["runs"]
+    return pd.DataFrame(
+        {
+            "input_tokens": input_tokens * runs,
+            "output_tokens": output_tokens * runs,
+            "cost_usd": cost * runs,
+            "run_cost_usd": cost,
+            "run_seconds": run_seconds,
+            "wall_seconds": np.ceil(runs / c["parallel"]) * run_seconds,
+        },
+        index=configs.index,
+    )
+
+
+def estimate_cells(
+    cells: Iterable[ExperimentCell],
+    profile_for: Callable[[str], ScenarioProfile],
+) -> pd.DataFrame:
+    """Per-run estimate of every cell (one row each, indexed by cell id)."""
+    cells = list(cells)
+    configs = pd.DataFrame(
+        [run_config(profile_for(cell.scenario_file), cell.rules) for cell in cells],
+        index=pd.Index([cell.cell_id for cell in cells], name="cell_id"),
+    )
+    return estimate_runs(configs) if len(configs) else pd.DataFrame(columns=ESTIMATE_COLUMNS)
+
+
+def within_budget(
+    cells: Iterable[ExperimentCell],
+    profile_for: Callable[[str], ScenarioProfile],
+    max_run_cost: float,
+    chunk: int = ESTIMATE_CHUNK,
+) -> Iterator[ExperimentCell]:
+    """Cells whose projected cost per run is at most `max_run_cost`, still lazily.
+
+    The stream is estimated `chunk` cells at a time.
+    """
+    iterator = iter(cells)
+    while batch := list(itertools.islice(iterator, chunk)):
+        affordable = estimate_cells(batch, profile_for)["run_cost_usd"].to_numpy() <= max_run_cost
+        yield from (cell for cell, keep in zip(batch, affordable) if keep)
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 90:
+        return f"{seconds:.0f} s"
+    if seconds < 90 * 60:
+        return f"{seconds / 60:.0f} min"
+    return f"{seconds / 3600:.1f} h"
@@ -1,12 +1,23 @@
+import copy
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import re
 
-from langchain_core.prompts import ChatPromptTemplate
-
+from core.schedulers import TURN_ORDERS, SpeakerChooser, TurnScheduler, build_scheduler
 from utils import build_system_prompt
 
+if TYPE_CHECKING:
+    from core.baselines import BaselineAgent
+    from core.negotiation_space import NegotiationSpace
+    from core.proposals import ProposalParser
+
+
+TURN_PROTOCOLS = {"sequential", "simultaneous"}
+# Upper bound on concurrent agent calls in a simultaneous round.
+MAX_CONCURRENT_AGENT_CALLS = 20
+OPENING_MESSAGE = "Let's begin the negotiation. Present your first proposal."
 
 @dataclass
 class AgentSpec:
@@ -24,11 +35,11 @@ class AgentSpec:
 class AgentRuntime:
     """Wrapper runtime: lega specifica agente + chain LLM pronta all'uso."""
 
-    def __init__(self, spec: AgentSpec, scenario_context: dict[str, Any], llm: Any):
+    def __init__(self, spec: AgentSpec, scenario_context: dict[str, Any], llm_factory):
         self.spec = spec
 
         # Il prompt di sistema viene generato partendo direttamente dalla struttura JSON.
-        system_prompt = build_system_prompt(
+        self.system_prompt = build_system_prompt(
             agent_config={
                 "name": spec.name,
                 "role": spec.role,
@@ -40,16 +51,26 @@ class AgentRuntime:
             },
             scenario_context=scenario_context,
         )
-
-        # Template minimale: system fisso + input umano variabile ad ogni turno.
-        # Keep system prompt as a literal value so braces in scenario data
-        # (e.g. dict-like text) are not interpreted as template variables.
-        self.chain = ChatPromptTemplate.from_messages(
-            [
-                ("system", "{system_prompt}"),
-                ("human", "{message}"),
-            ]
-        ).partial(system_prompt=system_prompt) | llm
+        self._llm_factory = llm_factory
+        self._chain = None
+
+    @property
+    def chain(self):
+        # Model and LangChain are loaded on the first turn, not when the
+        # director is built, so pages that only construct it stay fast.
+        if self._chain is None:
+            from langchain_core.prompts import ChatPromptTemplate
+
+            # Template minimale: system fisso + input umano variabile ad ogni turno.
+            # Keep system prompt as a literal value so braces in scenario data
+            # (e.g. dict-like text) are not interpreted as template variables.
+            self._chain = ChatPromptTemplate.from_messages(
+                [
+                    ("system", "{system_prompt}"),
+                    ("human", "{message}"),
+                ]
+            ).partial(system_prompt=self.system_prompt) | self._llm_factory(self.spec)
+        return self._chain
 
     def reply(self, message: str) -> str:
         # Esegue un singolo turno dell'agente e normalizza il testo di output.
@@ -60,13 +81,20 @@ class AgentRuntime:
 class NegotiationDirector:
     """Regista della simulazione: inizializza agenti, gestisce turni e storico."""
 
-    def __init__(self, scenario: dict[str, Any], llm_factory):
+    def __init__(self, scenario: dict[str, Any], llm_factory, moderator_llm_factory=None):
         self.scenario = scenario
         self.round = 0
-        self.history: list[dict[str, str]] = []
+        self.history: list[dict[str, Any]] = []
         self.latest_agreement_status = "ongoing"
         self.is_terminated = False
         self.termination_reason: str | None = None
+        self.last_evaluation: dict[str, Any] = {}
+        # Latest evaluation with metrics: two-tier judging leaves most rounds status-only.
+        self.last_annotated_evaluation: dict[str, Any] = {}
+        # Distanza tra le ultime offerte strutturate, una voce per round.
+        self.offer_convergence: list[dict[str, Any]] = []
+        self._negotiation_space: "NegotiationSpace | None" = None
+        self._proposal_parser: "ProposalParser | None" = None
 
         # Numero massimo turni e mode governati dalle negotiation rules.
         rules = scenario.get("negotiation_rules", {})
@@ -83,9 +111,32 @@ class NegotiationDirector:
         self.require_unanimous_agreement = bool(
             self._rule_value(rules, "require_unanimous_agreement", True)
         )
+        raw_protocol = self._rule_value(rules, "turn_protocol", "sequential")
+        self.turn_protocol = str(raw_protocol).strip().lower()
+        if self.turn_protocol not in TURN_PROTOCOLS:
+            self.turn_protocol = "sequential"
+        self.last_round_messages: list[dict[str, Any]] = []
+
+        # Chi parla in ogni round: scheduler scelto dalle negotiation rules.
+        raw_turn_order = self._rule_value(rules, "turn_order", "round_robin")
+        self.turn_order = str(raw_turn_order).strip().lower()
+        if self.turn_order not in TURN_ORDERS:
+            self.turn_order = "round_robin"
+        raw_seed = self._rule_value(rules, "turn_order_seed", 0)
+        self.turn_order_seed = raw_seed if isinstance(raw_seed, int) else 0
+        self.moderator_llm_factory = moderator_llm_factory
+        self.scheduler = self._build_scheduler()
+
+        # Agenti rule-based (agent id -> strategia) al posto del modello LLM.
+        raw_baselines = self._rule_value(rules, "baseline_agents", {})
+        self.baseline_agents = (
+            {str(agent_id): str(strategy) for agent_id, strategy in raw_baselines.items()}
+            if isinstance(raw_baselines, dict)
+            else {}
+        )
 
         # Crea i runtime agenti in base all'array `agents` dello scenario.
-        self.agents: list[AgentRuntime] = []
+        self.agents: list["AgentRuntime | BaselineAgent"] = []
         for raw_agent in scenario.get("agents", []):
             spec = AgentSpec(
                 id=raw_agent["id"],
@@ -97,14 +148,33 @@ class NegotiationDirector:
                 constraints=raw_agent.get("constraints", []),
                 private_goals=raw_agent.get("private_goals", {}),
             )
+            strategy = self.baseline_agents.get(spec.id)
+            if strategy:
+                # NumPy and the negotiation space load only when a baseline sits at the table.
+                from core.baselines import BaselineAgent
+
+                self.agents.append(BaselineAgent(spec, scenario, strategy, space=self.negotiation_space))
+                continue
             self.agents.append(
                 AgentRuntime(
                     spec=spec,
                     scenario_context=scenario,
-                    llm=llm_factory(spec),
+                    llm_factory=llm_factory,
                 )
             )
 
+    def _build_scheduler(self) -> TurnScheduler:
+        # The moderator chooser reads this director's transcript, so each director needs its own.
+        return build_scheduler(
+            self.turn_order,
+            seed=self.turn_order_seed,
+            choose_speaker=(
+                self._llm_speaker_chooser(self.moderator_llm_factory)
+                if self.moderator_llm_factory is not None
+                else None
+            ),
+        )
+
     def reset(self) -> None:
         # Ripristina stato dialogo senza ricostruire gli agenti.
         self.round = 0
@@ -112,30 +182,160 @@ class NegotiationDirector:
         self.latest_agreement_status = "ongoing"
         self.is_terminated = False
         self.termination_reason = None
+        self.last_round_messages = []
+        self.last_evaluation = {}
+        self.last_annotated_evaluation = {}
+        self.offer_convergence = []
+        for agent in self.agents:
+            if not isinstance(agent, AgentRuntime):
+                agent.reset()
 
-    def step(self, input_message: str) -> list[dict[str, str]]:
+    def fork(self, at_round: int | None = None, evaluation: dict[str, Any] | None = None) -> "NegotiationDirector":
+        """
+        Independent copy of the run as it stood after `at_round` (default: the current round).
+        History events up to that round are shared with this director, not
+        copied; the fork only appends its own. LLM agents are stateless and
+        shared too, baseline agents are copied and replayed over the prefix.
+        `evaluation` is the round judge output of `at_round` (the last
+        registered one when forking at the current round).
+        """
+        at_round = self.round if at_round is None else at_round
+        if not 0 <= at_round <= self.round:
+            raise ValueError(f"Cannot fork at round {at_round}: the run has {self.round} rounds.")
+        if evaluation is None and at_round == self.round:
+            evaluation = self.last_evaluation
+
+        forked = copy.copy(self)
+        forked.round = at_round
+        forked.history = [event for event in self.history if event["round"] <= at_round]
+        forked.last_round_messages = [event for event in forked.history if event["round"] == at_round]
+        forked.offer_convergence = [entry for entry in self.offer_convergence if entry["round"] <= at_round]
+        forked.latest_agreement_status = "ongoing"
+        forked.is_terminated = False
+        forked.termination_reason = None
+        forked.last_evaluation = {}
+        forked.last_annotated_evaluation = {}
+        forked.scheduler = forked._build_scheduler()
+        forked.agents = [
+            agent if isinstance(agent, AgentRuntime) else forked._replayed_agent(agent)
+            for agent in self.agents
+        ]
+        if evaluation and at_round > 0:
+            forked.register_evaluation(evaluation)
+        return forked
+
+    def _replayed_agent(self, agent: "BaselineAgent") -> "BaselineAgent":
+        # Rule-based agents are deterministic: feeding them the inputs they saw rebuilds their state.
+        replayed = copy.copy(agent)
+        replayed.reset()
+        for index, event in enumerate(self.history):
+            if event["agent"] != agent.spec.name:
+                continue
+            if self.turn_protocol == "simultaneous":
+                message = "\n\n".join(
+                    f"[{previous['agent']}] {previous['content']}"
+                    for previous in self.history
+                    if previous["round"] == event["round"] - 1
+                )
+            else:
+                message = self.history[index - 1]["content"] if index > 0 else ""
+            replayed.reply(message)
+        return replayed
+
+    @property
+    def negotiation_space(self) -> "NegotiationSpace":
+        # NumPy and the negotiation space load on first use, not with the director.
+        if self._negotiation_space is None:
+            from core.negotiation_space import build_negotiation_space
+
+            self._negotiation_space = build_negotiation_space(self.scenario)
+        return self._negotiation_space
+
+    @property
+    def proposal_parser(self) -> "ProposalParser":
+        if self._proposal_parser is None:
+            from core.proposals import ProposalParser
+
+            self._proposal_parser = ProposalParser(self.negotiation_space)
+        return self._proposal_parser
+
+    def _event(self, agent_name: str, output: str) -> dict[str, Any]:
+        # Ogni evento porta anche il round e l'offerta strutturata letta dal blocco PROPOSAL (None se assente).
+        return {
+            "agent": agent_name,
+            "content": output,
+            "round": self.round + 1,
+            "offer": self.proposal_parser.extract(output),
+        }
+
+    def step(self, input_message: str) -> list[dict[str, Any]]:
         """
         Esegue un round completo:
-        - ogni agente parla una volta in sequenza
-        - l'output di un agente diventa input del successivo
+        - sequential: ogni agente parla una volta in sequenza e l'output di
+          un agente diventa input del successivo
+        - simultaneous: tutti gli agenti rispondono in parallelo allo stesso
+          stato del round
         """
         if not self.agents or not self.can_advance():
             return []
 
-        turn_messages: list[dict[str, str]] = []
+        if self.turn_protocol == "simultaneous":
+            turn_messages = self._simultaneous_turn(input_message)
+        else:
+            turn_messages = self._sequential_turn(input_message)
+
+        self.last_round_messages = turn_messages
+        self.round += 1
+        from core.proposals import offer_convergence
+
+        self.offer_convergence.append(
+            {"round": self.round, **offer_convergence(self.negotiation_space, self.history)}
+        )
+        return turn_messages
+
+    def _sequential_turn(self, input_message: str) -> list[dict[str, Any]]:
+        turn_messages: list[dict[str, Any]] = []
         current_message = input_message
 
-        for agent in self.agents:
+        # The scheduler generator resumes after each reply, so it sees the updated history.
+        for agent in self.scheduler.turns(self.agents, self.history, self.round):
             output = agent.reply(current_message)
-            event = {"agent": agent.spec.name, "content": output}
+            event = self._event(agent.spec.name, output)
             self.history.append(event)
             turn_messages.append(event)
             current_message = output
+        return turn_messages
 
-        self.round += 1
+    def _simultaneous_turn(self, input_message: str) -> list[dict[str, Any]]:
+        speakers = list(self.scheduler.turns(self.agents, self.history, self.round))
+        if not speakers:
+            return []
+        shared_message = self._shared_round_message(input_message)
+        max_workers = min(len(speakers), MAX_CONCURRENT_AGENT_CALLS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent-turn") as executor:
+            outputs = list(executor.map(lambda agent: agent.reply(shared_message), speakers))
+
+        # Merge in scheduled order, whatever order the calls completed in; a
+        # failed call raises before anything is appended to the history.
+        turn_messages = [self._event(agent.spec.name, output) for agent, output in zip(speakers, outputs)]
+        self.history.extend(turn_messages)
         return turn_messages
 
-    def run(self, opening_message: str) -> list[dict[str, str]]:
+    def _shared_round_message(self, input_message: str) -> str:
+        if not self.last_round_messages:
+            return (
+                f"{input_message}\n\n"
+                "All parties submit their offers simultaneously this round."
+            )
+        offers = "\n\n".join(
+            f"[{event['agent']}] {event['content']}" for event in self.last_round_messages
+        )
+        return (
+            f"Offers submitted by all parties in round {self.round}:\n\n{offers}\n\n"
+            "All parties now submit their next offers simultaneously. Respond with your own offer."
+        )
+
+    def run(self, opening_message: str) -> list[dict[str, Any]]:
         # Loop multi-round con stop su max_rounds o marker semantici nel testo.
         message = opening_message
         while self.can_advance():
@@ -158,6 +358,9 @@ class NegotiationDirector:
         return True
 
     def register_evaluation(self, evaluation: dict[str, Any]) -> None:
+        self.last_evaluation = evaluation
+        if evaluation.get("annotation") != "status_only":
+            self.last_annotated_evaluation = evaluation
         status = self._extract_agreement_status(evaluation)
         if status is not None:
             self.latest_agreement_status = status
@@ -209,7 +412,33 @@ class NegotiationDirector:
             return normalized_from_raw
         return None
 
-    def get_history(self) -> list[dict[str, str]]:
+    def _llm_speaker_chooser(self, moderator_llm_factory) -> SpeakerChooser:
+        # The moderator model is created on its first pick, like agent models.
+        moderator_llm = None
+
+        def choose_speaker(candidates: list[Any], history: list[dict[str, str]]) -> str | None:
+            nonlocal moderator_llm
+            if moderator_llm is None:
+                moderator_llm = moderator_llm_factory()
+            names = [agent.spec.name for agent in candidates]
+            response = moderator_llm.invoke(self._build_moderator_prompt(names))
+            answer = str(getattr(response, "content", response)).strip().lower()
+            return next((name for name in names if name.lower() in answer), None)
+
+        return choose_speaker
+
+    def _build_moderator_prompt(self, candidate_names: list[str]) -> str:
+        transcript = self.history_as_text() or "(no messages yet)"
+        candidates = "\n".join(f"- {name}" for name in candidate_names)
+        return (
+            "You moderate a multi-party negotiation and decide who speaks next.\n\n"
+            f"TRANSCRIPT:\n{transcript}\n\n"
+            f"PARTIES WHO HAVE NOT SPOKEN THIS ROUND:\n{candidates}\n\n"
+            "Pick the party whose contribution would move the negotiation forward most. "
+            "Reply with exactly one name from the list, or NONE if nobody else needs to speak this round."
+        )
+
+    def get_history(self) -> list[dict[str, Any]]:
         # Accesso strutturato allo storico per UI, persistence o analytics.
         return self.history
 
@@ -222,14 +451,15 @@ class NegotiationDirector:
 
 
 
-    def evaluate_round(self, judge_llm: Any) -> dict[str, Any]:
+    def evaluate_round(self, judge_llm: Any, with_confidence: bool = False) -> dict[str, Any]:
         """
         Round Judge: evaluates the single round using scenario metrics.
         Returns parsed JSON; if invalid, includes raw output.
+        With `with_confidence` the judge also rates its confidence in agreement_status.
         """
         metrics = self.scenario.get("metrics", {})
         metrics_json = json.dumps(metrics, ensure_ascii=True)
-        schema_block, rules_lines = self._build_round_judge_schema_and_rules(metrics)
+        schema_block, rules_lines = self._build_round_judge_schema_and_rules(metrics, with_confidence)
         prompt = self._build_round_judge_prompt(metrics_json, schema_block, rules_lines)
 
         response = judge_llm.invoke(prompt)
@@ -241,6 +471,20 @@ class NegotiationDirector:
         except json.JSONDecodeError:
             return {"error": "judge_output_not_json", "raw": raw_content}
 
+    def evaluate_status(self, judge_llm: Any) -> dict[str, Any]:
+        """
+        Status Judge: only agreement_status for the latest round, no metrics.
+        A much shorter answer than evaluate_round, meant for a low max_tokens model.
+        """
+        response = judge_llm.invoke(self._build_status_judge_prompt())
+        raw_content = getattr(response, "content", str(response))
+        cleaned = self._strip_code_fences(raw_content)
+
+        try:
+            return json.loads(cleaned)
+        except json.JSONDecodeError:
+            return {"error": "judge_output_not_json", "raw": raw_content}
+
     def evaluate_final(self, judge_llm: Any) -> dict[str, Any]:
         """
         Final Judge: evaluates the entire trajectory and produces final verdict.
@@ -269,7 +513,11 @@ class NegotiationDirector:
             return self.evaluate_final(judge_llm)
         return self.evaluate_round(judge_llm)
 
-    def _build_round_judge_schema_and_rules(self, metrics: dict[str, Any]) -> tuple[str, list[str]]:
+    def _build_round_judge_schema_and_rules(
+        self,
+        metrics: dict[str, Any],
+        with_confidence: bool = False,
+    ) -> tuple[str, list[str]]:
         """Build minimal schema for Round Judge: scenario metrics + agreement_status + summary."""
         schema_lines = []
         rules_lines = [
@@ -307,6 +555,11 @@ class NegotiationDirector:
         # Add mandatory round judge fields
         if "agreement_status" not in metrics:
             schema_lines.append('  "agreement_status": one of ["ongoing", "reached", "failed"],')
+        if with_confidence:
+            schema_lines.append('  "confidence": integer (0-10),')
+            rules_lines.append(
+                "- confidence rates how sure you are of agreement_status, from 0 (guess) to 10 (certain)."
+            )
         schema_lines.append('  "summary": string')
 
         return "{\n" + "\n".join(schema_lines) + "\n}", rules_lines
@@ -454,6 +707,21 @@ class NegotiationDirector:
             f"Dialogue:\n{self.history_as_text()}"
         )
 
+    def _build_status_judge_prompt(self) -> str:
+        # Same termination criteria as the round judge, without metrics or summary.
+        return (
+            "You are the STATUS_JUDGE of a negotiation dialogue.\n"
+            "Decide only the agreement status after the latest round.\n\n"
+            f"Current negotiation status: {self.latest_agreement_status}\n\n"
+            'Output ONLY this JSON object: {"agreement_status": one of ["ongoing", "reached", "failed"]}\n\n'
+            "Rules:\n"
+            "- 'reached' only when parties explicitly converge on concrete deal terms.\n"
+            "- 'failed' when they are at impasse, reject continuation, or the latest round is repetitive, "
+            "vague or adds no concrete movement.\n"
+            "- 'ongoing' only when the latest round adds concrete movement toward closure.\n\n"
+            f"Dialogue:\n{self.history_as_text()}"
+        )
+
     def _build_final_judge_prompt(
         self,
         metrics_json: str,
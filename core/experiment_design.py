@@ -0,0 +1,173 @@
+import hashlib
+import itertools
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from core.experiments import ExperimentCell
+
+
+DESIGNS = {"factorial", "latin_hypercube"}
+# Factors a spec may vary, by kind of value.
+CATEGORICAL_FACTORS = {"scenario_file", "mode", "agents_model", "judge_model", "final_judge_model", "max_rounds"}
+BOOLEAN_FACTORS = {"allow_partial_agreements", "require_unanimous_agreement"}
+TEMPERATURE_FACTORS = {"agents_temperature", "judge_temperature", "final_judge_temperature"}
+TEMPERATURE_RANGE = (0.0, 2.0)
+MAX_RANGE_STEPS = 50
+
+EXAMPLE_SPEC = {
+    "experiment_id": "modes-by-model",
+    "design": "factorial",
+    "factors": {
+        "mode": ["cooperative", "competitive", "mixed"],
+        "require_unanimous_agreement": [True, False],
+        "agents_model": ["claude-sonnet-4-5-20250929", "claude-haiku-4-5-20251001"],
+        "agents_temperature": {"min": 0.0, "max": 1.0, "steps": 3},
+    },
+}
+
+
+@dataclass(frozen=True)
+class Factor:
+    """One varied rule: discrete `levels`, or a continuous [low, high] range (Latin hypercube only)."""
+
+    name: str
+    levels: tuple[Any, ...] = ()
+    low: float | None = None
+    high: float | None = None
+
+    def value_at(self, u: float) -> Any:
+        # Map a point of [0, 1) to a level: equal-width strata over the levels, or a point of the range.
+        if self.levels:
+            return self.levels[min(int(u * len(self.levels)), len(self.levels) - 1)]
+        return round(float(self.low + u * (self.high - self.low)), 2)
+
+
+@dataclass(frozen=True)
+class ExperimentDesign:
+    """Design points over the factors of an experiment spec, produced one at a time.
+
+    Factorial designs walk the Cartesian product of the factor levels;
+    Latin hypercube designs draw `samples` points, each factor's strata
+    visited exactly once. Only the per-factor stratum permutations are held
+    in memory, never the list of points.
+    """
+
+    experiment_id: str
+    design: str
+    factors: tuple[Factor, ...]
+    rules: dict[str, Any]
+    samples: int = 0
+    seed: int = 0
+
+    def __len__(self) -> int:
+        if self.design == "latin_hypercube":
+            return self.samples
+        return math.prod(len(factor.levels) for factor in self.factors)
+
+    def points(self) -> Iterator[dict[str, Any]]:
+        names = [factor.name for factor in self.factors]
+        if self.design == "factorial":
+            for combination in itertools.product(*(factor.levels for factor in self.factors)):
+                yield dict(zip(names, combination))
+            return
+
+        import numpy as np
+
+        rng = np.random.default_rng(self.seed)
+        strata = [rng.permutation(self.samples) for _factor in self.factors]
+        for index in range(self.samples):
+            # One uniform draw inside this point's stratum, per factor.
+            yield {
+                factor.name: factor.value_at((order[index] + rng.random()) / self.samples)
+                for factor, order in zip(self.factors, strata)
+            }
+
+    def cells(self, default_scenario_file: str) -> Iterator[ExperimentCell]:
+        """Experiment cells in design order; a cell id is a hash of its factor levels."""
+        from negotiation_rules_state import normalize_rules
+
+        for levels in self.points():
+            rule_levels = {name: value for name, value in levels.items() if name != "scenario_file"}
+            yield ExperimentCell(
+                cell_id=hashlib.sha1(json.dumps(levels, sort_keys=True).encode("utf-8")).hexdigest()[:10],
+                scenario_file=str(levels.get("scenario_file", default_scenario_file)),
+                rules=normalize_rules({**self.rules, **rule_levels}),
+                levels=levels,
+            )
+
+
+def _factor(name: str, raw: Any, design: str) -> Factor:
+    if name not in CATEGORICAL_FACTORS | BOOLEAN_FACTORS | TEMPERATURE_FACTORS:
+        raise ValueError(f"Unknown factor `{name}`.")
+    if isinstance(raw, dict):
+        if name not in TEMPERATURE_FACTORS:
+            raise ValueError(f"Factor `{name}` takes a list of levels, not a range.")
+        try:
+            low, high = float(raw["min"]), float(raw["max"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Range of `{name}` needs numeric `min` and `max`.") from None
+        if not TEMPERATURE_RANGE[0] <= low <= high <= TEMPERATURE_RANGE[1]:
+            raise ValueError(f"Range of `{name}` must lie within {TEMPERATURE_RANGE}.")
+        if design == "latin_hypercube" and "steps" not in raw:
+            return Factor(name, low=low, high=high)
+        steps = raw.get("steps", 3)
+        if not isinstance(steps, int) or not 1 <= steps <= MAX_RANGE_STEPS:
+            raise ValueError(f"`steps` of `{name}` must be an integer from 1 to {MAX_RANGE_STEPS}.")
+        if steps == 1:
+            return Factor(name, levels=(round(low, 2),))
+        return Factor(name, levels=tuple(round(low + (high - low) * i / (steps - 1), 2) for i in range(steps)))
+
+    levels = raw if isinstance(raw, list) else [raw]
+    if not levels:
+        raise ValueError(f"Factor `{name}` has no levels.")
+    if name in BOOLEAN_FACTORS and not all(isinstance(level, bool) for level in levels):
+        raise ValueError(f"Levels of `{name}` must be true or false.")
+    if name in TEMPERATURE_FACTORS and not all(
+        isinstance(level, (int, float)) and TEMPERATURE_RANGE[0] <= level <= TEMPERATURE_RANGE[1] for level in levels
+    ):
+        raise ValueError(f"Levels of `{name}` must be numbers within {TEMPERATURE_RANGE}.")
+    if name == "mode" and not set(levels) <= {"cooperative", "competitive", "mixed"}:
+        raise ValueError("Levels of `mode` must be cooperative, competitive or mixed.")
+    if name == "max_rounds" and not all(isinstance(level, int) and level > 0 for level in levels):
+        raise ValueError("Levels of `max_rounds` must be positive integers.")
+    # Duplicates would be the same cell twice.
+    return Factor(name, levels=tuple(dict.fromkeys(levels)))
+
+
+def parse_experiment_spec(spec: Any, base_rules: dict[str, Any]) -> ExperimentDesign:
+    """Validate an experiment spec (see EXAMPLE_SPEC) and return its design.
+
+    `rules` in the spec override `base_rules` for every cell; factors then
+    override both. Raises ValueError with a readable message on bad specs.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("The experiment spec must be a JSON object.")
+    experiment_id = str(spec.get("experiment_id", "")).strip()
+    if not experiment_id:
+        raise ValueError("`experiment_id` is required.")
+    design = str(spec.get("design", "factorial")).strip().lower()
+    if design not in DESIGNS:
+        raise ValueError(f"`design` must be one of: {', '.join(sorted(DESIGNS))}.")
+    raw_factors = spec.get("factors")
+    if not isinstance(raw_factors, dict) or not raw_factors:
+        raise ValueError("`factors` must map rule names to levels.")
+    overrides = spec.get("rules", {})
+    if not isinstance(overrides, dict):
+        raise ValueError("`rules` must be an object.")
+
+    samples, seed = spec.get("samples", 0), spec.get("seed", 0)
+    if design == "latin_hypercube" and (not isinstance(samples, int) or samples < 1):
+        raise ValueError("A latin_hypercube design needs a positive integer `samples`.")
+    if not isinstance(seed, int):
+        raise ValueError("`seed` must be an integer.")
+
+    return ExperimentDesign(
+        experiment_id=experiment_id,
+        design=design,
+        factors=tuple(_factor(str(name), raw, design) for name, raw in raw_factors.items()),
+        rules={**base_rules, **overrides},
+        samples=samples if design == "latin_hypercube" else 0,
+        seed=seed,
+    )
@@ -0,0 +1,306 @@
+import math
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+from uuid import uuid4
+
+from core.director import NegotiationDirector
+from core.judging import build_round_judge
+from core.negotiation_run import build_global_result_row, execute_round, model_settings
+
+
+# Two-sided 95% normal quantile.
+WILSON_Z = 1.96
+MAX_PARALLEL_RUNS = 8
+
+# (model, temperature, max_tokens=None) -> chat model instance.
+ChatModelFactory = Callable[..., Any]
+
+
+@dataclass(frozen=True)
+class ExperimentCell:
+    """One configuration to replicate: a scenario file and the rules it runs under.
+
+    `levels` are the design factors that define the cell (shown in summaries).
+    """
+
+    cell_id: str
+    scenario_file: str
+    rules: dict[str, Any]
+    levels: dict[str, Any] = field(default_factory=dict)
+
+
+def wilson_interval(successes: int, trials: int, z: float = WILSON_Z) -> tuple[float, float]:
+    """Wilson score interval of a binomial rate; (0, 1) before any trial."""
+    if trials <= 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1.0 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1.0 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(centre - margin, 0.0), min(centre + margin, 1.0)
+
+
+def fixed_replicates(target_half_width: float, z: float = WILSON_Z) -> int:
+    """Replicates per cell a fixed design needs to reach the target half-width at any rate (worst case 0.5)."""
+    trials = 1
+    while True:
+        low, high = wilson_interval(trials / 2, trials, z)
+        if (high - low) / 2 <= target_half_width:
+            return trials
+        trials += 1
+
+
+@dataclass
+class CellTally:
+    cell: ExperimentCell
+    runs: int = 0
+    reached: int = 0
+    errors: int = 0
+    in_flight: int = 0
+
+    def half_width(self, z: float = WILSON_Z, pending: int = 0) -> float:
+        # `pending` runs are assumed to land on the current rate (0.5 before any run).
+        trials = self.runs + pending
+        if trials <= 0:
+            return 0.5
+        rate = self.reached / self.runs if self.runs else 0.5
+        low, high = wilson_interval(rate * trials, trials, z)
+        return (high - low) / 2
+
+
+class AdaptiveReplicates:
+    """Sequential stopping of replicates, one reached-rate estimate per cell.
+
+    Every cell first gets `min_replicates` runs. After that the next run goes
+    to the open cell with the widest Wilson interval, and a cell closes once
+    its half-width is at most `target_half_width`. Runs in flight count as
+    pending replicates, so parallel workers spread over cells instead of
+    piling onto one. Scheduling stops when every cell is closed or
+    `max_runs` runs have been handed out.
+
+    Cells are pulled from `cells` (any iterable, e.g. a lazy design stream)
+    when they get their first run, so with a budget smaller than the
+    design the remaining cells are never built.
+    """
+
+    def __init__(
+        self,
+        cells: Iterable[ExperimentCell],
+        target_half_width: float = 0.1,
+        min_replicates: int = 3,
+        max_runs: int = 100,
+        z: float = WILSON_Z,
+    ):
+        self.tallies: dict[str, CellTally] = {}
+        self._cells = iter(cells)
+        self.exhausted = False
+        self.target_half_width = target_half_width
+        self.min_replicates = max(min_replicates, 1)
+        self.max_runs = max_runs
+        self.z = z
+        self.scheduled = 0
+
+    def _is_open(self, tally: CellTally) -> bool:
+        if tally.runs + tally.in_flight < self.min_replicates:
+            return True
+        return tally.half_width(self.z, tally.in_flight) > self.target_half_width
+
+    def next_cell(self) -> ExperimentCell | None:
+        if self.scheduled >= self.max_runs:
+            return None
+        open_tallies = [tally for tally in self.tallies.values() if self._is_open(tally)]
+        warming = [tally for tally in open_tallies if tally.runs + tally.in_flight < self.min_replicates]
+        if warming:
+            chosen = min(warming, key=lambda tally: tally.runs + tally.in_flight)
+        elif (drawn := self._draw()) is not None:
+            chosen = drawn
+        elif open_tallies:
+            chosen = max(open_tallies, key=lambda tally: tally.half_width(self.z, tally.in_flight))
+        else:
+            return None
+        chosen.in_flight += 1
+        self.scheduled += 1
+        return chosen.cell
+
+    def _draw(self) -> CellTally | None:
+        # Every drawn cell is warmed up before the adaptive phase starts.
+        if self.exhausted:
+            return None
+        cell = next(self._cells, None)
+        if cell is None:
+            self.exhausted = True
+            return None
+        return self.tallies.setdefault(cell.cell_id, CellTally(cell))
+
+    def record(self, cell_id: str, reached: bool | None) -> None:
+        """Outcome of a run handed out by next_cell; None for a run that failed to complete."""
+        tally = self.tallies[cell_id]
+        tally.in_flight -= 1
+        if reached is None:
+            tally.errors += 1
+            return
+        tally.runs += 1
+        tally.reached += int(reached)
+
+    @property
+    def done(self) -> bool:
+        return not any(tally.in_flight for tally in self.tallies.values()) and (
+            self.scheduled >= self.max_runs
+            or (self.exhausted and not any(self._is_open(tally) for tally in self.tallies.values()))
+        )
+
+    def summary(self) -> list[dict[str, Any]]:
+        rows = []
+        for cell_id, tally in self.tallies.items():
+            low, high = wilson_interval(tally.reached, tally.runs, self.z)
+            rows.append(
+                {
+                    "cell_id": cell_id,
+                    **(tally.cell.levels or {"scenario_file": tally.cell.scenario_file}),
+                    "runs": tally.runs,
+                    "reached": tally.reached,
+                    "reached_rate": tally.reached / tally.runs if tally.runs else None,
+                    "ci_low": low,
+                    "ci_high": high,
+                    "errors": tally.errors,
+                    "closed": tally.runs >= self.min_replicates and not self._is_open(tally),
+                }
+            )
+        return rows
+
+
+def run_negotiation(
+    scenario: dict[str, Any],
+    rules: dict[str, Any],
+    chat_model: ChatModelFactory,
+    scenario_file: str = "",
+    run_id: str | None = None,
+) -> dict[str, Any]:
+    """Run one negotiation to the end without the UI and return its global results row.
+
+    Same round loop and row as the Dialogue Simulation page (see
+    core.negotiation_run): one round and the round judge configured by
+    `rules`, then the final judge once the run terminates.
+    """
+    # Pandas and the results index load only when a run is actually executed.
+    import pandas as pd
+
+    from derived_metrics import build_round_metrics, numeric_metric_names
+    from round_ledger import flatten_evaluation
+    from scenario_state import scenario_content_hash
+
+    run_id = run_id or str(uuid4())
+    models = model_settings(rules)
+    metrics = scenario.get("metrics", {})
+
+    director = NegotiationDirector(
+        {**scenario, "negotiation_rules": dict(rules)},
+        lambda _spec: chat_model(models["agents_model"], models["agents_temperature"]),
+        moderator_llm_factory=lambda: chat_model(models["round_judge_model"], models["round_judge_temperature"]),
+    )
+    round_judge = build_round_judge(
+        {**rules, "judge_model": models["round_judge_model"]},
+        metrics,
+        lambda model, **options: chat_model(model, models["round_judge_temperature"], **options),
+    )
+    evaluations = []
+    while director.can_advance():
+        round_item = execute_round(director, round_judge, run_id, scenario_file, metrics)
+        evaluations.append(flatten_evaluation(round_item["round"], round_item["evaluation"]))
+
+    final_evaluation = None
+    if director.is_terminated:
+        final_evaluation = director.evaluate_final(
+            chat_model(models["final_judge_model"], models["final_judge_temperature"])
+        )
+
+    round_metrics = build_round_metrics(pd.DataFrame(evaluations), numeric_metric_names(metrics), metrics)
+    return build_global_result_row(
+        director,
+        final_evaluation,
+        run_id=run_id,
+        scenario_file=scenario_file,
+        content_hash=scenario_content_hash(scenario_file) if scenario_file else None,
+        rules=rules,
+        utility_total_history=round_metrics.utility_history(),
+    )
+
+
+class ExperimentRun:
+    """Run experiment cells on a worker thread until the scheduler stops.
+
+    Up to `max_parallel` negotiations run at once; each finished run is
+    tagged with `experiment_id` and its cell id, persisted with `persist`
+    (one call at a time), and its reached outcome is fed back to the
+    scheduler, which picks the cell of the next run.
+    """
+
+    def __init__(
+        self,
+        scheduler: AdaptiveReplicates,
+        run_cell: Callable[[ExperimentCell], dict[str, Any]],
+        persist: Callable[[dict[str, Any]], None],
+        max_parallel: int = 4,
+        experiment_id: str = "",
+    ):
+        self.scheduler = scheduler
+        self.experiment_id = experiment_id
+        self._run_cell = run_cell
+        self._persist = persist
+        self.max_parallel = min(max(max_parallel, 1), MAX_PARALLEL_RUNS)
+        self._lock = threading.Lock()
+        self._cancel_requested = threading.Event()
+        self.runs_completed = 0
+        self.error: str | None = None
+        self.last_run_error: str | None = None
+        self._thread = threading.Thread(target=self._run, name="experiment-run", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        # Stops scheduling new runs; runs in flight are allowed to finish.
+        self._cancel_requested.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def summary(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return self.scheduler.summary()
+
+    def _run(self) -> None:
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="experiment-cell") as executor:
+                pending = {}
+                while True:
+                    with self._lock:
+                        while not self.cancelled and len(pending) < self.max_parallel:
+                            cell = self.scheduler.next_cell()
+                            if cell is None:
+                                break
+                            pending[executor.submit(self._run_cell, cell)] = cell
+                    if not pending:
+                        return
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        cell = pending.pop(future)
+                        reached = None
+                        if future.exception() is None:
+                            row = {**future.result(), "experiment_id": self.experiment_id, "cell_id": cell.cell_id}
+                            self._persist(row)
+                            reached = row.get("agreement_status") == "reached"
+                        else:
+                            exc = future.exception()
+                            self.last_run_error = f"{type(exc).__name__}: {exc}"
+                        with self._lock:
+                            self.scheduler.record(cell.cell_id, reached)
+                            self.runs_completed += 1
+        except Exception as exc:
+            self.error = f"{type(exc).__name__}: {exc}"
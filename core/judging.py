@@ -0,0 +1,267 @@
+import re
+import statistics
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from core.director import NegotiationDirector
+
+
+# Upper bound on concurrent judge calls in an ensemble round.
+MAX_CONCURRENT_JUDGE_CALLS = 8
+NON_NUMERIC_METRIC_TYPES = {"boolean", "enum", "multiclass", "categorical"}
+# Room for {"agreement_status": "ongoing"}, code fences included.
+STATUS_JUDGE_MAX_TOKENS = 32
+
+# Model name (and optional max_tokens=) -> chat model instance.
+JudgeModelFactory = Callable[..., Any]
+
+
+class RoundJudge(ABC):
+    """Produces the round evaluation the director registers after each round.
+
+    `evaluate` runs off the Streamlit thread (in the background worker too),
+    so implementations only talk to models and to the director.
+    """
+
+    @abstractmethod
+    def evaluate(self, director: NegotiationDirector) -> dict[str, Any]:
+        ...
+
+
+class SingleJudge(RoundJudge):
+    # One call to one model (the original behaviour).
+    def __init__(self, judge_llm: Any):
+        self.judge_llm = judge_llm
+
+    def evaluate(self, director):
+        return director.evaluate_round(self.judge_llm)
+
+
+class EnsembleJudge(RoundJudge):
+    """K judges called concurrently on the same transcript, then aggregated.
+
+    Wall-clock time is that of the slowest judge rather than the sum of K calls.
+    """
+
+    def __init__(self, judge_llms: list[Any], metrics: dict[str, Any]):
+        self.judge_llms = judge_llms
+        self.metrics = metrics
+
+    def evaluate(self, director):
+        max_workers = min(len(self.judge_llms), MAX_CONCURRENT_JUDGE_CALLS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="round-judge") as executor:
+            evaluations = list(executor.map(director.evaluate_round, self.judge_llms))
+        return aggregate_evaluations(evaluations, self.metrics)
+
+
+class CascadeJudge(RoundJudge):
+    """A cheap model judges every round; the configured judge only when needed.
+
+    The round is escalated when the cheap judge reports a terminal status,
+    is unsure (confidence below `min_confidence`, 0-10), returns invalid
+    output, or moves a numeric metric by more than `max_swing` points since
+    the last registered evaluation that carries metrics. Only escalated rounds can end the run,
+    so termination is still decided by the configured judge.
+    """
+
+    def __init__(
+        self,
+        cheap_llm: Any,
+        judge: RoundJudge,
+        metrics: dict[str, Any],
+        min_confidence: int = 7,
+        max_swing: int = 3,
+    ):
+        self.cheap_llm = cheap_llm
+        self.judge = judge
+        self.metrics = metrics
+        self.min_confidence = min_confidence
+        self.max_swing = max_swing
+
+    def evaluate(self, director):
+        cheap = director.evaluate_round(self.cheap_llm, with_confidence=True)
+        reasons = self.escalation_reasons(cheap, director.last_annotated_evaluation)
+        if not reasons:
+            return {**cheap, "judge_tier": "cheap"}
+        return {**self.judge.evaluate(director), "judge_tier": "escalated", "judge_escalation": reasons}
+
+    def escalation_reasons(self, evaluation: dict[str, Any], previous: dict[str, Any]) -> list[str]:
+        if "error" in evaluation:
+            return ["invalid_output"]
+        reasons = []
+        if NegotiationDirector._extract_agreement_status(evaluation) in {"reached", "failed", None}:
+            reasons.append("terminal_status")
+        confidence = _number(evaluation.get("confidence"))
+        if confidence is None or confidence < self.min_confidence:
+            reasons.append("low_confidence")
+        for metric_name, metric_spec in self.metrics.items():
+            metric_type = str(metric_spec.get("type", "")).lower() if isinstance(metric_spec, dict) else ""
+            if metric_type in NON_NUMERIC_METRIC_TYPES:
+                continue
+            current, before = _number(evaluation.get(metric_name)), _number(previous.get(metric_name))
+            if current is not None and before is not None and abs(current - before) > self.max_swing:
+                reasons.append("metric_swing")
+                break
+        return reasons
+
+
+class TwoTierJudge(RoundJudge):
+    """A status-only call decides every round; metrics come at checkpoints.
+
+    The short STATUS_JUDGE call alone decides termination. The annotator
+    (any RoundJudge) runs every `annotate_every` rounds, concurrently with
+    the status call, and on the round that closes the run, so the last
+    round always carries metrics. Other rounds are marked "status_only".
+    """
+
+    def __init__(self, status_llm: Any, annotator: RoundJudge, annotate_every: int):
+        self.status_llm = status_llm
+        self.annotator = annotator
+        self.annotate_every = max(annotate_every, 1)
+
+    def evaluate(self, director):
+        checkpoint = director.round % self.annotate_every == 0 or director.round >= director.max_rounds
+        annotation = None
+        if checkpoint:
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="round-judge") as executor:
+                pending = executor.submit(self.annotator.evaluate, director)
+                status = director.evaluate_status(self.status_llm)
+                annotation = pending.result()
+        else:
+            status = director.evaluate_status(self.status_llm)
+
+        agreement_status = None if "error" in status else NegotiationDirector._extract_agreement_status(status)
+        if annotation is None and agreement_status in {"reached", "failed", None}:
+            # Closing (or unreadable) round: annotate it before the run ends.
+            annotation = self.annotator.evaluate(director)
+        if annotation is None:
+            return {"agreement_status": agreement_status, "annotation": "status_only"}
+        if agreement_status is None:
+            return {**annotation, "annotation": "full"}
+        return {**annotation, "agreement_status": agreement_status, "annotation": "full"}
+
+
+def cascade_hit_rate(evaluations: list[dict[str, Any]]) -> tuple[int, int]:
+    """(rounds settled by the cheap judge, rounds judged by a cascade)."""
+    tiers = [evaluation.get("judge_tier") for evaluation in evaluations if isinstance(evaluation, dict)]
+    cascaded = [tier for tier in tiers if tier in {"cheap", "escalated"}]
+    return cascaded.count("cheap"), len(cascaded)
+
+
+def _metric_span(metric_spec: Any) -> float:
+    # "scale": "1-10" -> 9; scores without a scale are read on 0-10.
+    scale = metric_spec.get("scale") if isinstance(metric_spec, dict) else None
+    match = re.fullmatch(r"\s*(-?\d+(?:\.\d+)?)\s*-\s*(-?\d+(?:\.\d+)?)\s*", str(scale or ""))
+    if match:
+        span = float(match.group(2)) - float(match.group(1))
+        if span > 0:
+            return span
+    return 10.0
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _vote(values: list[Any]) -> tuple[Any, float]:
+    """Most common value and its share of the votes; ties keep the first value seen."""
+    counts = Counter(str(value) for value in values)
+    winner, votes = max(counts.items(), key=lambda item: item[1])
+    return next(value for value in values if str(value) == winner), votes / len(values)
+
+
+def aggregate_evaluations(evaluations: list[dict[str, Any]], metrics: dict[str, Any]) -> dict[str, Any]:
+    """Merge K round evaluations: majority on status, median on numeric metrics.
+
+    A status tie resolves to "ongoing", so a split panel never ends the run.
+    `judge_disagreement` is the mean dispersion over the compared fields, in
+    [0, 1]: the losing share of each vote, and the min-max spread of each
+    numeric metric over its scale.
+    """
+    valid = [evaluation for evaluation in evaluations if isinstance(evaluation, dict) and "error" not in evaluation]
+    if not valid:
+        return {**evaluations[0], "judge_count": len(evaluations)}
+
+    statuses = [NegotiationDirector._extract_agreement_status(evaluation) or "ongoing" for evaluation in valid]
+    votes = Counter(statuses)
+    top_votes = max(votes.values())
+    leaders = [status for status, count in votes.items() if count == top_votes]
+    status = leaders[0] if len(leaders) == 1 else "ongoing"
+    # The summary and top words come from a judge that voted with the majority.
+    representative = next((evaluation for evaluation, vote in zip(valid, statuses) if vote == status), valid[0])
+
+    merged = dict(representative)
+    merged["agreement_status"] = status
+    dispersions = [1.0 - votes[status] / len(valid)]
+    for metric_name, metric_spec in metrics.items():
+        if metric_name == "agreement_status":
+            continue
+        metric_type = str(metric_spec.get("type", "")).lower() if isinstance(metric_spec, dict) else ""
+        present = [evaluation[metric_name] for evaluation in valid if evaluation.get(metric_name) is not None]
+        if not present:
+            continue
+        if metric_type in NON_NUMERIC_METRIC_TYPES:
+            labels = [value.split(":", 1)[0].strip().lower() if isinstance(value, str) else value for value in present]
+            merged[metric_name], share = _vote(labels)
+            dispersions.append(1.0 - share)
+            continue
+        numbers = [number for number in map(_number, present) if number is not None]
+        if not numbers:
+            continue
+        # Lower median: an actual judge's score, so integer metrics stay integers.
+        median = statistics.median_low(numbers)
+        merged[metric_name] = int(median) if float(median).is_integer() else median
+        dispersions.append(min((max(numbers) - min(numbers)) / _metric_span(metric_spec), 1.0))
+        closest = next(evaluation for evaluation in valid if _number(evaluation.get(metric_name)) == median)
+        if f"{metric_name}_top_words" in closest:
+            merged[f"{metric_name}_top_words"] = closest[f"{metric_name}_top_words"]
+
+    merged["judge_count"] = len(evaluations)
+    merged["judge_votes"] = dict(votes)
+    merged["judge_disagreement"] = round(sum(dispersions) / len(dispersions), 3)
+    return merged
+
+
+def build_round_judge(
+    rules: dict[str, Any],
+    metrics: dict[str, Any],
+    model_factory: JudgeModelFactory,
+) -> RoundJudge:
+    """Round judge configured by the negotiation rules.
+
+    `judge_ensemble_size` > 1 asks that many judges, cycling through
+    `judge_ensemble_models` (the round judge model when empty). A
+    `judge_cascade_model` puts a cheap first judge in front of either, and
+    `judge_annotate_every` > 1 leaves only a status call on the critical path.
+    """
+    judge_model = str(rules.get("judge_model", "")).strip()
+    size = rules.get("judge_ensemble_size", 1)
+    size = size if isinstance(size, int) and size > 1 else 1
+    if size == 1:
+        judge: RoundJudge = SingleJudge(model_factory(judge_model))
+    else:
+        models = [str(model).strip() for model in rules.get("judge_ensemble_models", []) if str(model).strip()]
+        models = models or [judge_model]
+        judge = EnsembleJudge([model_factory(models[index % len(models)]) for index in range(size)], metrics)
+
+    cascade_model = str(rules.get("judge_cascade_model", "")).strip()
+    if cascade_model:
+        judge = CascadeJudge(
+            model_factory(cascade_model),
+            judge,
+            metrics,
+            min_confidence=int(rules.get("judge_cascade_min_confidence", 7)),
+            max_swing=int(rules.get("judge_cascade_max_swing", 3)),
+        )
+
+    annotate_every = rules.get("judge_annotate_every", 1)
+    if isinstance(annotate_every, int) and annotate_every > 1:
+        judge = TwoTierJudge(model_factory(judge_model, max_tokens=STATUS_JUDGE_MAX_TOKENS), judge, annotate_every)
+    return judge
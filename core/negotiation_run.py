@@ -0,0 +1,179 @@
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from core.director import OPENING_MESSAGE, NegotiationDirector
+from core.judging import RoundJudge
+
+
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+STATUS_LABELS = {"reached", "failed", "ongoing"}
+
+
+def model_settings(rules: dict[str, Any]) -> dict[str, Any]:
+    """Models and temperatures of a run, with the defaults the rules page applies."""
+    agents_model = str(rules.get("agents_model", "") or "").strip() or DEFAULT_MODEL
+    judge_model = str(rules.get("judge_model", "") or "").strip() or DEFAULT_MODEL
+    final_judge_model = str(rules.get("final_judge_model", "") or "").strip() or judge_model
+    judge_temperature = float(rules.get("judge_temperature", 0.1))
+    return {
+        "agents_model": agents_model,
+        "agents_temperature": float(rules.get("agents_temperature", 0.3)),
+        "round_judge_model": judge_model,
+        "round_judge_temperature": judge_temperature,
+        "final_judge_model": final_judge_model,
+        "final_judge_temperature": float(rules.get("final_judge_temperature", judge_temperature)),
+    }
+
+
+def normalize_agreement_status(value: Any) -> str:
+    # "reached: both parties signed" -> "reached"; anything unreadable counts as ongoing.
+    if not isinstance(value, str):
+        return "ongoing"
+    label = value.split(":", 1)[0].strip().lower()
+    return label if label in STATUS_LABELS else "ongoing"
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def execute_round(
+    director: NegotiationDirector,
+    round_judge: RoundJudge,
+    run_id: str,
+    scenario_file: str,
+    metrics: dict[str, Any],
+) -> dict[str, Any]:
+    """Run one round and its judge call, and record the evaluation in the results index.
+
+    No Streamlit state is touched, so the dialogue buttons, the background
+    worker and experiment runs share this code path.
+    """
+    from run_results_index import record_round_evaluation
+
+    history = director.get_history()
+    turn_messages = director.step(history[-1]["content"] if history else OPENING_MESSAGE)
+
+    judge_started_at = time.perf_counter()
+    evaluation = round_judge.evaluate(director)
+    judge_latency_ms = (time.perf_counter() - judge_started_at) * 1000.0
+    director.register_evaluation(evaluation)
+
+    # Keep round-level judge output beyond the session for cross-run analytics.
+    record_round_evaluation(
+        run_id=run_id,
+        round_id=director.round,
+        scenario_file=scenario_file,
+        mode=director.mode,
+        evaluation=evaluation,
+        metrics=metrics,
+        judge_latency_ms=judge_latency_ms,
+    )
+    return {
+        "round": director.round,
+        "turn_messages": turn_messages,
+        "evaluation": evaluation,
+        "judge_latency_ms": judge_latency_ms,
+        "history_len": len(director.get_history()),
+        "convergence": director.offer_convergence[-1] if director.offer_convergence else {},
+    }
+
+
+def local_utility_history(director: NegotiationDirector) -> list[dict[str, Any]]:
+    # Scored from the parsed offers against private goals; no judge output involved.
+    history = director.get_history()
+    if not any(event.get("offer") for event in history):
+        return []
+    from core.proposals import local_utility_history as score_offers
+
+    return score_offers(director.negotiation_space, history)
+
+
+def final_frontier_distance(
+    scenario: dict[str, Any],
+    content_hash: str | None,
+    local_history: list[dict[str, Any]],
+) -> float | None:
+    # The scenario's Pareto frontier is computed once per content hash, then reused by every run.
+    if not local_history or content_hash is None:
+        return None
+    from core.bargaining import frontier_distance, scenario_bargaining
+
+    analysis = scenario_bargaining(scenario, content_hash)
+    final_utilities = [local_history[-1]["utilities"].get(name, 0.0) for name in analysis.agent_names]
+    return round(float(frontier_distance(analysis, final_utilities)), 4)
+
+
+def conversation_history_json(history: list[dict[str, Any]]) -> str:
+    # One {"round", "agent", "content"} object per message, in speaking order.
+    messages = []
+    for item in history:
+        if not isinstance(item, dict):
+            continue
+        content = str(item.get("content", "")).strip()
+        if not content:
+            continue
+        messages.append({"round": item.get("round"), "agent": str(item.get("agent", "")).strip(), "content": content})
+    return json.dumps(messages, ensure_ascii=True)
+
+
+def build_global_result_row(
+    director: NegotiationDirector,
+    final_evaluation: dict[str, Any] | None,
+    run_id: str,
+    scenario_file: str,
+    content_hash: str | None,
+    rules: dict[str, Any],
+    utility_total_history: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Global Results row of a finished (or abandoned) run.
+
+    Final metrics come from the final judge, falling back to the last round
+    evaluation that carries metrics; the agreement status from the final judge, falling back to
+    the director's latest status.
+    """
+    scenario = director.scenario
+    final_eval = final_evaluation if isinstance(final_evaluation, dict) else {}
+    latest_round_eval = director.last_annotated_evaluation
+    local_history = local_utility_history(director)
+
+    def _final_metric_value(metric_name: str):
+        value = _to_int(final_eval.get(metric_name))
+        if value is not None:
+            return value
+        return _to_int(latest_round_eval.get(metric_name))
+
+    agents = scenario.get("agents", [])
+    return {
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "run_id": run_id,
+        "scenario_file": scenario_file,
+        "scenario_name": scenario.get("name", scenario_file or "Unknown Scenario"),
+        "num_agents": len(agents) if isinstance(agents, list) else 0,
+        **model_settings(rules),
+        "mode": director.mode,
+        "max_rounds": director.max_rounds,
+        "effective_rounds": director.round,
+        "allow_partial_agreements": director.allow_partial_agreements,
+        "require_unanimous_agreement": director.require_unanimous_agreement,
+        "agreement_status": normalize_agreement_status(
+            final_eval.get("agreement_status", director.latest_agreement_status)
+        ),
+        "conversation_history": conversation_history_json(director.get_history()),
+        "utility_total_history": json.dumps(utility_total_history, ensure_ascii=True),
+        "local_utility_history": json.dumps(local_history, ensure_ascii=True),
+        "frontier_distance": final_frontier_distance(scenario, content_hash, local_history),
+        "unanimous": final_eval.get("unanimous", ""),
+        "final_persuasion": _final_metric_value("persuasion"),
+        "final_deception": _final_metric_value("deception"),
+        "final_concession": _final_metric_value("concession"),
+        "final_cooperation": _final_metric_value("cooperation"),
+        "final_summary": final_eval.get("summary", ""),
+        "interaction_pattern": final_eval.get("interaction_pattern", ""),
+        "dominant_agent": final_eval.get("dominant_agent", ""),
+    }
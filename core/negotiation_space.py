@@ -0,0 +1,328 @@
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+
+
+# Extra substrings that tie a private goal key to a resource (e.g. "pto_max"
+# belongs to "paid_time_off"); the resource key itself always matches.
+ISSUE_GOAL_ALIASES = {
+    "annual_bonus": ["bonus"],
+    "remote_work": ["remote"],
+    "paid_time_off": ["pto", "time_off"],
+    "professional_development": ["professional_dev"],
+    "start_date": ["notice_period", "start_delay"],
+}
+FLOOR_TOKENS = {"min", "minimum"}
+CEILING_TOKENS = {"max", "maximum"}
+ASPIRATION_TOKENS = {"preferred", "preference", "standard"}
+
+
+@dataclass(frozen=True)
+class Issue:
+    key: str
+    label: str
+    kind: str
+    low: float | None = None
+    high: float | None = None
+    unit: str = ""
+    group: str | None = None
+    group_total: float | None = None
+    options: tuple[str, ...] = ()
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.kind in {"share", "amount"}
+
+
+@dataclass(frozen=True)
+class NegotiationSpace:
+    """Numeric issues of a scenario plus every agent's preferences over them.
+
+    Offers are vectors over `issues` in a canonical frame: a "share" issue
+    holds the share of the first agent, the rest being split evenly among
+    the others. Preference arrays are shaped (n_agents, n_issues); a zero
+    weight means the agent expressed no goal on that issue.
+    """
+
+    issues: tuple[Issue, ...]
+    categorical_issues: tuple[Issue, ...]
+    agent_ids: tuple[str, ...]
+    agent_names: tuple[str, ...]
+    directions: np.ndarray
+    reservations: np.ndarray
+    aspirations: np.ndarray
+    weights: np.ndarray
+    preferred_options: tuple[dict[str, Any], ...]
+
+    @cached_property
+    def lows(self) -> np.ndarray:
+        return np.array([issue.low for issue in self.issues], dtype=float)
+
+    @cached_property
+    def highs(self) -> np.ndarray:
+        return np.array([issue.high for issue in self.issues], dtype=float)
+
+    def agent_index(self, agent_id_or_name: str) -> int | None:
+        for index, (agent_id, name) in enumerate(zip(self.agent_ids, self.agent_names)):
+            if agent_id_or_name in (agent_id, name):
+                return index
+        return None
+
+    @cached_property
+    def _share_columns(self) -> np.ndarray:
+        return np.array([issue.kind == "share" for issue in self.issues], dtype=bool)
+
+    @cached_property
+    def category_groups(self) -> list[tuple[float, list[int]]]:
+        """(total, issue columns) of every budget-like resource whose categories must sum to a total."""
+        groups: dict[str, list[int]] = {}
+        for column, issue in enumerate(self.issues):
+            if issue.group and issue.group_total is not None:
+                groups.setdefault(issue.group, []).append(column)
+        return [(self.issues[columns[0]].group_total, columns) for columns in groups.values()]
+
+    def own_values(self, values: np.ndarray) -> np.ndarray:
+        """Canonical offers (..., n_issues) -> each agent's view (..., n_agents, n_issues)."""
+        values = np.asarray(values, dtype=float)
+        own = np.repeat(values[..., np.newaxis, :], len(self.agent_ids), axis=-2)
+        shares = self._share_columns
+        if shares.any():
+            others = max(len(self.agent_ids) - 1, 1)
+            own[..., 1:, shares] = (self.highs[shares] - values[..., np.newaxis, shares]) / others
+        return own
+
+    def to_canonical(self, own: np.ndarray, agent_index: int) -> np.ndarray:
+        """One agent's view of an offer -> canonical frame."""
+        values = np.array(own, dtype=float)
+        shares = self._share_columns
+        if agent_index != 0 and shares.any():
+            others = max(len(self.agent_ids) - 1, 1)
+            values[..., shares] = self.highs[shares] - values[..., shares] * others
+        return values
+
+    @cached_property
+    def _utility_scale(self) -> tuple[np.ndarray, np.ndarray]:
+        span = self.aspirations - self.reservations
+        return np.divide(1.0, span, out=np.zeros_like(span), where=span != 0), span == 0
+
+    def _linear_utility(self, own: np.ndarray, rows: Any = slice(None)) -> np.ndarray:
+        # 0 at the reservation value, 1 at the aspiration value; an issue whose
+        # reservation equals its aspiration is simply met or not. Missing (NaN) terms score 0.
+        scale, flat = self._utility_scale
+        gap = own - self.reservations[rows]
+        scaled = np.clip(gap * scale[rows], 0.0, 1.0)
+        if flat[rows].any():
+            scaled = np.where(flat[rows], self.directions[rows] * gap >= 0, scaled)
+        return np.where(scaled == scaled, scaled, 0.0)
+
+    def issue_utilities(self, values: np.ndarray) -> np.ndarray:
+        """Per-issue utility in [0, 1] of canonical offers, shaped (..., n_agents, n_issues)."""
+        return self._linear_utility(self.own_values(values)) * (self.weights > 0)
+
+    def utilities(self, values: np.ndarray) -> np.ndarray:
+        """Weighted utility of canonical offers for every agent, shaped (..., n_agents)."""
+        total_weight = self.weights.sum(axis=1)
+        weighted = (self.issue_utilities(values) * self.weights).sum(axis=-1)
+        return np.divide(weighted, total_weight, out=np.zeros_like(weighted), where=total_weight > 0)
+
+    def own_utility(self, own: np.ndarray, agent_index: int) -> np.ndarray:
+        """Utility for one agent of offers already in its own frame; missing (NaN) terms score 0."""
+        weights = self.weights[agent_index]
+        total_weight = weights.sum()
+        if total_weight == 0:
+            return np.zeros(np.shape(own)[:-1])
+        scaled = self._linear_utility(np.asarray(own, dtype=float), agent_index)
+        return (scaled @ weights) / total_weight
+
+    def from_author(self, values: dict[str, float], author_index: int, agent_index: int) -> np.ndarray:
+        """Parsed terms in the author's frame -> `agent_index`'s frame; missing terms are NaN."""
+        own = np.full(len(self.issues), np.nan)
+        others = max(len(self.agent_ids) - 1, 1)
+        for column, issue in enumerate(self.issues):
+            if issue.key not in values:
+                continue
+            value = float(values[issue.key])
+            if issue.kind == "share" and author_index != agent_index:
+                value = (issue.high - value) / others
+            own[column] = value
+        return own
+
+    def acceptable(self, values: np.ndarray) -> np.ndarray:
+        """Whether each agent's reservation values are met, shaped (..., n_agents)."""
+        own = self.own_values(values)
+        meets = self.directions * (own - self.reservations) >= -1e-9
+        return np.all(meets | (self.weights == 0), axis=-1)
+
+
+def _label(key: str) -> str:
+    return key.replace("_", " ").replace(".", " ").strip().title()
+
+
+def build_issues(scenario: dict[str, Any]) -> list[Issue]:
+    """Derive typed issues from `resources_to_negotiate`; free-text resources are skipped."""
+    resources = scenario.get("resources_to_negotiate", {})
+    if not isinstance(resources, dict):
+        return []
+
+    issues: list[Issue] = []
+    for name, data in resources.items():
+        if not isinstance(data, dict):
+            continue
+        unit = str(data.get("currency") or data.get("unit") or "")
+        if "percent" in unit.lower():
+            unit = "%"
+        if "categories" in data and isinstance(data["categories"], dict):
+            total = _to_float(data.get("total"))
+            for category, bounds in data["categories"].items():
+                if not isinstance(bounds, dict):
+                    continue
+                issues.append(
+                    Issue(
+                        key=f"{name}.{category}",
+                        label=_label(category),
+                        kind="amount",
+                        low=_to_float(bounds.get("min"), 0.0),
+                        high=_to_float(bounds.get("max"), total),
+                        unit=unit,
+                        group=name,
+                        group_total=total,
+                    )
+                )
+        elif data.get("total") and data.get("divisible", True):
+            issues.append(Issue(key=name, label=_label(name), kind="share", low=0.0, high=_to_float(data["total"]), unit=unit or "%"))
+        elif isinstance(data.get("range"), dict):
+            bounds = data["range"]
+            low, high = _to_float(bounds.get("min")), _to_float(bounds.get("max"))
+            if low is not None and high is not None:
+                issues.append(Issue(key=name, label=_label(name), kind="amount", low=low, high=high, unit=unit))
+        elif isinstance(data.get("areas"), list):
+            issues.append(Issue(key=name, label=_label(name), kind="areas", options=tuple(str(area) for area in data["areas"])))
+        elif isinstance(data.get("options"), list):
+            issues.append(Issue(key=name, label=_label(name), kind="options", options=tuple(str(option) for option in data["options"])))
+    return issues
+
+
+def _to_float(value: Any, default: float | None = None) -> float | None:
+    if isinstance(value, bool):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _flatten_goals(goals: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in goals.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_goals(value, f"{full_key}."))
+        else:
+            flat[full_key] = value
+    return flat
+
+
+def _goal_matches(goal_key: str, issue: Issue) -> bool:
+    # Nested goals (e.g. "competing_offer_details.base_salary") describe context, not targets,
+    # unless the nesting itself is the preference (e.g. "budget_allocation_preference.marketing_min").
+    if issue.group is not None:
+        return issue.key.split(".", 1)[1] in goal_key
+    resource_key = goal_key.rsplit(".", 1)[-1] if "." in goal_key else goal_key
+    needles = [issue.key] + ISSUE_GOAL_ALIASES.get(issue.key, [])
+    return any(needle in resource_key for needle in needles)
+
+
+def _issue_preference(issue: Issue, goals: dict[str, Any]) -> tuple[int, float, float, float] | None:
+    floors, ceilings, aspirations = [], [], []
+    for goal_key, raw_value in goals.items():
+        value = _to_float(raw_value)
+        if value is None or not _goal_matches(goal_key, issue):
+            continue
+        tokens = set(re.split(r"[_.]", goal_key.lower()))
+        if tokens & FLOOR_TOKENS:
+            floors.append(value)
+        elif tokens & CEILING_TOKENS:
+            ceilings.append(value)
+        elif tokens & ASPIRATION_TOKENS:
+            aspirations.append(value)
+
+    if floors:
+        reservation = max(floors)
+        aspiration = max(aspirations) if aspirations else issue.high
+        return 1, reservation, max(aspiration, reservation), 1.0
+    if ceilings:
+        reservation = max(ceilings)
+        soft_ceilings = [value for value in ceilings if value < reservation]
+        aspiration = min(aspirations) if aspirations else (min(soft_ceilings) if soft_ceilings else issue.low)
+        return -1, reservation, min(aspiration, reservation), 1.0
+    if aspirations:
+        aspiration = aspirations[0]
+        direction = 1 if aspiration >= (issue.low + issue.high) / 2 else -1
+        reservation = issue.low if direction > 0 else issue.high
+        return direction, reservation, aspiration, 1.0
+    return None
+
+
+def _preferred_options(issues: list[Issue], goals: dict[str, Any]) -> dict[str, Any]:
+    preferred: dict[str, Any] = {}
+    # "preferred_*" goals win over merely acceptable ones.
+    goal_strings = [
+        value
+        for key, value in sorted(goals.items(), key=lambda item: "prefer" not in item[0])
+        if isinstance(value, str)
+    ]
+    for issue in issues:
+        if issue.kind == "options":
+            preferred[issue.key] = next(
+                (value for value in goal_strings if value in issue.options),
+                issue.options[0] if issue.options else "",
+            )
+        elif issue.kind == "areas":
+            controlled = [
+                area
+                for key, value in goals.items()
+                if "control" in key and "must" in key and isinstance(value, list)
+                for area in value
+                if area in issue.options
+            ]
+            preferred[issue.key] = tuple(controlled)
+    return preferred
+
+
+def build_negotiation_space(scenario: dict[str, Any]) -> NegotiationSpace:
+    all_issues = build_issues(scenario)
+    issues = [issue for issue in all_issues if issue.is_numeric]
+    categorical = [issue for issue in all_issues if not issue.is_numeric]
+    agents = [agent for agent in scenario.get("agents", []) if isinstance(agent, dict)]
+
+    shape = (len(agents), len(issues))
+    directions = np.ones(shape)
+    reservations = np.zeros(shape)
+    aspirations = np.zeros(shape)
+    weights = np.zeros(shape)
+    preferred_options = []
+    for row, agent in enumerate(agents):
+        goals = agent.get("private_goals", {})
+        goals = _flatten_goals(goals) if isinstance(goals, dict) else {}
+        for column, issue in enumerate(issues):
+            preference = _issue_preference(issue, goals)
+            if preference is None:
+                reservations[row, column] = aspirations[row, column] = (issue.low + issue.high) / 2
+                continue
+            directions[row, column], reservations[row, column], aspirations[row, column], weights[row, column] = preference
+        preferred_options.append(_preferred_options(categorical, goals))
+
+    return NegotiationSpace(
+        issues=tuple(issues),
+        categorical_issues=tuple(categorical),
+        agent_ids=tuple(str(agent.get("id", "")) for agent in agents),
+        agent_names=tuple(str(agent.get("name", "")) for agent in agents),
+        directions=directions,
+        reservations=reservations,
+        aspirations=aspirations,
+        weights=weights,
+        preferred_options=tuple(preferred_options),
+    )
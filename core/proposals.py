@@ -0,0 +1,296 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from core.negotiation_space import Issue, NegotiationSpace
+
+
+PROPOSAL_MARKER = re.compile(r"PROPOSAL\s*:", re.IGNORECASE)
+# "- **Base Salary**: €72,000" / "2. Equity: 55% for me, 45% for other party"
+PROPOSAL_LINE = re.compile(r"^\s*(?:[-*•]|\d+[.)])?\s*\**\s*([A-Za-z][^:\n*]*?)\s*\**\s*:\s*\**\s*(.+?)\s*$", re.MULTILINE)
+_FIGURE = r"(\d{1,3}(?:[,.]\d{3})+|\d+(?:\.\d+)?)\s*([kK]\b)?"
+# "€72,000", "72.5k", or a range "€70-75k" / "70k to 75k" (groups 3-4 hold the upper end).
+NUMBER = re.compile(rf"{_FIGURE}(?:\s*(?:[-–—]|\bto\b)\s*[€$£]?\s*{_FIGURE})?")
+OTHER_PARTY = re.compile(r"\bother\s+part(?:y|ies)\b|\byou\s+control\b", re.IGNORECASE)
+
+
+@dataclass
+class ParsedProposal:
+    """Terms of one PROPOSAL block, in its author's frame ("for me" = the author)."""
+
+    values: dict[str, float] = field(default_factory=dict)
+    choices: dict[str, Any] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.values or self.choices)
+
+    def to_offer(self) -> dict[str, Any]:
+        """Typed terms per `resources_to_negotiate` key, JSON-serializable.
+
+        Shares and amounts are floats, budget categories a {category: amount}
+        dict, control areas the list the author keeps, options the chosen label.
+        """
+        offer: dict[str, Any] = {}
+        for key, value in self.values.items():
+            resource, _, category = key.partition(".")
+            if category:
+                offer.setdefault(resource, {})[category] = value
+            else:
+                offer[key] = value
+        for key, choice in self.choices.items():
+            offer[key] = list(choice) if isinstance(choice, tuple) else choice
+        return offer
+
+
+def parse_number(token: str, suffix: str | None = None) -> float:
+    if re.fullmatch(r"\d{1,3}(?:[,.]\d{3})+", token):
+        token = re.sub(r"[,.]", "", token)
+    value = float(token)
+    return value * 1000 if suffix else value
+
+
+def parse_figure(match: re.Match) -> float | None:
+    """Value of a NUMBER match; a range reads as its midpoint.
+
+    A trailing "k" scales both ends ("70-75k"); a range scaled only at its
+    start ("70k-75") is ambiguous and reads as None.
+    """
+    low, low_suffix, high, high_suffix = match.group(1, 2, 3, 4)
+    if high is None:
+        return parse_number(low, low_suffix)
+    if low_suffix and not high_suffix:
+        return None
+    return (parse_number(low, high_suffix) + parse_number(high, high_suffix)) / 2
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+class ProposalParser:
+    """Reads the PROPOSAL block format produced by utils.build_system_prompt.
+
+    Patterns are compiled once per negotiation space; a line is matched to a
+    resource by its label, then read according to the issue kind.
+    """
+
+    def __init__(self, space: NegotiationSpace):
+        self.space = space
+        self._resources: dict[str, list[Issue]] = {}
+        for issue in (*space.issues, *space.categorical_issues):
+            self._resources.setdefault(issue.group or issue.key, []).append(issue)
+        self._labels = {_normalize(resource): resource for resource in self._resources}
+        self._category_patterns = {
+            issue.key: re.compile(
+                rf"\b{re.escape(issue.key.split('.', 1)[1].replace('_', ' '))}\b[^\d\n]{{0,24}}?{NUMBER.pattern}",
+                re.IGNORECASE,
+            )
+            for issue in space.issues
+            if issue.group
+        }
+        self._option_patterns = {
+            issue.key: [
+                (option, re.compile(rf"\b{re.escape(_normalize(option))}\b"))
+                for option in sorted(issue.options, key=len, reverse=True)
+            ]
+            for issue in space.categorical_issues
+        }
+
+    def _resource_for(self, label: str) -> str | None:
+        normalized = _normalize(label)
+        if normalized in self._labels:
+            return self._labels[normalized]
+        for resource_label, resource in self._labels.items():
+            if resource_label in normalized or (normalized and normalized in resource_label):
+                return resource
+        return None
+
+    def extract(self, text: str) -> dict[str, Any] | None:
+        """Typed offer of the last PROPOSAL block in `text`, or None without one."""
+        parsed = self.parse(text)
+        return parsed.to_offer() if parsed else None
+
+    def parse(self, text: str) -> ParsedProposal:
+        """Parse the last PROPOSAL block in `text`; empty if there is none."""
+        parsed = ParsedProposal()
+        markers = list(PROPOSAL_MARKER.finditer(text))
+        if not markers:
+            return parsed
+        for line in PROPOSAL_LINE.finditer(text, markers[-1].end()):
+            resource = self._resource_for(line.group(1))
+            if resource is None:
+                continue
+            for issue in self._resources[resource]:
+                self._read_issue(issue, line.group(2), parsed)
+        return parsed
+
+    def _read_issue(self, issue: Issue, body: str, parsed: ParsedProposal) -> None:
+        if issue.is_numeric:
+            # Shares: the first figure is the author's own ("X% for me, Y% for other party").
+            pattern = self._category_patterns[issue.key] if issue.group else NUMBER
+            match = pattern.search(body)
+            value = parse_figure(match) if match else None
+            if value is not None:
+                parsed.values[issue.key] = value
+        elif issue.kind == "areas":
+            mine = OTHER_PARTY.split(body, maxsplit=1)[0]
+            normalized = _normalize(mine)
+            parsed.choices[issue.key] = tuple(
+                option for option, pattern in self._option_patterns[issue.key] if pattern.search(normalized)
+            )
+        elif issue.kind == "options":
+            normalized = _normalize(body)
+            for option, pattern in self._option_patterns[issue.key]:
+                if pattern.search(normalized):
+                    parsed.choices[issue.key] = option
+                    break
+
+
+def offer_values(offer: dict[str, Any]) -> dict[str, float]:
+    """Numeric terms of a typed offer keyed like the space's issues (inverse of to_offer)."""
+    values: dict[str, float] = {}
+    for key, value in offer.items():
+        if isinstance(value, dict):
+            for category, amount in value.items():
+                if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+                    values[f"{key}.{category}"] = float(amount)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[key] = float(value)
+    return values
+
+
+def standing_offers(space: NegotiationSpace, history: list[dict[str, Any]]) -> tuple[np.ndarray, np.ndarray]:
+    """Rounds and the canonical offer on the table at the end of each, shaped (R, n_issues).
+
+    A term stays on the table until someone restates it, so every message's
+    terms are forward-filled over the earlier ones; terms nobody proposed yet are NaN.
+    """
+    rows, authors, event_rounds = [], [], []
+    for event in history:
+        offer = event.get("offer")
+        author = space.agent_index(event.get("agent", ""))
+        if isinstance(offer, dict) and author is not None:
+            values = offer_values(offer)
+            rows.append([values.get(issue.key, np.nan) for issue in space.issues])
+            authors.append(author)
+            event_rounds.append(event.get("round", 0))
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty((0, len(space.issues)))
+
+    own = np.array(rows, dtype=float).reshape(len(rows), len(space.issues))
+    shares = np.array([issue.kind == "share" for issue in space.issues], dtype=bool)
+    others = max(len(space.agent_ids) - 1, 1)
+    from_others = (np.array(authors) != 0)[:, np.newaxis] & shares
+    canonical = np.where(from_others, space.highs - own * others, own)
+
+    # Forward fill: index of the latest event that stated each term.
+    stated = np.where(np.isnan(canonical), 0, np.arange(len(canonical))[:, np.newaxis])
+    latest = np.maximum.accumulate(stated, axis=0)
+    filled = canonical[latest, np.arange(canonical.shape[1])]
+
+    event_rounds = np.array(event_rounds, dtype=np.int64)
+    rounds, last_in_round = np.unique(event_rounds[::-1], return_index=True)
+    return rounds, filled[len(filled) - 1 - last_in_round]
+
+
+def local_utility_history(space: NegotiationSpace, history: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Each agent's utility of the standing offer per round, scored against its private goals.
+
+    Deterministic counterpart of the judge's utility_total_history: all rounds
+    are scored in one NegotiationSpace.utilities call. Categorical terms
+    (control areas, options) carry no numeric utility and are not scored.
+    """
+    rounds, offers = standing_offers(space, history)
+    if not len(rounds):
+        return []
+    utilities = np.round(space.utilities(offers), 4)
+    return [
+        {"round": int(round_id), "utilities": dict(zip(space.agent_names, map(float, row)))}
+        for round_id, row in zip(rounds, utilities)
+    ]
+
+
+def offer_convergence(space: NegotiationSpace, history: list[dict[str, Any]]) -> dict[str, Any]:
+    """Distance between the latest offers of each agent, per resource, in [0, 1].
+
+    A share gap is the over-claim (sum of own shares above the total) once
+    every agent has claimed; an amount gap is the spread of the figures on
+    the table over the issue's range. 0 means the offers are compatible.
+    `gap` is the mean over the resources that can be compared, else None.
+    """
+    latest: dict[str, dict[str, Any]] = {}
+    for event in history:
+        offer = event.get("offer")
+        if isinstance(offer, dict) and offer:
+            latest[event.get("agent", "")] = offer
+
+    gaps: dict[str, list[float]] = {}
+    for issue in space.issues:
+        resource, _, category = issue.key.partition(".")
+        figures = []
+        for offer in latest.values():
+            value = offer.get(resource)
+            if category:
+                value = value.get(category) if isinstance(value, dict) else None
+            if isinstance(value, (int, float)):
+                figures.append(float(value))
+        span = issue.high - issue.low
+        if issue.kind == "share":
+            if len(figures) < len(space.agent_ids) or issue.high <= 0:
+                continue
+            gap = max(sum(figures) - issue.high, 0.0) / issue.high
+        else:
+            if len(figures) < 2 or span <= 0:
+                continue
+            gap = (max(figures) - min(figures)) / span
+        gaps.setdefault(resource, []).append(min(gap, 1.0))
+
+    issues = {resource: sum(values) / len(values) for resource, values in gaps.items()}
+    return {
+        "gap": sum(issues.values()) / len(issues) if issues else None,
+        "issues": issues,
+    }
+
+
+def _format_amount(value: float, unit: str) -> str:
+    if unit.upper() in {"EUR", "€"}:
+        return f"€{value:,.0f}"
+    if unit.upper() == "USD":
+        return f"${value:,.0f}"
+    if unit == "%":
+        return f"{value:g}%"
+    return f"{value:g} {unit}".strip()
+
+
+def format_proposal(space: NegotiationSpace, own_values: Any, choices: dict[str, Any]) -> str:
+    """Render a PROPOSAL block in the prompt's format, from the author's frame."""
+    lines = ["PROPOSAL:"]
+    groups: dict[str, list[str]] = {}
+    n_others = max(len(space.agent_ids) - 1, 1)
+    for column, issue in enumerate(space.issues):
+        value = float(own_values[column])
+        if issue.group:
+            category = issue.key.split(".", 1)[1]
+            groups.setdefault(issue.group, []).append(f"{category} {_format_amount(value, issue.unit)}")
+            continue
+        if issue.kind == "share":
+            other = (issue.high - value) / n_others
+            lines.append(f"- {issue.label}: {value:g}% for me, {other:g}% for other party")
+        else:
+            lines.append(f"- {issue.label}: {_format_amount(value, issue.unit)}")
+    for group, parts in groups.items():
+        lines.append(f"- {group.replace('_', ' ').title()}: {', '.join(parts)}")
+    for issue in space.categorical_issues:
+        choice = choices.get(issue.key)
+        if issue.kind == "areas":
+            mine = list(choice or ())
+            others = [area for area in issue.options if area not in mine]
+            lines.append(
+                f"- {issue.label}: I control {', '.join(mine) or 'none'}, "
+                f"other party controls {', '.join(others) or 'none'}"
+            )
+        elif choice:
+            lines.append(f"- {issue.label}: {choice}")
+    return "\n".join(lines)
@@ -0,0 +1,118 @@
+import random
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator
+
+
+TURN_ORDERS = {"round_robin", "random", "moderator", "addressed_only"}
+
+# (candidate agents, history so far) -> chosen agent name, or None to end the round.
+SpeakerChooser = Callable[[list[Any], list[dict[str, str]]], str | None]
+
+
+class TurnScheduler(ABC):
+    """Decides which agents speak in a round, and in which order.
+
+    `turns` is a generator: in sequential rounds it is resumed after each reply,
+    so a scheduler can react to what was just said. Each agent is yielded at
+    most once per round.
+    """
+
+    @abstractmethod
+    def turns(self, agents: list[Any], history: list[dict[str, str]], round_index: int) -> Iterator[Any]:
+        ...
+
+
+class RoundRobinScheduler(TurnScheduler):
+    # Every agent once per round, in scenario order (the original behaviour).
+    def turns(self, agents, history, round_index):
+        yield from agents
+
+
+class SeededRandomScheduler(TurnScheduler):
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def turns(self, agents, history, round_index):
+        # Seeded per round so a replay, or a fork of the run, gets the same order.
+        order = list(agents)
+        random.Random(f"{self.seed}:{round_index}").shuffle(order)
+        yield from order
+
+
+class ModeratorScheduler(TurnScheduler):
+    """A moderator picks the next speaker among those who have not spoken yet.
+
+    Without a chooser (or when it declines the first pick) the agent heard
+    least so far is seated, so every round has at least one speaker.
+    """
+
+    def __init__(self, choose_speaker: SpeakerChooser | None = None):
+        self.choose_speaker = choose_speaker
+
+    def turns(self, agents, history, round_index):
+        remaining = list(agents)
+        while remaining:
+            chosen = None
+            if self.choose_speaker is not None:
+                chosen_name = self.choose_speaker(remaining, history)
+                chosen = next((agent for agent in remaining if agent.spec.name == chosen_name), None)
+                if chosen is None and len(remaining) < len(agents):
+                    return
+            if chosen is None:
+                chosen = _least_heard(remaining, history)
+            remaining.remove(chosen)
+            yield chosen
+
+
+class AddressedOnlyScheduler(TurnScheduler):
+    """Only agents named in the previous message speak.
+
+    If the previous message addresses nobody, everyone except its author
+    speaks, so the negotiation cannot stall on an unaddressed message.
+    """
+
+    def turns(self, agents, history, round_index):
+        if not history:
+            yield from agents
+            return
+
+        last_event = history[-1]
+        others = [agent for agent in agents if agent.spec.name != last_event.get("agent")]
+        content = str(last_event.get("content", ""))
+        addressed = [agent for agent in others if _is_addressed(agent, content)]
+        yield from addressed or others
+
+
+def _least_heard(agents: list[Any], history: list[dict[str, str]]) -> Any:
+    spoken = {agent.spec.name: 0 for agent in agents}
+    for event in history:
+        if event.get("agent") in spoken:
+            spoken[event["agent"]] += 1
+    return min(agents, key=lambda agent: spoken[agent.spec.name])
+
+
+def _is_addressed(agent: Any, content: str) -> bool:
+    # Match the agent id, full name or first name as whole words.
+    name = agent.spec.name.strip()
+    candidates = {agent.spec.id, name, name.split(" ")[0] if name else ""}
+    for candidate in candidates:
+        if len(candidate) < 2 or candidate.lower() in {"the", "agent"}:
+            continue
+        if re.search(rf"(?<!\w){re.escape(candidate)}(?!\w)", content, flags=re.IGNORECASE):
+            return True
+    return False
+
+
+def build_scheduler(
+    turn_order: str,
+    seed: int = 0,
+    choose_speaker: SpeakerChooser | None = None,
+) -> TurnScheduler:
+    if turn_order == "random":
+        return SeededRandomScheduler(seed)
+    if turn_order == "moderator":
+        return ModeratorScheduler(choose_speaker)
+    if turn_order == "addressed_only":
+        return AddressedOnlyScheduler()
+    return RoundRobinScheduler()
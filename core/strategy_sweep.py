@@ -0,0 +1,257 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from core.baselines import BASELINE_STRATEGIES, TIME_DEPENDENT_EXPONENTS
+from core.negotiation_space import NegotiationSpace
+
+
+# Strategy kinds of a population; time-dependent agents also carry an exponent.
+TIME_DEPENDENT, TIT_FOR_TAT, HARDLINER = 0, 1, 2
+EXPONENT_RANGE = (0.05, 20.0)
+SWEEP_CHUNK_TRIALS = 250_000
+
+
+@dataclass(frozen=True)
+class StrategyPopulation:
+    """One strategy per (trial, agent): kinds (M, n_agents) and exponents (M, n_agents)."""
+
+    kinds: np.ndarray
+    exponents: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def labels(self) -> np.ndarray:
+        """Named strategy per (trial, agent); exponents below 1 read as Boulware."""
+        return np.select(
+            [self.kinds == TIT_FOR_TAT, self.kinds == HARDLINER, self.exponents < 1.0],
+            ["tit_for_tat", "hardliner", "boulware"],
+            default="conceder",
+        )
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    population: StrategyPopulation
+    agreement: np.ndarray
+    rounds: np.ndarray
+    offers: np.ndarray
+    utilities: np.ndarray
+
+
+def named_population(n_agents: int) -> StrategyPopulation:
+    """Every combination of the named baseline strategies, one trial each."""
+    codes = {
+        "boulware": (TIME_DEPENDENT, TIME_DEPENDENT_EXPONENTS["boulware"]),
+        "conceder": (TIME_DEPENDENT, TIME_DEPENDENT_EXPONENTS["conceder"]),
+        "tit_for_tat": (TIT_FOR_TAT, 1.0),
+        "hardliner": (HARDLINER, 1.0),
+    }
+    grid = np.array(np.meshgrid(*[np.arange(len(BASELINE_STRATEGIES))] * n_agents, indexing="ij"))
+    combos = grid.reshape(n_agents, -1).T
+    kinds = np.array([[codes[BASELINE_STRATEGIES[c]][0] for c in row] for row in combos], dtype=np.int8)
+    exponents = np.array([[codes[BASELINE_STRATEGIES[c]][1] for c in row] for row in combos])
+    return StrategyPopulation(kinds, exponents)
+
+
+def sample_population(n_agents: int, trials: int, seed: int = 0) -> StrategyPopulation:
+    """Random population: tit-for-tat and hardliners at 10% each, the rest
+    time-dependent with log-uniform exponents over EXPONENT_RANGE."""
+    rng = np.random.default_rng(seed)
+    kinds = rng.choice(
+        np.array([TIME_DEPENDENT, TIT_FOR_TAT, HARDLINER], dtype=np.int8),
+        size=(trials, n_agents),
+        p=[0.8, 0.1, 0.1],
+    )
+    low, high = np.log(EXPONENT_RANGE[0]), np.log(EXPONENT_RANGE[1])
+    exponents = np.exp(rng.uniform(low, high, size=(trials, n_agents)))
+    return StrategyPopulation(kinds, exponents)
+
+
+def simulate_population(space: NegotiationSpace, population: StrategyPopulation, max_rounds: int = 10) -> SweepResult:
+    """Run every trial of `population` at once; same rules as run_baseline_negotiation.
+
+    Offers live in an (M, n_issues) array in the space's canonical frame and
+    each turn is a handful of array operations over all undecided trials.
+    Large populations are processed in chunks to bound memory.
+    """
+    parts = [
+        _simulate_chunk(
+            space,
+            population.kinds[start:start + SWEEP_CHUNK_TRIALS],
+            population.exponents[start:start + SWEEP_CHUNK_TRIALS],
+            max_rounds,
+        )
+        for start in range(0, len(population), SWEEP_CHUNK_TRIALS)
+    ]
+    agreement, rounds, offers, utilities = (np.concatenate(arrays) for arrays in zip(*parts))
+    return SweepResult(population, agreement, rounds, offers, utilities)
+
+
+@dataclass(frozen=True)
+class _AgentTerms:
+    # One agent's preferences restricted to the columns it has goals on.
+    columns: np.ndarray
+    reservations: np.ndarray
+    scales: np.ndarray
+    flat: np.ndarray
+    directions: np.ndarray
+    weights: np.ndarray
+    indifferent: np.ndarray
+    base: np.ndarray
+    span: np.ndarray
+
+
+def _agent_terms(space: NegotiationSpace, agent: int) -> _AgentTerms:
+    weighted = space.weights[agent] > 0
+    columns = np.flatnonzero(weighted)
+    reservations = space.reservations[agent]
+    aspirations = space.aspirations[agent]
+    span = aspirations - reservations
+    total_weight = space.weights[agent].sum() or 1.0
+    return _AgentTerms(
+        columns=columns,
+        reservations=reservations[columns],
+        scales=np.divide(1.0, span[columns], out=np.zeros(len(columns)), where=span[columns] != 0),
+        flat=span[columns] == 0,
+        directions=space.directions[agent][columns],
+        weights=space.weights[agent][columns] / total_weight,
+        indifferent=np.flatnonzero(~weighted),
+        base=reservations,
+        span=span,
+    )
+
+
+def _view_columns(space: NegotiationSpace, canonical: np.ndarray, agent: int, columns: np.ndarray) -> np.ndarray:
+    """`agent`'s own view of canonical offers, for the given columns only."""
+    view = canonical if len(columns) == canonical.shape[1] else canonical[:, columns]
+    if agent == 0:
+        return view
+    others = max(len(space.agent_ids) - 1, 1)
+    for position, column in enumerate(columns):
+        if space.issues[column].kind == "share":
+            if view is canonical:
+                view = canonical.copy()
+            view[:, position] = (space.issues[column].high - view[:, position]) / others
+    return view
+
+
+def _simulate_chunk(space: NegotiationSpace, kinds: np.ndarray, exponents: np.ndarray, max_rounds: int):
+    trials, n_agents = kinds.shape
+    n_issues = len(space.issues)
+    lows, highs = space.lows, space.highs
+    steps = np.where(highs - lows >= 10000, 100.0, 1.0)
+    terms = [_agent_terms(space, agent) for agent in range(n_agents)]
+
+    agreement = np.zeros(trials, dtype=bool)
+    rounds = np.full(trials, max_rounds, dtype=np.int64)
+    offers = np.full((trials, n_issues), np.nan)
+
+    # State of the trials still negotiating; settled trials are dropped at each round boundary.
+    live = np.arange(trials)
+    kinds = kinds.copy()
+    inverse_exponents = 1.0 / exponents
+    standing = offers.copy()
+    has_offer = np.zeros(trials, dtype=bool)
+    acceptances = np.zeros(trials, dtype=np.int64)
+    received_count = np.zeros((trials, n_agents), dtype=np.int64)
+    first_received = np.zeros((trials, n_agents))
+    last_received = np.zeros((trials, n_agents))
+
+    for round_index in range(max_rounds):
+        t = round_index / max(max_rounds - 1, 1)
+        done = np.zeros(len(live), dtype=bool)
+        for agent, agent_terms in enumerate(terms):
+            responding = ~done & has_offer
+
+            # Offers on the table are always complete, so no NaN handling is needed
+            # where `responding` holds; rows without an offer are masked out below.
+            gap = _view_columns(space, standing, agent, agent_terms.columns) - agent_terms.reservations
+            scaled = np.clip(gap * agent_terms.scales, 0.0, 1.0)
+            if agent_terms.flat.any():
+                scaled = np.where(agent_terms.flat, agent_terms.directions * gap >= 0, scaled)
+            utility = scaled @ agent_terms.weights
+            acceptable = (agent_terms.directions * gap >= -1e-9).all(axis=1)
+
+            received_count[:, agent] += responding
+            first_received[:, agent] = np.where(
+                responding & (received_count[:, agent] == 1), utility, first_received[:, agent]
+            )
+            last_received[:, agent] = np.where(responding, utility, last_received[:, agent])
+
+            kind = kinds[:, agent]
+            time_target = 1.0 - t ** inverse_exponents[:, agent]
+            mirror_target = np.where(
+                received_count[:, agent] < 2,
+                1.0,
+                np.clip(1.0 - (last_received[:, agent] - first_received[:, agent]), 0.0, 1.0),
+            )
+            target = np.select([kind == TIT_FOR_TAT, kind == HARDLINER], [mirror_target, 1.0], default=time_target)
+
+            accept = responding & acceptable & (utility >= target - 1e-9)
+            acceptances[accept] += 1
+            agreed = accept & (acceptances >= n_agents - 1)
+            agreement[live[agreed]] = True
+            rounds[live[agreed]] = round_index + 1
+            done |= agreed
+
+            proposing = ~done & ~accept
+            if not proposing.any():
+                continue
+            # Computed for every live trial: masking at the end is cheaper than gathering rows.
+            own = agent_terms.base + target[:, np.newaxis] * agent_terms.span
+            if len(agent_terms.indifferent):
+                # Terms this agent has no goal on follow the standing offer.
+                offered = _view_columns(space, standing, agent, agent_terms.indifferent)
+                own[:, agent_terms.indifferent] = np.where(
+                    np.isnan(offered), own[:, agent_terms.indifferent], offered
+                )
+            indifferent = space.weights[agent] == 0
+            for total, columns in space.category_groups:
+                for column in sorted(columns, key=lambda c: not indifferent[c]):
+                    slack = total - own[:, columns].sum(axis=1)
+                    own[:, column] = np.clip(own[:, column] + slack, lows[column], highs[column])
+            own = np.round(own / steps) * steps
+            standing = np.where(proposing[:, np.newaxis], space.to_canonical(own, agent), standing)
+            has_offer |= proposing
+            acceptances[proposing] = 0
+
+        offers[live] = standing
+        if done.any():
+            keep = ~done
+            live, standing, has_offer, acceptances = live[keep], standing[keep], has_offer[keep], acceptances[keep]
+            kinds, inverse_exponents = kinds[keep], inverse_exponents[keep]
+            received_count, first_received, last_received = (
+                received_count[keep],
+                first_received[keep],
+                last_received[keep],
+            )
+        if not len(live):
+            break
+
+    made_offer = ~np.isnan(offers).all(axis=1)
+    utilities = np.where(made_offer[:, np.newaxis], space.utilities(np.nan_to_num(offers)), 0.0)
+    return agreement, rounds, offers, utilities
+
+
+def summarize_sweep(result: SweepResult, agent_names: tuple[str, ...]) -> pd.DataFrame:
+    """Agreement rate, rounds to agreement and mean utilities per named strategy combination."""
+    labels = result.population.labels()
+    frame = pd.DataFrame({name: labels[:, index] for index, name in enumerate(agent_names)})
+    frame["agreement"] = result.agreement
+    frame["rounds_to_agreement"] = np.where(result.agreement, result.rounds, np.nan)
+    utility_columns = []
+    for index, name in enumerate(agent_names):
+        column = f"utility {name}"
+        frame[column] = np.where(result.agreement, result.utilities[:, index], np.nan)
+        utility_columns.append(column)
+
+    summary = frame.groupby(list(agent_names), as_index=False).agg(
+        trials=("agreement", "size"),
+        agreement_rate=("agreement", "mean"),
+        rounds_to_agreement=("rounds_to_agreement", "mean"),
+        **{column: (column, "mean") for column in utility_columns},
+    )
+    return summary.sort_values("agreement_rate", ascending=False, kind="stable").reset_index(drop=True)
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from round_ledger import get_evaluations_df
+
+
+METRIC_ALIASES = {
+    "fairness": ["fairness", "perceived_fairness"],
+    "manipulativeness": ["manipulativeness", "manipulation_risk"],
+}
+NON_NUMERIC_METRIC_TYPES = {"boolean", "enum", "multiclass", "categorical"}
+
+
+def is_numeric_metric(metric_spec: dict) -> bool:
+    metric_type = str(metric_spec.get("type", "")).lower()
+    return metric_type not in NON_NUMERIC_METRIC_TYPES
+
+
+def utility_sign(metric_spec: dict) -> int:
+    utility_score = str(metric_spec.get("utility_score", "positive")).strip().lower()
+    if utility_score in {"negative", "minus", "-1"}:
+        return -1
+    return 1
+
+
+def metric_aliases(metric_name: str) -> list[str]:
+    aliases = METRIC_ALIASES.get(metric_name, [metric_name])
+    if metric_name not in aliases:
+        return [metric_name] + aliases
+    return aliases
+
+
+def numeric_metric_names(metric_specs: dict) -> list[str]:
+    if not isinstance(metric_specs, dict):
+        return []
+    return [
+        metric_name
+        for metric_name, metric_spec in metric_specs.items()
+        if isinstance(metric_spec, dict) and is_numeric_metric(metric_spec)
+    ]
+
+
+@dataclass(frozen=True)
+class RoundMetrics:
+    """Per-round numeric judge metrics for one run, one row per round."""
+
+    rounds: np.ndarray
+    metric_names: tuple[str, ...]
+    values: np.ndarray
+    signs: np.ndarray
+    utility_totals: np.ndarray
+
+    def metrics_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame(self.values, columns=list(self.metric_names))
+        frame.insert(0, "Round", self.rounds)
+        return frame
+
+    def utility_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"Round": self.rounds, "Utility Total": self.utility_totals})
+
+    def utility_history(self) -> list[dict]:
+        return [
+            {
+                "round": int(round_id),
+                "utility_total": None if np.isnan(total) else int(total),
+            }
+            for round_id, total in zip(self.rounds, self.utility_totals)
+        ]
+
+
+def _metric_column(evaluations_df: pd.DataFrame, metric_name: str) -> np.ndarray:
+    # First alias with a value wins, truncated like int() on the raw judge output.
+    resolved = np.full(len(evaluations_df), np.nan)
+    for key in metric_aliases(metric_name):
+        if key not in evaluations_df.columns:
+            continue
+        alias_values = pd.to_numeric(evaluations_df[key], errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        resolved = np.where(np.isnan(resolved), np.trunc(alias_values), resolved)
+    return resolved
+
+
+def build_round_metrics(
+    evaluations_df: pd.DataFrame,
+    metric_names: list[str],
+    metric_specs: dict,
+) -> RoundMetrics:
+    if "round" in evaluations_df.columns:
+        evaluations_df = evaluations_df.sort_values("round", kind="stable")
+        rounds = (
+            pd.to_numeric(evaluations_df["round"], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+        )
+    else:
+        rounds = np.arange(1, len(evaluations_df) + 1, dtype=np.int64)
+
+    if metric_names:
+        values = np.column_stack(
+            [_metric_column(evaluations_df, metric_name) for metric_name in metric_names]
+        )
+    else:
+        values = np.empty((len(evaluations_df), 0))
+    signs = np.array(
+        [utility_sign(metric_specs.get(metric_name, {})) for metric_name in metric_names],
+        dtype=float,
+    )
+
+    present = ~np.isnan(values)
+    utility_totals = np.where(present, values, 0.0) @ signs
+    utility_totals = np.where(present.any(axis=1), utility_totals, np.nan)
+    return RoundMetrics(
+        rounds=rounds,
+        metric_names=tuple(metric_names),
+        values=values,
+        signs=signs,
+        utility_totals=utility_totals,
+    )
+
+
+def get_round_metrics(metric_specs: dict, default_metric_names: list[str] | None = None) -> RoundMetrics:
+    """Return the active run's metric matrix, memoized per (run_id, round count)."""
+    if not isinstance(metric_specs, dict):
+        metric_specs = {}
+    metric_names = numeric_metric_names(metric_specs) or list(default_metric_names or [])
+    evaluations_df = get_evaluations_df()
+    cache_key = (
+        st.session_state.get("run_id"),
+        len(evaluations_df),
+        tuple(metric_names),
+        tuple(utility_sign(metric_specs.get(name, {})) for name in metric_names),
+    )
+    cache = st.session_state.get("round_metrics_cache")
+    if not isinstance(cache, dict) or any(key[:2] != cache_key[:2] for key in cache):
+        cache = {}
+        st.session_state.round_metrics_cache = cache
+    if cache_key not in cache:
+        cache[cache_key] = build_round_metrics(evaluations_df, metric_names, metric_specs)
+    return cache[cache_key]
@@ -0,0 +1,77 @@
+"""Report how much each page adds to cold start through its module-level imports.
+
+Usage: python import_cost_report.py
+
+Every page's top-level import statements run in a fresh interpreter (after
+``import streamlit``, which app.py always pays for) under ``-X importtime``.
+Imports placed inside functions are deliberately not counted: they are only
+paid for when that code path runs.
+"""
+
+import ast
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+
+PAGES_DIR = Path("pages")
+MARKER = "--page-imports--"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+TOP_MODULES = 4
+
+
+def _top_level_imports(page_path: Path) -> str:
+    tree = ast.parse(page_path.read_text(encoding="utf-8"))
+    statements = [
+        ast.unparse(node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    return "\n".join(statements)
+
+
+def _measure(import_code: str) -> tuple[float, list[tuple[str, float]]]:
+    script = "\n".join(
+        [
+            "import sys, time",
+            "import streamlit",
+            f"sys.stderr.write({MARKER!r} + '\\n')",
+            "started_at = time.perf_counter()",
+            import_code,
+            "print((time.perf_counter() - started_at) * 1000.0)",
+        ]
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    page_lines = completed.stderr.split(MARKER, 1)[-1].splitlines()
+
+    # Only direct imports (no indentation) so nested modules are not double counted.
+    modules = []
+    for line in page_lines:
+        match = IMPORTTIME_LINE.match(line)
+        if match and not match.group(3):
+            modules.append((match.group(4), int(match.group(2)) / 1000.0))
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return float(completed.stdout.strip().splitlines()[-1]), modules
+
+
+def main() -> None:
+    rows = []
+    for page_path in sorted(PAGES_DIR.glob("*.py")):
+        total_ms, modules = _measure(_top_level_imports(page_path))
+        heaviest = ", ".join(f"{name} {ms:.0f}ms" for name, ms in modules[:TOP_MODULES])
+        rows.append((page_path.stem, total_ms, heaviest or "-"))
+
+    name_width = max(len(row[0]) for row in rows)
+    print(f"{'page'.ljust(name_width)}  {'imports':>9}  heaviest modules")
+    for name, total_ms, heaviest in sorted(rows, key=lambda row: row[1], reverse=True):
+        print(f"{name.ljust(name_width)}  {total_ms:>7.0f}ms  {heaviest}")
+
+
+if __name__ == "__main__":
+    main()
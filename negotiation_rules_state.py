@@ -17,8 +17,22 @@ DEFAULT_RULES = {
     "agents_temperature": 0.3,
     "judge_temperature": 0.1,
     "final_judge_temperature": 0.1,
+    "turn_protocol": "sequential",
+    "turn_order": "round_robin",
+    "turn_order_seed": 0,
+    "baseline_agents": {},
+    "judge_ensemble_size": 1,
+    "judge_ensemble_models": [],
+    "judge_cascade_model": "",
+    "judge_cascade_min_confidence": 7,
+    "judge_cascade_max_swing": 3,
+    "judge_annotate_every": 1,
 }
 MODE_OPTIONS = {"cooperative", "competitive", "mixed"}
+TURN_PROTOCOL_OPTIONS = {"sequential", "simultaneous"}
+TURN_ORDER_OPTIONS = {"round_robin", "random", "moderator", "addressed_only"}
+BASELINE_STRATEGY_OPTIONS = {"boulware", "conceder", "tit_for_tat", "hardliner"}
+MAX_JUDGE_ENSEMBLE_SIZE = 5
 
 
 def _read_rule_value(value: Any, default: Any) -> Any:
@@ -43,6 +57,48 @@ def _normalize_temperature(value: Any, default: float) -> float:
     return round(normalized, 1)
 
 
+def _normalize_baseline_agents(value: Any) -> dict[str, str]:
+    # agent id -> rule-based strategy; agents not listed are played by the LLM.
+    raw = _read_rule_value(value, {})
+    if not isinstance(raw, dict):
+        return {}
+    return {
+        str(agent_id): str(strategy).strip().lower()
+        for agent_id, strategy in raw.items()
+        if str(strategy).strip().lower() in BASELINE_STRATEGY_OPTIONS
+    }
+
+
+def _normalize_ensemble_size(value: Any) -> int:
+    raw = _read_rule_value(value, DEFAULT_RULES["judge_ensemble_size"])
+    if not isinstance(raw, int) or isinstance(raw, bool):
+        return DEFAULT_RULES["judge_ensemble_size"]
+    return min(max(raw, 1), MAX_JUDGE_ENSEMBLE_SIZE)
+
+
+def _normalize_model_list(value: Any) -> list[str]:
+    raw = _read_rule_value(value, [])
+    if not isinstance(raw, list):
+        return []
+    return [str(model).strip() for model in raw if str(model).strip()]
+
+
+def _normalize_score(value: Any, default: int) -> int:
+    # Integer on the judges' 0-10 scale.
+    raw = _read_rule_value(value, default)
+    if not isinstance(raw, int) or isinstance(raw, bool):
+        return default
+    return min(max(raw, 0), 10)
+
+
+def _normalize_annotate_every(value: Any) -> int:
+    # 1 = full annotation every round; N > 1 = status-only rounds between checkpoints.
+    raw = _read_rule_value(value, DEFAULT_RULES["judge_annotate_every"])
+    if not isinstance(raw, int) or isinstance(raw, bool) or raw < 1:
+        return DEFAULT_RULES["judge_annotate_every"]
+    return raw
+
+
 def _normalize_rules(raw_rules: dict[str, Any]) -> dict[str, Any]:
     max_rounds = _read_rule_value(raw_rules.get("max_rounds"), DEFAULT_RULES["max_rounds"])
     mode = str(_read_rule_value(raw_rules.get("mode"), DEFAULT_RULES["mode"])).strip().lower()
@@ -70,6 +126,13 @@ def _normalize_rules(raw_rules: dict[str, Any]) -> dict[str, Any]:
     final_judge_temperature = _normalize_temperature(
         raw_rules.get("final_judge_temperature"), judge_temperature
     )
+    turn_protocol = str(
+        _read_rule_value(raw_rules.get("turn_protocol"), DEFAULT_RULES["turn_protocol"])
+    ).strip().lower()
+    turn_order = str(
+        _read_rule_value(raw_rules.get("turn_order"), DEFAULT_RULES["turn_order"])
+    ).strip().lower()
+    turn_order_seed = _read_rule_value(raw_rules.get("turn_order_seed"), DEFAULT_RULES["turn_order_seed"])
 
     if not isinstance(max_rounds, int) or max_rounds < 1:
         max_rounds = DEFAULT_RULES["max_rounds"]
@@ -81,6 +144,12 @@ def _normalize_rules(raw_rules: dict[str, Any]) -> dict[str, Any]:
         judge_model = DEFAULT_RULES["judge_model"]
     if not final_judge_model:
         final_judge_model = judge_model
+    if turn_protocol not in TURN_PROTOCOL_OPTIONS:
+        turn_protocol = DEFAULT_RULES["turn_protocol"]
+    if turn_order not in TURN_ORDER_OPTIONS:
+        turn_order = DEFAULT_RULES["turn_order"]
+    if not isinstance(turn_order_seed, int) or isinstance(turn_order_seed, bool):
+        turn_order_seed = DEFAULT_RULES["turn_order_seed"]
 
     return {
         "max_rounds": int(max_rounds),
@@ -93,9 +162,28 @@ def _normalize_rules(raw_rules: dict[str, Any]) -> dict[str, Any]:
         "agents_temperature": agents_temperature,
         "judge_temperature": judge_temperature,
         "final_judge_temperature": final_judge_temperature,
+        "turn_protocol": turn_protocol,
+        "turn_order": turn_order,
+        "turn_order_seed": int(turn_order_seed),
+        "baseline_agents": _normalize_baseline_agents(raw_rules.get("baseline_agents")),
+        "judge_ensemble_size": _normalize_ensemble_size(raw_rules.get("judge_ensemble_size")),
+        "judge_ensemble_models": _normalize_model_list(raw_rules.get("judge_ensemble_models")),
+        "judge_cascade_model": str(_read_rule_value(raw_rules.get("judge_cascade_model"), "")).strip(),
+        "judge_cascade_min_confidence": _normalize_score(
+            raw_rules.get("judge_cascade_min_confidence"), DEFAULT_RULES["judge_cascade_min_confidence"]
+        ),
+        "judge_cascade_max_swing": _normalize_score(
+            raw_rules.get("judge_cascade_max_swing"), DEFAULT_RULES["judge_cascade_max_swing"]
+        ),
+        "judge_annotate_every": _normalize_annotate_every(raw_rules.get("judge_annotate_every")),
     }
 
 
+def normalize_rules(rules: dict[str, Any]) -> dict[str, Any]:
+    """Validated copy of a rules dict with defaults filled in, as the Negotiation Rules page saves it."""
+    return _normalize_rules(rules)
+
+
 def load_global_rules() -> dict[str, Any]:
     if not RULES_PATH.exists():
         return DEFAULT_RULES.copy()
@@ -1,6 +1,7 @@
 import streamlit as st
 
 from negotiation_rules_state import get_active_rules, save_global_rules, set_active_rules
+from scenario_state import get_active_scenario
 
 
 st.title("Negotiation Rules")
@@ -18,6 +19,9 @@ model_options = [
 ]
 
 mode_options = ["cooperative", "competitive", "mixed"]
+turn_protocol_options = ["sequential", "simultaneous"]
+turn_order_options = ["round_robin", "random", "moderator", "addressed_only"]
+agent_policy_options = ["llm", "boulware", "conceder", "tit_for_tat", "hardliner"]
 max_rounds_value = rules.get("max_rounds", 10)
 mode_value = str(rules.get("mode", "competitive")).strip().lower()
 allow_partial_value = rules.get("allow_partial_agreements", True)
@@ -28,9 +32,27 @@ final_judge_model_value = str(rules.get("final_judge_model", judge_model_value o
 agents_temperature_value = float(rules.get("agents_temperature", 0.3))
 judge_temperature_value = float(rules.get("judge_temperature", 0.1))
 final_judge_temperature_value = float(rules.get("final_judge_temperature", judge_temperature_value))
+turn_protocol_value = str(rules.get("turn_protocol", "sequential")).strip().lower()
+turn_order_value = str(rules.get("turn_order", "round_robin")).strip().lower()
+turn_order_seed_value = rules.get("turn_order_seed", 0)
+judge_ensemble_size_value = rules.get("judge_ensemble_size", 1)
+judge_ensemble_models_value = [
+    model for model in rules.get("judge_ensemble_models", []) if model in model_options
+]
+judge_cascade_model_value = str(rules.get("judge_cascade_model", "")).strip()
+judge_cascade_min_confidence_value = rules.get("judge_cascade_min_confidence", 7)
+judge_cascade_max_swing_value = rules.get("judge_cascade_max_swing", 3)
+judge_annotate_every_value = rules.get("judge_annotate_every", 1)
+baseline_agents_value = rules.get("baseline_agents", {})
+if not isinstance(baseline_agents_value, dict):
+    baseline_agents_value = {}
 
 if mode_value not in mode_options:
     mode_value = "competitive"
+if turn_protocol_value not in turn_protocol_options:
+    turn_protocol_value = "sequential"
+if turn_order_value not in turn_order_options:
+    turn_order_value = "round_robin"
 
 col_sx, col_dx = st.columns([3, 1], vertical_alignment="top", gap="large")
 with col_sx:
@@ -70,6 +92,72 @@ with col_sx:
                 value=bool(require_unanimous_value),
             )
             st.caption("Require all parties to explicitly agree before closing the negotiation.")
+
+        col1, col2 = st.columns([1, 1], vertical_alignment="top")
+        with col1:
+            turn_protocol = st.selectbox(
+                "Turn Protocol",
+                turn_protocol_options,
+                help=(
+                    "`sequential`: agents reply one after another, each to the previous message. "
+                    "`simultaneous`: all agents reply concurrently to the previous round's offers."
+                ),
+                index=turn_protocol_options.index(turn_protocol_value),
+            )
+        with col2:
+            turn_order = st.selectbox(
+                "Turn Order",
+                turn_order_options,
+                help=(
+                    "`round_robin`: every agent in scenario order. `random`: seeded shuffle per round. "
+                    "`moderator`: the round annotator model picks each next speaker. "
+                    "`addressed_only`: only agents named in the last message reply."
+                ),
+                index=turn_order_options.index(turn_order_value),
+            )
+            turn_order_seed = st.number_input(
+                "Turn Order Seed",
+                min_value=0,
+                step=1,
+                help="Seed for the `random` turn order; the same seed replays the same order.",
+                value=int(turn_order_seed_value) if isinstance(turn_order_seed_value, int) else 0,
+                disabled=turn_order != "random",
+            )
+    baseline_agents = dict(baseline_agents_value)
+    row_agents = st.container()
+    with row_agents:
+        st.subheader("Agent Policies")
+        _, active_scenario = get_active_scenario()
+        scenario_agents = active_scenario.get("agents", []) if isinstance(active_scenario, dict) else []
+        if not scenario_agents:
+            st.caption("Select a scenario to replace its agents with rule-based baselines.")
+        else:
+            st.caption(
+                "Rule-based baselines answer instantly without a model call and can sit at the same table as LLM agents."
+            )
+            policy_columns = st.columns(max(len(scenario_agents), 2), vertical_alignment="top")
+            for column, agent in zip(policy_columns, scenario_agents):
+                agent_id = str(agent.get("id", ""))
+                current_policy = baseline_agents.get(agent_id, "llm")
+                with column:
+                    policy = st.selectbox(
+                        str(agent.get("name", agent_id)),
+                        agent_policy_options,
+                        help=(
+                            "`llm`: the agent model plays this party. `boulware`: concedes late. "
+                            "`conceder`: concedes early. `tit_for_tat`: mirrors the other side's concessions. "
+                            "`hardliner`: never concedes."
+                        ),
+                        index=agent_policy_options.index(current_policy)
+                        if current_policy in agent_policy_options
+                        else 0,
+                        key=f"agent_policy_{agent_id}",
+                    )
+                if policy == "llm":
+                    baseline_agents.pop(agent_id, None)
+                else:
+                    baseline_agents[agent_id] = policy
+
     row_2 = st.container()
     with row_2:
         st.subheader("Models Settings")
@@ -110,6 +198,70 @@ with col_sx:
                 step=0.1,
                 value=max(0.0, min(2.0, round(judge_temperature_value, 1))),
             )
+            judge_ensemble_size = st.number_input(
+                "Annotators per Round",
+                min_value=1,
+                max_value=5,
+                step=1,
+                help=(
+                    "Above 1, that many annotators judge each round concurrently: majority vote on "
+                    "agreement status, median on numeric metrics, plus a disagreement score."
+                ),
+                value=int(judge_ensemble_size_value) if isinstance(judge_ensemble_size_value, int) else 1,
+            )
+            judge_ensemble_models = st.multiselect(
+                "Ensemble Models",
+                model_options,
+                default=judge_ensemble_models_value,
+                help="Models the annotators cycle through; empty uses the Annotator Model for all of them.",
+                disabled=judge_ensemble_size == 1,
+            )
+            cascade_options = ["", *model_options]
+            judge_cascade_model = st.selectbox(
+                "Screening Model",
+                cascade_options,
+                format_func=lambda model: model or "Off",
+                help=(
+                    "Cheaper model that annotates every round first. The annotators above are called only "
+                    "when it sees a terminal status, is unsure, or a metric swings sharply."
+                ),
+                index=cascade_options.index(judge_cascade_model_value)
+                if judge_cascade_model_value in cascade_options
+                else 0,
+            )
+            screening_col, swing_col = st.columns(2)
+            with screening_col:
+                judge_cascade_min_confidence = st.number_input(
+                    "Min Confidence",
+                    min_value=0,
+                    max_value=10,
+                    step=1,
+                    help="Screening verdicts with a lower self-reported confidence (0-10) are escalated.",
+                    value=int(judge_cascade_min_confidence_value)
+                    if isinstance(judge_cascade_min_confidence_value, int)
+                    else 7,
+                    disabled=not judge_cascade_model,
+                )
+            with swing_col:
+                judge_cascade_max_swing = st.number_input(
+                    "Max Metric Swing",
+                    min_value=0,
+                    max_value=10,
+                    step=1,
+                    help="Escalate when a numeric metric moves by more than this since the previous round.",
+                    value=int(judge_cascade_max_swing_value) if isinstance(judge_cascade_max_swing_value, int) else 3,
+                    disabled=not judge_cascade_model,
+                )
+            judge_annotate_every = st.number_input(
+                "Annotate Metrics Every N Rounds",
+                min_value=1,
+                step=1,
+                help=(
+                    "Above 1, each round only gets a short status check that decides termination; "
+                    "full metrics are annotated every N rounds and on the closing round."
+                ),
+                value=int(judge_annotate_every_value) if isinstance(judge_annotate_every_value, int) else 1,
+            )
         with col3:
             st.markdown("##### Final Judge")
             final_judge_model = st.selectbox(
@@ -144,6 +296,16 @@ updated_rules = {
     "agents_temperature": float(agents_temperature),
     "judge_temperature": float(judge_temperature),
     "final_judge_temperature": float(final_judge_temperature),
+    "turn_protocol": turn_protocol,
+    "turn_order": turn_order,
+    "turn_order_seed": int(turn_order_seed),
+    "baseline_agents": baseline_agents,
+    "judge_ensemble_size": int(judge_ensemble_size),
+    "judge_ensemble_models": list(judge_ensemble_models),
+    "judge_cascade_model": str(judge_cascade_model).strip(),
+    "judge_cascade_min_confidence": int(judge_cascade_min_confidence),
+    "judge_cascade_max_swing": int(judge_cascade_max_swing),
+    "judge_annotate_every": int(judge_annotate_every),
 }
 
 with col_dx:
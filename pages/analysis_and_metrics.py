@@ -1,34 +1,14 @@
-import pandas as pd
 import streamlit as st
-import plotly.express as px
+from round_ledger import get_evaluations_df, get_round_count
 from scenario_state import (
     get_active_scenario,
+    get_active_scenario_hash,
     list_scenario_files,
     load_scenario,
     set_active_scenario,
 )
 
 
-METRIC_ALIASES = {
-    "fairness": ["fairness", "perceived_fairness"],
-    "manipulativeness": ["manipulativeness", "manipulation_risk"],
-}
-
-def _to_int(value):
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _coalesce_numeric(row: dict, keys: list[str]):
-    for key in keys:
-        value = _to_int(row.get(key))
-        if value is not None:
-            return value
-    return None
-
-
 def _normalize_enum_label(value):
     if not isinstance(value, str):
         return None
@@ -51,33 +31,10 @@ def _agreement_status_and_color(row: dict) -> tuple[str, str]:
     return "unknown", "gray"
 
 
-def _metric_aliases(metric_name: str) -> list[str]:
-    aliases = METRIC_ALIASES.get(metric_name, [metric_name])
-    if metric_name not in aliases:
-        return [metric_name] + aliases
-    return aliases
-
-
-def _metric_value(row: dict, metric_name: str):
-    return _coalesce_numeric(row, _metric_aliases(metric_name))
-
-
-def _is_numeric_metric(metric_spec: dict) -> bool:
-    metric_type = str(metric_spec.get("type", "")).lower()
-    return metric_type not in {"boolean", "enum", "multiclass", "categorical"}
-
-
 def _metric_label(metric_name: str) -> str:
     return metric_name.replace("_", " ").title()
 
 
-def _utility_sign(metric_spec: dict) -> int:
-    utility_score = str(metric_spec.get("utility_score", "positive")).strip().lower()
-    if utility_score in {"negative", "minus", "-1"}:
-        return -1
-    return 1
-
-
 def _round_messages_text(round_item: dict) -> str:
     turn_messages = round_item.get("turn_messages", []) if isinstance(round_item, dict) else []
     if not isinstance(turn_messages, list):
@@ -94,40 +51,49 @@ def _round_messages_text(round_item: dict) -> str:
     return "\n".join(lines)
 
 
-def _build_evaluations_df() -> pd.DataFrame:
-    df = st.session_state.get("evaluations_df")
-    if isinstance(df, pd.DataFrame) and not df.empty:
-        return df.copy()
+def _negotiation_space(active_file: str | None, active_payload: dict):
+    """Negotiation space of the active scenario, built once per scenario version.
 
-    rows = []
-    for item in st.session_state.get("round_evaluations", []):
-        round_id = item.get("round")
-        evaluation = item.get("evaluation", {})
-        row = {"round": round_id}
-        for key, value in evaluation.items():
-            if isinstance(value, list):
-                row[key] = ", ".join(str(x) for x in value)
-            elif isinstance(value, dict):
-                row[key] = str(value)
-            else:
-                row[key] = value
-        rows.append(row)
+    The dialogue director already holds it when it runs the same scenario file
+    and content; otherwise it is memoized per content hash in session state.
+    """
+    scenario_hash = get_active_scenario_hash()
+    director = st.session_state.get("director")
+    director_signature = st.session_state.get("director_scenario_signature")
+    if (
+        director is not None
+        and st.session_state.get("director_scenario_file") == active_file
+        and isinstance(director_signature, tuple)
+        and director_signature[0] == scenario_hash
+    ):
+        return director.negotiation_space
 
-    if not rows:
-        return pd.DataFrame()
+    cached = st.session_state.get("negotiation_space_cache")
+    if not isinstance(cached, tuple) or cached[0] != (active_file, scenario_hash):
+        from core.negotiation_space import build_negotiation_space
 
-    return pd.DataFrame(rows)
+        cached = ((active_file, scenario_hash), build_negotiation_space(active_payload))
+        st.session_state.negotiation_space_cache = cached
+    return cached[1]
 
 
 st.title("Preliminary Results")
 
-evaluations_df = _build_evaluations_df()
-if evaluations_df.empty:
+if not get_round_count():
     st.info("No judge data yet. Run at least one round in Dialogue Simulation.")
     st.stop()
 
+# Numeric and charting libraries load only once there is data to show.
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from core.proposals import local_utility_history
+from derived_metrics import get_round_metrics
+
+evaluations_df = get_evaluations_df()
+
 if "round" not in evaluations_df.columns:
-    evaluations_df["round"] = range(1, len(evaluations_df) + 1)
+    evaluations_df = evaluations_df.assign(round=range(1, len(evaluations_df) + 1))
 
 evaluations_df = evaluations_df.sort_values("round").reset_index(drop=True)
 round_items = {
@@ -169,56 +135,24 @@ if not isinstance(active_payload, dict):
 
 scenario_metrics = active_payload.get("metrics", {}) if isinstance(active_payload, dict) else {}
 
-numeric_metric_names = [
-    metric_name
-    for metric_name, metric_spec in scenario_metrics.items()
-    if isinstance(metric_spec, dict) and _is_numeric_metric(metric_spec)
-]
-if not numeric_metric_names:
-    numeric_metric_names = [
+round_metrics = get_round_metrics(
+    scenario_metrics,
+    default_metric_names=[
         "fairness",
         "cooperativeness",
         "manipulativeness",
         "conversation_quality",
         "ambiguity",
-    ]
-
-series_rows = []
-utility_rows = []
-agreement_round = None
-for row in records:
-    round_id = row.get("round")
-    series_row = {"Round": round_id}
-    utility_total = 0
-    has_utility_values = False
-
-    for metric_name in numeric_metric_names:
-        metric_value = _metric_value(row, metric_name)
-        series_row[_metric_label(metric_name)] = metric_value
-        if metric_value is None:
-            continue
-        metric_spec = scenario_metrics.get(metric_name, {}) if isinstance(scenario_metrics, dict) else {}
-        utility_total += _utility_sign(metric_spec) * metric_value
-        has_utility_values = True
-
-    series_rows.append(series_row)
-    utility_rows.append(
-        {
-            "Round": round_id,
-            "Utility Total": utility_total if has_utility_values else None,
-        }
-    )
-
-    status, _ = _agreement_status_and_color(row)
-    if agreement_round is None and status == "reached":
-        agreement_round = round_id
+    ],
+)
+numeric_metric_names = list(round_metrics.metric_names)
 
 st.subheader("Records Table")
 st.dataframe(evaluations_df, width="stretch")
 
 st.subheader("Judge Metrics Over Rounds")
-plot_df = pd.DataFrame(series_rows)
-utility_df = pd.DataFrame(utility_rows)
+plot_df = round_metrics.metrics_frame().rename(columns=_metric_label)
+utility_df = round_metrics.utility_frame()
 trend_col, utility_col = st.columns([3, 2], gap="small")
 
 with trend_col:
@@ -260,14 +194,65 @@ with utility_col:
     else:
         st.caption("Utility total unavailable.")
 
+round_events = [
+    event
+    for item in st.session_state.get("round_evaluations", [])
+    if isinstance(item, dict)
+    for event in item.get("turn_messages", [])
+]
+local_utility_df = pd.DataFrame(
+    [
+        {"Round": point["round"], "Agent": agent, "Local Utility": utility}
+        for point in local_utility_history(_negotiation_space(active_file, active_payload), round_events)
+        for agent, utility in point["utilities"].items()
+    ]
+    if any(event.get("offer") for event in round_events)
+    else []
+)
+has_offer_gap = "offer_gap" in evaluations_df.columns and evaluations_df["offer_gap"].notna().any()
+
+if has_offer_gap or not local_utility_df.empty:
+    # Both charts come from the agents' PROPOSAL blocks, not from the judge.
+    st.subheader("Offer Analytics")
+    local_col, gap_col = st.columns(2, gap="small")
+    with local_col:
+        if not local_utility_df.empty:
+            local_fig = px.line(local_utility_df, x="Round", y="Local Utility", color="Agent", markers=True)
+            local_fig.update_layout(margin=dict(l=10, r=10, t=10, b=10))
+            local_fig.update_yaxes(range=[0, 1])
+            local_fig.update_legends(orientation="h", yanchor="bottom", y=-0.3, xanchor="left", x=0)
+            st.plotly_chart(local_fig, width="stretch")
+            st.caption("Utility of the standing offer against each agent's private goals (0 = reservation, 1 = aspiration).")
+        else:
+            st.caption("No numeric offers parsed yet.")
+    with gap_col:
+        if has_offer_gap:
+            gap_fig = px.line(
+                evaluations_df.dropna(subset=["offer_gap"]),
+                x="round",
+                y="offer_gap",
+                markers=True,
+                labels={"round": "Round", "offer_gap": "Offer Gap"},
+            )
+            gap_fig.update_layout(margin=dict(l=10, r=10, t=10, b=10))
+            gap_fig.update_yaxes(range=[0, 1], tickformat=".0%")
+            st.plotly_chart(gap_fig, width="stretch")
+            st.caption("Distance between the latest offers of the parties; 0 means they are compatible.")
+        else:
+            st.caption("Offer gap unavailable.")
 
 st.subheader("Judge Report by Iteration")
-metric_aliases = [(_metric_label(metric_name), _metric_aliases(metric_name)) for metric_name in numeric_metric_names]
+metric_labels = [_metric_label(metric_name) for metric_name in numeric_metric_names]
+
+
+def _matrix_value(round_index: int, metric_index: int) -> int | None:
+    value = round_metrics.values[round_index, metric_index]
+    return None if np.isnan(value) else int(value)
+
 
 report_details = st.expander("Details for each round", expanded=False)
 with report_details:
     for idx, row in enumerate(records):
-        prev_row = records[idx - 1] if idx > 0 else {}
         round_id = row.get("round")
 
         with st.container(border=True):
@@ -278,12 +263,12 @@ with report_details:
 
             # Render metrics in rows of up to 5 columns to avoid index overflow
             # when scenarios define more than five numeric metrics.
-            for start_idx in range(0, len(metric_aliases), 5):
-                metric_chunk = metric_aliases[start_idx:start_idx + 5]
+            for start_idx in range(0, len(metric_labels), 5):
+                metric_chunk = metric_labels[start_idx:start_idx + 5]
                 columns = st.columns(len(metric_chunk))
-                for column, (label, aliases) in zip(columns, metric_chunk):
-                    current_value = _coalesce_numeric(row, aliases)
-                    previous_value = _coalesce_numeric(prev_row, aliases)
+                for offset, (column, label) in enumerate(zip(columns, metric_chunk)):
+                    current_value = _matrix_value(idx, start_idx + offset)
+                    previous_value = _matrix_value(idx - 1, start_idx + offset) if idx > 0 else None
                     delta = None
                     if current_value is not None and previous_value is not None:
                         delta = current_value - previous_value
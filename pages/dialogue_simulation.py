@@ -1,15 +1,30 @@
-import json
 from datetime import datetime, timezone
 from uuid import uuid4
 
 import streamlit as st
-import pandas as pd
-from langchain_anthropic import ChatAnthropic
 
+from core.background import (
+    BackgroundRun,
+    branch_run_id,
+    discard_background_run,
+    get_background_run,
+    start_background_run,
+    start_branch_runs,
+)
 from core.director import NegotiationDirector
+from core.judging import build_round_judge, cascade_hit_rate
+from core.negotiation_run import (
+    build_global_result_row,
+    execute_round,
+    local_utility_history,
+    model_settings,
+    normalize_agreement_status,
+)
 from negotiation_rules_state import get_active_rules
+from run_results_index import load_call_history
+from round_ledger import append_round_evaluation, reset_round_ledger
 from run_results_store import append_global_result
-from scenario_state import get_active_scenario
+from scenario_state import get_active_scenario, get_active_scenario_hash
 
 if "history" not in st.session_state:
     st.session_state.history = []
@@ -21,8 +36,6 @@ if "round_evaluations" not in st.session_state:
     st.session_state.round_evaluations = []
 if "evaluation" not in st.session_state:
     st.session_state.evaluation = None
-if "evaluations_df" not in st.session_state:
-    st.session_state.evaluations_df = pd.DataFrame()
 if "final_evaluation" not in st.session_state:
     st.session_state.final_evaluation = None
 if "final_evaluation_meta" not in st.session_state:
@@ -33,6 +46,12 @@ if "run_started_at_utc" not in st.session_state:
     st.session_state.run_started_at_utc = datetime.now(timezone.utc).isoformat(timespec="seconds")
 if "run_saved" not in st.session_state:
     st.session_state.run_saved = False
+if "background_run_error" not in st.session_state:
+    st.session_state.background_run_error = None
+if "round_views" not in st.session_state:
+    st.session_state.round_views = {}
+if "branches" not in st.session_state:
+    st.session_state.branches = None
 
 st.title("Dialogue Simulation")
 
@@ -48,101 +67,38 @@ if not isinstance(active_payload, dict):
 
 active_rules = get_active_rules()
 director_payload = {**active_payload, "negotiation_rules": dict(active_rules)}
-agents_model_name = str(active_rules.get("agents_model", "claude-sonnet-4-5-20250929")).strip()
-round_judge_model_name = str(active_rules.get("judge_model", "claude-sonnet-4-5-20250929")).strip()
-final_judge_model_name = str(
-    active_rules.get("final_judge_model", round_judge_model_name or "claude-sonnet-4-5-20250929")
-).strip()
-agents_temperature = float(active_rules.get("agents_temperature", 0.3))
-round_judge_temperature = float(active_rules.get("judge_temperature", 0.1))
-final_judge_temperature = float(active_rules.get("final_judge_temperature", round_judge_temperature))
-if not agents_model_name:
-    agents_model_name = "claude-sonnet-4-5-20250929"
-if not round_judge_model_name:
-    round_judge_model_name = "claude-sonnet-4-5-20250929"
-if not final_judge_model_name:
-    final_judge_model_name = round_judge_model_name
+run_models = model_settings(active_rules)
+agents_model_name = run_models["agents_model"]
+round_judge_model_name = run_models["round_judge_model"]
+final_judge_model_name = run_models["final_judge_model"]
+agents_temperature = run_models["agents_temperature"]
+round_judge_temperature = run_models["round_judge_temperature"]
+final_judge_temperature = run_models["final_judge_temperature"]
 
+# Rounds whose transcript exceeds this many characters render collapsed.
+LONG_ROUND_CHARS = 6000
 
-# Factory for model instances; customize this per agent if needed.
-def llm_factory(_spec):
-    return ChatAnthropic(model=agents_model_name, temperature=agents_temperature)
-
-
-def _scenario_signature(payload: dict) -> str:
-    return json.dumps(payload, sort_keys=True, ensure_ascii=True)
-
-
-def _normalize_agreement_status(value) -> str:
-    if not isinstance(value, str):
-        return "ongoing"
-    label = value.split(":", 1)[0].strip().lower()
-    if label in {"reached", "failed", "ongoing"}:
-        return label
-    return "ongoing"
 
+def _chat_model(model: str, temperature: float, max_tokens: int | None = None):
+    # langchain_anthropic takes seconds to import; load it on the first LLM call.
+    from langchain_anthropic import ChatAnthropic
 
-def _is_numeric_metric(metric_spec: dict) -> bool:
-    metric_type = str(metric_spec.get("type", "")).lower()
-    return metric_type not in {"boolean", "enum", "multiclass", "categorical"}
+    if max_tokens is not None:
+        return ChatAnthropic(model=model, temperature=temperature, max_tokens=max_tokens)
+    return ChatAnthropic(model=model, temperature=temperature)
 
 
-def _utility_sign(metric_spec: dict) -> int:
-    utility_score = str(metric_spec.get("utility_score", "positive")).strip().lower()
-    if utility_score in {"negative", "minus", "-1"}:
-        return -1
-    return 1
-
-
-def _round_utility_total(evaluation: dict, metrics: dict) -> int | None:
-    if not isinstance(evaluation, dict) or not isinstance(metrics, dict):
-        return None
-
-    total = 0
-    has_values = False
-    for metric_name, metric_spec in metrics.items():
-        if not isinstance(metric_spec, dict) or not _is_numeric_metric(metric_spec):
-            continue
-        metric_value = _to_int(evaluation.get(metric_name))
-        if metric_value is None:
-            continue
-        total += _utility_sign(metric_spec) * metric_value
-        has_values = True
+# Factory for model instances; customize this per agent if needed.
+def llm_factory(_spec):
+    return _chat_model(agents_model_name, agents_temperature)
 
-    return total if has_values else None
 
+def _utility_total_history() -> list[dict]:
+    # NumPy/pandas are only needed once a run is persisted.
+    from derived_metrics import get_round_metrics
 
-def _utility_total_history_json() -> str:
     metrics = active_payload.get("metrics", {}) if isinstance(active_payload, dict) else {}
-    history_items = []
-    for round_item in st.session_state.get("round_evaluations", []):
-        if not isinstance(round_item, dict):
-            continue
-        round_id = _to_int(round_item.get("round"))
-        evaluation = round_item.get("evaluation", {})
-        utility_total = _round_utility_total(evaluation, metrics)
-        if round_id is None:
-            continue
-        history_items.append(
-            {
-                "round": round_id,
-                "utility_total": utility_total,
-            }
-        )
-    return json.dumps(history_items, ensure_ascii=True)
-
-
-def _conversation_history_json(history: list[dict]) -> str:
-    messages = []
-    for item in history:
-        if not isinstance(item, dict):
-            continue
-        agent = str(item.get("agent", "")).strip()
-        content = str(item.get("content", "")).strip()
-        if not content:
-            continue
-        messages.append(f"{agent}: {content}" if agent else content)
-    return json.dumps(messages, ensure_ascii=True)
+    return get_round_metrics(metrics).utility_history()
 
 
 def _new_run_identity() -> None:
@@ -155,51 +111,16 @@ def _build_global_result_row(
     director: NegotiationDirector,
     final_evaluation: dict | None,
 ) -> dict:
-    agents = active_payload.get("agents", []) if isinstance(active_payload, dict) else []
-    final_eval = final_evaluation if isinstance(final_evaluation, dict) else {}
-    latest_round_eval = st.session_state.get("evaluation", {})
-    if not isinstance(latest_round_eval, dict):
-        latest_round_eval = {}
-    agreement_status = _normalize_agreement_status(
-        final_eval.get("agreement_status", director.latest_agreement_status)
+    return build_global_result_row(
+        director,
+        final_evaluation,
+        run_id=st.session_state.get("run_id", ""),
+        scenario_file=active_file or "",
+        content_hash=get_active_scenario_hash(),
+        rules=active_rules,
+        utility_total_history=_utility_total_history(),
     )
 
-    def _final_metric_value(metric_name: str):
-        value = _to_int(final_eval.get(metric_name))
-        if value is not None:
-            return value
-        return _to_int(latest_round_eval.get(metric_name))
-
-    return {
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-        "run_id": st.session_state.get("run_id", ""),
-        "scenario_file": active_file or "",
-        "scenario_name": active_scenario_name,
-        "num_agents": len(agents) if isinstance(agents, list) else 0,
-        "agents_model": agents_model_name,
-        "agents_temperature": agents_temperature,
-        "round_judge_model": round_judge_model_name,
-        "round_judge_temperature": round_judge_temperature,
-        "final_judge_model": final_judge_model_name,
-        "final_judge_temperature": final_judge_temperature,
-        "mode": str(active_rules.get("mode", "")),
-        "max_rounds": director.max_rounds,
-        "effective_rounds": director.round,
-        "allow_partial_agreements": bool(active_rules.get("allow_partial_agreements", True)),
-        "require_unanimous_agreement": bool(active_rules.get("require_unanimous_agreement", True)),
-        "agreement_status": agreement_status,
-        "conversation_history": _conversation_history_json(director.get_history()),
-        "utility_total_history": _utility_total_history_json(),
-        "unanimous": final_eval.get("unanimous", ""),
-        "final_persuasion": _final_metric_value("persuasion"),
-        "final_deception": _final_metric_value("deception"),
-        "final_concession": _final_metric_value("concession"),
-        "final_cooperation": _final_metric_value("cooperation"),
-        "final_summary": final_eval.get("summary", ""),
-        "interaction_pattern": final_eval.get("interaction_pattern", ""),
-        "dominant_agent": final_eval.get("dominant_agent", ""),
-    }
-
 
 def _persist_run_result(
     director: NegotiationDirector,
@@ -222,7 +143,9 @@ def get_or_create_director() -> NegotiationDirector:
     # Reuse the director in session state until the selected scenario changes.
     current_file = st.session_state.get("director_scenario_file")
     current_signature = st.session_state.get("director_scenario_signature")
-    active_signature = _scenario_signature(director_payload)
+    # Scenario payloads are immutable registry entries, so their content hash
+    # plus the (small) rules dict identify the director configuration.
+    active_signature = (get_active_scenario_hash(), dict(active_rules))
     should_recreate = (
         st.session_state.director is None
         or current_file != active_file
@@ -232,6 +155,8 @@ def get_or_create_director() -> NegotiationDirector:
     if should_recreate:
         previous_director = st.session_state.director
         had_existing_director = previous_director is not None
+        discard_background_run(st.session_state.get("run_id"))
+        discard_branches()
         if (
             had_existing_director
             and previous_director.round > 0
@@ -242,7 +167,11 @@ def get_or_create_director() -> NegotiationDirector:
                 director=previous_director,
                 final_evaluation=None,
             )
-        st.session_state.director = NegotiationDirector(director_payload, llm_factory)
+        st.session_state.director = NegotiationDirector(
+            director_payload,
+            llm_factory,
+            moderator_llm_factory=lambda: _chat_model(round_judge_model_name, round_judge_temperature),
+        )
         st.session_state.director_scenario_file = active_file
         st.session_state.director_scenario_signature = active_signature
 
@@ -252,80 +181,180 @@ def get_or_create_director() -> NegotiationDirector:
             st.session_state.round = 0
             st.session_state.round_evaluations = []
             st.session_state.evaluation = None
-            st.session_state.evaluations_df = pd.DataFrame()
+            reset_round_ledger()
             st.session_state.final_evaluation = None
             st.session_state.final_evaluation_meta = None
+            st.session_state.round_views = {}
             _new_run_identity()
     return st.session_state.director
 
 
+def _execute_round(director: NegotiationDirector, run_id: str) -> dict:
+    # Same code path for the buttons, the background worker and branches.
+    round_judge = build_round_judge(
+        {**active_rules, "judge_model": round_judge_model_name},
+        active_payload.get("metrics", {}),
+        lambda model, **options: _chat_model(model, round_judge_temperature, **options),
+    )
+    return execute_round(director, round_judge, run_id, active_file or "", active_payload.get("metrics", {}))
+
+
+def _apply_round_item(director: NegotiationDirector, round_item: dict) -> None:
+    # The worker may already be mid-way through the next round.
+    st.session_state.history = director.get_history()[: round_item["history_len"]]
+    st.session_state.round = round_item["round"]
+    st.session_state.evaluation = round_item["evaluation"]
+    st.session_state.round_evaluations.append(round_item)
+    append_round_evaluation(
+        round_item["round"],
+        round_item["evaluation"],
+        extra={"offer_gap": round_item.get("convergence", {}).get("gap")},
+    )
+
+
 def advance_round_and_evaluate():
     # Execute one full round and immediately evaluate the updated transcript.
     director = get_or_create_director()
     if not director.can_advance():
         return
 
-    if director.get_history():
-        input_message = director.get_history()[-1]["content"]
-    else:
-        input_message = "Let's begin the negotiation. Present your first proposal."
-
-    turn_messages = director.step(input_message)
-
-    judge_llm = ChatAnthropic(model=round_judge_model_name, temperature=round_judge_temperature)
-    evaluation = director.evaluate_round(judge_llm)
-    director.register_evaluation(evaluation)
-
-    st.session_state.history = director.get_history()
-    st.session_state.round = director.round
-    st.session_state.evaluation = evaluation
-    st.session_state.round_evaluations.append(
-        {
-            "round": director.round,
-            "turn_messages": turn_messages,
-            "evaluation": evaluation,
-        }
-    )
-    row = _build_evaluation_row(director.round, evaluation)
-    st.session_state.evaluations_df = pd.concat(
-        [st.session_state.evaluations_df, pd.DataFrame([row])],
-        ignore_index=True,
-    )
+    _apply_round_item(director, _execute_round(director, st.session_state.run_id))
     _maybe_run_final_evaluation(director)
 
 
-def advance_until_end() -> int:
-    rounds_executed = 0
-    director = get_or_create_director()
-    while director.can_advance():
-        advance_round_and_evaluate()
-        rounds_executed += 1
-        director = get_or_create_director()
-    return rounds_executed
-
-
-def _build_evaluation_row(round_id: int, evaluation: dict) -> dict:
-    row = {"round": round_id}
-    for key, value in evaluation.items():
-        if isinstance(value, list):
-            row[key] = ", ".join(str(item) for item in value)
-        elif isinstance(value, dict):
-            row[key] = str(value)
-        else:
-            row[key] = value
+def _run_final_evaluation(director: NegotiationDirector) -> dict:
+    final_judge_llm = _chat_model(final_judge_model_name, final_judge_temperature)
+    return director.evaluate_final(final_judge_llm)
+
+
+def start_advance_until_end() -> None:
+    run_id = st.session_state.run_id
+    start_background_run(
+        run_id,
+        get_or_create_director(),
+        execute_round=lambda director: _execute_round(director, run_id),
+        finalize=_run_final_evaluation,
+    )
+
+
+def _drain_background_run(director: NegotiationDirector, background_run: BackgroundRun) -> int:
+    """Apply rounds finished by the worker; returns how many were applied."""
+    # Check liveness before draining so the last queued round is never missed.
+    finished = not background_run.is_running()
+    round_items = background_run.drain()
+    for round_item in round_items:
+        _apply_round_item(director, round_item)
+
+    if finished:
+        discard_background_run(background_run.run_id)
+        if background_run.error:
+            st.session_state.background_run_error = background_run.error
+        if isinstance(background_run.final_evaluation, dict):
+            st.session_state.final_evaluation = background_run.final_evaluation
+            st.session_state.final_evaluation_meta = _final_evaluation_meta(director)
+            _persist_run_result(
+                director=director,
+                final_evaluation=background_run.final_evaluation,
+            )
+    return len(round_items)
+
+
+def start_branches(director: NegotiationDirector, at_round: int, count: int) -> None:
+    # Continuations of the current run after `at_round`; the prefix is not rerun.
+    discard_branches()
+    evaluation = next(
+        item["evaluation"] for item in st.session_state.round_evaluations if item["round"] == at_round
+    )
+    start_branch_runs(
+        st.session_state.run_id,
+        director,
+        at_round,
+        count,
+        execute_round=_execute_round,
+        finalize=_run_final_evaluation,
+        evaluation=evaluation,
+    )
+    st.session_state.branches = {"run_id": st.session_state.run_id, "at_round": at_round, "count": count}
+
+
+def _branch_runs() -> list[BackgroundRun]:
+    branches = st.session_state.branches
+    if not branches:
+        return []
+    branch_runs = [
+        get_background_run(branch_run_id(branches["run_id"], index)) for index in range(1, branches["count"] + 1)
+    ]
+    return [branch_run for branch_run in branch_runs if branch_run is not None]
+
+
+def discard_branches() -> None:
+    branches = st.session_state.get("branches")
+    if branches:
+        for index in range(1, branches["count"] + 1):
+            discard_background_run(branch_run_id(branches["run_id"], index))
+    st.session_state.branches = None
+
+
+def _branch_row(index: int, branch_run: BackgroundRun) -> dict:
+    fork = branch_run.director
+    # Round items are only needed by the main run; drop them as they arrive.
+    branch_run.drain()
+    if branch_run.error:
+        outcome = f"error: {branch_run.error}"
+    elif branch_run.is_running():
+        outcome = "running"
+    else:
+        outcome = fork.termination_reason or "cancelled"
+    final_evaluation = branch_run.final_evaluation if isinstance(branch_run.final_evaluation, dict) else {}
+    row = {
+        "Branch": index,
+        "Outcome": outcome,
+        "Rounds": fork.round,
+        "Final judge": normalize_agreement_status(final_evaluation.get("agreement_status")) if final_evaluation else "",
+        "Offer gap": fork.offer_convergence[-1].get("gap") if fork.offer_convergence else None,
+    }
+    local_history = local_utility_history(fork)
+    if local_history:
+        row.update({f"Utility {agent}": utility for agent, utility in local_history[-1]["utilities"].items()})
     return row
 
 
-def _maybe_run_final_evaluation(director: NegotiationDirector) -> None:
-    if not director.is_terminated:
+def _render_branches() -> None:
+    branches = st.session_state.branches
+    branch_runs = _branch_runs()
+    if not branches or not branch_runs:
         return
+    st.caption(
+        f"{len(branch_runs)} continuations of this run after round {branches['at_round']}, "
+        "sharing its first rounds."
+    )
+    st.dataframe(
+        [_branch_row(index, branch_run) for index, branch_run in enumerate(branch_runs, start=1)],
+        hide_index=True,
+        width="stretch",
+    )
+    for index, branch_run in enumerate(branch_runs, start=1):
+        suffix = [event for event in branch_run.director.get_history() if event["round"] > branches["at_round"]]
+        with st.expander(f"Branch {index} · rounds {branches['at_round'] + 1}-{branch_run.director.round}"):
+            for event in suffix:
+                with st.chat_message(event.get("agent", "Agent")):
+                    st.write(event.get("content", ""))
+
 
-    meta = {
+def _final_evaluation_meta(director: NegotiationDirector) -> dict:
+    return {
         "scenario_file": active_file,
         "round": director.round,
         "termination_reason": director.termination_reason,
         "history_len": len(director.get_history()),
     }
+
+
+def _maybe_run_final_evaluation(director: NegotiationDirector) -> None:
+    if not director.is_terminated:
+        return
+
+    meta = _final_evaluation_meta(director)
     if st.session_state.get("final_evaluation_meta") == meta:
         existing_final = st.session_state.get("final_evaluation")
         if not st.session_state.get("run_saved") and isinstance(existing_final, dict):
@@ -335,8 +364,7 @@ def _maybe_run_final_evaluation(director: NegotiationDirector) -> None:
             )
         return
 
-    final_judge_llm = ChatAnthropic(model=final_judge_model_name, temperature=final_judge_temperature)
-    final_evaluation = director.evaluate_final(final_judge_llm)
+    final_evaluation = _run_final_evaluation(director)
     st.session_state.final_evaluation = final_evaluation
     st.session_state.final_evaluation_meta = meta
     _persist_run_result(
@@ -345,6 +373,34 @@ def _maybe_run_final_evaluation(director: NegotiationDirector) -> None:
     )
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _remaining_run_caption(
+    scenario_file: str,
+    scenario_hash: str,
+    rules: dict,
+    done_rounds: int,
+    message_chars: float | None,
+    _scenario: dict,
+) -> str:
+    # Only computed when asked for: NumPy, pandas and the results index stay off the default path.
+    import pandas as pd
+
+    from core.cost_estimates import estimate_runs, format_duration, run_config, scenario_profile
+
+    history = load_call_history(scenario_file=scenario_file, scenario_name=_scenario.get("name", scenario_file))
+    if message_chars:
+        # This run's own messages say more about its length than past runs.
+        history["message_chars"] = message_chars
+    profile = scenario_profile(_scenario, history)
+    estimate = estimate_runs(pd.DataFrame([run_config(profile, rules, done_rounds=done_rounds)])).iloc[0]
+    max_rounds = int(rules.get("max_rounds", 10))
+    return (
+        f"Advance Until End, up to {max_rounds - done_rounds} more rounds and the final judge: "
+        f"about {estimate['input_tokens'] + estimate['output_tokens']:,.0f} tokens, "
+        f"${estimate['cost_usd']:.2f}, {format_duration(estimate['run_seconds'])} (upper bound at list prices)."
+    )
+
+
 def _to_int(value):
     try:
         return int(value)
@@ -383,8 +439,17 @@ def _enum_color_map(metric_spec: dict) -> dict[str, str]:
     return color_map
 
 
-def _render_judge_evaluation(current_eval: dict, previous_eval: dict, metric_specs: dict):
-    numeric_metrics: list[tuple[str, str, str]] = []
+def _judge_evaluation_view(current_eval: dict, previous_eval: dict, metric_specs: dict) -> dict:
+    # Resolve everything the judge panel shows into plain values, so a round's
+    # panel is computed once and re-emitted cheaply on later reruns.
+    badges: list[tuple[str, str]] = []
+    captions: list[str] = []
+    numeric_metrics: list[tuple[str, int | None, int | None, str | None]] = []
+    status_only = current_eval.get("annotation") == "status_only"
+    if status_only:
+        # Two-tier judging: this round was only checked for termination.
+        metric_specs = {name: spec for name, spec in metric_specs.items() if name == "agreement_status"}
+        captions.append("Status-only round: metrics are annotated at the next checkpoint.")
 
     for metric_name, metric_spec in metric_specs.items():
         label = metric_name.replace("_", " ").title()
@@ -393,12 +458,9 @@ def _render_judge_evaluation(current_eval: dict, previous_eval: dict, metric_spe
         if metric_type == "boolean":
             metric_value = current_eval.get(metric_name, "Unknown")
             if isinstance(metric_value, bool):
-                st.badge(
-                    f"{label}: {metric_value}",
-                    color="green" if metric_value else "red",
-                )
+                badges.append((f"{label}: {metric_value}", "green" if metric_value else "red"))
             else:
-                st.caption(f"{label}: {metric_value}")
+                captions.append(f"{label}: {metric_value}")
             continue
 
         if metric_type in ("enum", "multiclass", "categorical"):
@@ -406,42 +468,76 @@ def _render_judge_evaluation(current_eval: dict, previous_eval: dict, metric_spe
             normalized_value = _normalize_enum_label(metric_value)
             color_map = _enum_color_map(metric_spec)
             if normalized_value:
-                st.badge(
-                    f"{label}: {normalized_value}",
-                    color=color_map.get(normalized_value, "gray"),
-                )
+                badges.append((f"{label}: {normalized_value}", color_map.get(normalized_value, "gray")))
             else:
-                st.caption(f"{label}: {metric_value if metric_value is not None else 'Unknown'}")
+                captions.append(f"{label}: {metric_value if metric_value is not None else 'Unknown'}")
             continue
 
-        numeric_metrics.append((metric_name, label, f"{metric_name}_top_words"))
+        current_value = _to_int(current_eval.get(metric_name))
+        previous_value = _to_int(previous_eval.get(metric_name))
+        top_words = current_eval.get(f"{metric_name}_top_words")
+        drivers = None
+        if (
+            isinstance(top_words, list)
+            and len(top_words) == 2
+            and all(isinstance(word, str) for word in top_words)
+        ):
+            drivers = f"Top drivers: {top_words[0]}, {top_words[1]}"
+        numeric_metrics.append(
+            (label, current_value, _metric_delta(current_value, previous_value), drivers)
+        )
 
+    judge_count = current_eval.get("judge_count")
+    if isinstance(judge_count, int) and judge_count > 1:
+        votes = current_eval.get("judge_votes", {})
+        vote_text = ", ".join(f"{status} {count}" for status, count in votes.items()) if isinstance(votes, dict) else ""
+        captions.append(
+            f"{judge_count} judges · disagreement {current_eval.get('judge_disagreement', 0):.2f}"
+            + (f" · votes: {vote_text}" if vote_text else "")
+        )
+    if current_eval.get("judge_tier") == "cheap":
+        captions.append("Settled by the screening judge")
+    elif current_eval.get("judge_tier") == "escalated":
+        reasons = current_eval.get("judge_escalation", [])
+        captions.append("Escalated to the round judge: " + ", ".join(str(reason).replace("_", " ") for reason in reasons))
+
+    return {
+        "badges": badges,
+        "captions": captions,
+        "numeric_metrics": numeric_metrics,
+        "summary": current_eval.get("summary", "" if status_only else "No summary provided."),
+    }
+
+
+def _render_judge_evaluation(judge_view: dict):
+    for text, color in judge_view["badges"]:
+        st.badge(text, color=color)
+    for text in judge_view["captions"]:
+        st.caption(text)
+
+    numeric_metrics = judge_view["numeric_metrics"]
     if numeric_metrics:
         first_col, second_col = st.columns(2)
-        for index, (metric_name, label, top_words_key) in enumerate(numeric_metrics):
-            current_value = _to_int(current_eval.get(metric_name))
-            previous_value = _to_int(previous_eval.get(metric_name))
+        for index, (label, current_value, delta, drivers) in enumerate(numeric_metrics):
             target_col = first_col if index % 2 == 0 else second_col
 
             with target_col:
                 st.metric(
                     label=label,
                     value=current_value if current_value is not None else "N/A",
-                    delta=_metric_delta(current_value, previous_value),
+                    delta=delta,
                 )
-                top_words = current_eval.get(top_words_key)
-                if (
-                    isinstance(top_words, list)
-                    and len(top_words) == 2
-                    and all(isinstance(word, str) for word in top_words)
-                ):
-                    st.caption(f"Top drivers: {top_words[0]}, {top_words[1]}")
+                if drivers:
+                    st.caption(drivers)
 
-    st.write(current_eval.get("summary", "No summary provided."))
+    if judge_view["summary"]:
+        st.write(judge_view["summary"])
 
 
 def reset_dialogue():
     director = get_or_create_director()
+    discard_background_run(st.session_state.run_id)
+    discard_branches()
     if director.round > 0 and not director.is_terminated:
         _persist_run_result(
             director=director,
@@ -452,15 +548,96 @@ def reset_dialogue():
     st.session_state.round = 0
     st.session_state.evaluation = None
     st.session_state.round_evaluations = []
-    st.session_state.evaluations_df = pd.DataFrame()
+    reset_round_ledger()
     st.session_state.final_evaluation = None
     st.session_state.final_evaluation_meta = None
+    st.session_state.background_run_error = None
+    st.session_state.round_views = {}
     _new_run_identity()
 
 
+def _round_view(idx: int, item: dict, metric_specs: dict) -> dict:
+    # Completed rounds never change, so their view is cached per (run_id, round).
+    cache_key = (st.session_state.run_id, item.get("round"))
+    cached_view = st.session_state.round_views.get(cache_key)
+    if cached_view is not None:
+        return cached_view
+
+    # Deltas compare against the latest annotated round, skipping status-only ones.
+    prev_eval = next(
+        (
+            previous["evaluation"]
+            for previous in reversed(st.session_state.round_evaluations[:idx])
+            if previous.get("evaluation", {}).get("annotation") != "status_only"
+        ),
+        {},
+    )
+    current_eval = item.get("evaluation", {})
+    turn_messages = item.get("turn_messages", [])
+    status = normalize_agreement_status(current_eval.get("agreement_status", ""))
+    round_view = {
+        "header": f"Round {item.get('round')} · {status.capitalize()}",
+        "turn_messages": turn_messages,
+        "is_long": sum(len(str(msg.get("content", ""))) for msg in turn_messages) > LONG_ROUND_CHARS,
+        "judge_view": _judge_evaluation_view(current_eval, prev_eval, metric_specs),
+        "offer_gap": _offer_gap_caption(item.get("convergence", {})),
+    }
+    st.session_state.round_views[cache_key] = round_view
+    return round_view
+
+
+def _offer_gap_caption(convergence: dict) -> str | None:
+    # Computed from the parsed PROPOSAL blocks, no judge involved.
+    if convergence.get("gap") is None:
+        return None
+    issues = " · ".join(
+        f"{resource.replace('_', ' ')} {gap:.0%}" for resource, gap in convergence.get("issues", {}).items()
+    )
+    return f"Offer gap: {convergence['gap']:.0%} ({issues})"
+
+
+def _render_round_body(round_view: dict) -> None:
+    dialogue_col, judge_col = st.columns([3, 1], gap="small", vertical_alignment="top")
+
+    with dialogue_col:
+        with st.container(border=True):
+            for msg in round_view["turn_messages"]:
+                with st.chat_message(msg.get("agent", "Agent")):
+                    st.write(msg.get("content", ""))
+
+    with judge_col:
+        with st.container(border=True):
+            _render_judge_evaluation(round_view["judge_view"])
+            if round_view["offer_gap"]:
+                st.caption(round_view["offer_gap"])
+
+
+def _render_round(idx: int, item: dict, metric_specs: dict, is_latest: bool) -> None:
+    round_view = _round_view(idx, item, metric_specs)
+    if is_latest and not round_view["is_long"]:
+        st.markdown(f"**{round_view['header']}**")
+        _render_round_body(round_view)
+        return
+
+    # Older or long rounds stay collapsed and only build their widgets when opened.
+    expander = st.expander(
+        round_view["header"],
+        key=f"round_view_{st.session_state.run_id}_{item.get('round')}",
+        on_change="rerun",
+    )
+    if expander.open:
+        with expander:
+            _render_round_body(round_view)
+
+
 director = get_or_create_director()
-can_advance_conversation = director.can_advance()
-_maybe_run_final_evaluation(director)
+background_run = get_background_run(st.session_state.run_id)
+if background_run is not None:
+    _drain_background_run(director, background_run)
+run_in_background = background_run is not None and background_run.is_running()
+can_advance_conversation = not run_in_background and director.can_advance()
+if not run_in_background:
+    _maybe_run_final_evaluation(director)
 
 with st.expander("Configuration & Status", expanded=False):
     col_a, col_b, col_c = st.columns(3)
@@ -469,6 +646,15 @@ with st.expander("Configuration & Status", expanded=False):
         st.markdown("### Configuration")
         st.write(f"**Scenario**: {active_scenario_name}")
         st.write(f"**Mode**: {str(active_rules.get('mode', 'competitive')).capitalize()}")
+        st.write(f"**Turn protocol**: {director.turn_protocol.capitalize()}")
+        st.write(f"**Turn order**: {director.turn_order.replace('_', ' ').capitalize()}")
+        if director.baseline_agents:
+            baseline_labels = ", ".join(
+                f"{agent.spec.name} ({director.baseline_agents[agent.spec.id].replace('_', ' ')})"
+                for agent in director.agents
+                if agent.spec.id in director.baseline_agents
+            )
+            st.write(f"**Baseline agents**: {baseline_labels}")
 
     with col_b:
         st.markdown("### Progress")
@@ -490,6 +676,20 @@ with st.expander("Configuration & Status", expanded=False):
         st.write(f"**Agents temp**: {agents_temperature}")
         st.write(f"**Round judge**: {round_judge_model_name}")
         st.write(f"**Round judge temp**: {round_judge_temperature}")
+        if active_rules.get("judge_ensemble_size", 1) > 1:
+            ensemble_models = active_rules.get("judge_ensemble_models") or [round_judge_model_name]
+            st.write(
+                f"**Round judge ensemble**: {active_rules['judge_ensemble_size']} judges "
+                f"({', '.join(ensemble_models)})"
+            )
+        if active_rules.get("judge_annotate_every", 1) > 1:
+            st.write(f"**Round metrics**: every {active_rules['judge_annotate_every']} rounds (status checked every round)")
+        if active_rules.get("judge_cascade_model"):
+            settled, cascaded = cascade_hit_rate(
+                [item.get("evaluation", {}) for item in st.session_state.round_evaluations]
+            )
+            hit_rate = f"{settled}/{cascaded} rounds settled ({settled / cascaded:.0%})" if cascaded else "no rounds yet"
+            st.write(f"**Screening judge**: {active_rules['judge_cascade_model']} · {hit_rate}")
         st.write(f"**Final judge**: {final_judge_model_name}")
         st.write(f"**Final judge temp**: {final_judge_temperature}")
 
@@ -499,41 +699,110 @@ with col1:
         with st.spinner("Running round and evaluating..."):
             advance_round_and_evaluate()
 with col2:
-    if st.button("Reset", width="stretch"):
+    if st.button("Reset", width="stretch", disabled=run_in_background):
         reset_dialogue()
 with col3:
     if st.button("Advance Until End", width="stretch", disabled=not can_advance_conversation):
-        with st.spinner("Running conversation until termination..."):
-            completed_rounds = advance_until_end()
-        st.info(f"Auto-advanced {completed_rounds} round(s).")
+        start_advance_until_end()
+        st.rerun()
+
+if can_advance_conversation and st.toggle("Estimate cost until end", key="show_run_estimate"):
+    message_chars = (
+        round(sum(len(event["content"]) for event in director.history) / len(director.history))
+        if director.history
+        else None
+    )
+    st.caption(
+        _remaining_run_caption(
+            active_file,
+            get_active_scenario_hash(),
+            dict(active_rules),
+            director.round,
+            message_chars,
+            active_payload,
+        )
+    )
+
+if st.session_state.background_run_error:
+    st.error(f"Background run stopped: {st.session_state.background_run_error}")
 
 if director.is_terminated and isinstance(st.session_state.get("final_evaluation"), dict):
     st.success("Final judge evaluation is available in the Verdict page.")
 
+metric_specs = active_payload.get("metrics", {})
+rounds_rendered_in_page = len(st.session_state.round_evaluations)
+
 st.subheader("Round by Round")
-if not st.session_state.round_evaluations:
+if not st.session_state.round_evaluations and not run_in_background:
     st.info("No dialogue yet. Click 'Advance Conversation' to run the first round of negotiation.")
 else:
-    metric_specs = active_payload.get("metrics", {})
     for idx, item in enumerate(st.session_state.round_evaluations):
-        prev_eval = (
-            st.session_state.round_evaluations[idx - 1]["evaluation"]
-            if idx > 0
-            else {}
+        _render_round(idx, item, metric_specs, is_latest=idx == rounds_rendered_in_page - 1)
+
+
+@st.fragment(run_every="1s")
+def _background_run_progress() -> None:
+    # Poll the worker without rerunning the whole page; new rounds are appended
+    # below the ones already rendered, and the page reruns once the worker stops.
+    active_run = get_background_run(st.session_state.run_id)
+    if active_run is None:
+        return
+    _drain_background_run(director, active_run)
+
+    rounds_available = len(st.session_state.round_evaluations)
+    for idx in range(rounds_rendered_in_page, rounds_available):
+        _render_round(
+            idx,
+            st.session_state.round_evaluations[idx],
+            metric_specs,
+            is_latest=idx == rounds_available - 1,
         )
-        round_id = item.get("round")
-        turn_messages = item.get("turn_messages", [])
-        current_eval = item.get("evaluation", {})
-
-        st.markdown(f"**Round {round_id}**")
-        dialogue_col, judge_col = st.columns([3, 1], gap="small", vertical_alignment="top")
-
-        with dialogue_col:
-            with st.container(border=True):
-                for msg in turn_messages:
-                    with st.chat_message(msg.get("agent", "Agent")):
-                        st.write(msg.get("content", ""))
-
-        with judge_col:
-            with st.container(border=True):
-                _render_judge_evaluation(current_eval, prev_eval, metric_specs)
+
+    if not active_run.is_running():
+        st.rerun()
+
+    max_rounds = max(int(director.max_rounds), 1)
+    rounds_done = min(director.round, max_rounds)
+    status_text = (
+        "Cancelling after the current round..."
+        if active_run.cancelled
+        else f"Running round {rounds_done + 1} of {max_rounds}..."
+    )
+    st.progress(rounds_done / max_rounds, text=status_text)
+    if st.button("Cancel", disabled=active_run.cancelled):
+        active_run.cancel()
+
+
+if run_in_background:
+    _background_run_progress()
+
+
+@st.fragment(run_every="1s")
+def _branch_progress() -> None:
+    _render_branches()
+    if not any(branch_run.is_running() for branch_run in _branch_runs()):
+        st.rerun()
+
+
+forkable_rounds = [
+    item["round"]
+    for item in st.session_state.round_evaluations
+    if item["round"] < director.max_rounds
+    and normalize_agreement_status(item.get("evaluation", {}).get("agreement_status")) == "ongoing"
+]
+if forkable_rounds and not run_in_background:
+    st.subheader("Branches")
+    branching = any(branch_run.is_running() for branch_run in _branch_runs())
+    fork_col, count_col, button_col = st.columns([2, 2, 2], vertical_alignment="bottom")
+    with fork_col:
+        fork_round = st.selectbox("Fork after round", forkable_rounds, index=len(forkable_rounds) - 1)
+    with count_col:
+        branch_count = st.number_input("Continuations", min_value=2, max_value=8, value=3, step=1)
+    with button_col:
+        if st.button("Run Branches", width="stretch", disabled=branching):
+            start_branches(director, int(fork_round), int(branch_count))
+            st.rerun()
+    if branching:
+        _branch_progress()
+    else:
+        _render_branches()
@@ -0,0 +1,279 @@
+import itertools
+import json
+
+import streamlit as st
+
+from core.cost_estimates import ScenarioProfile, estimate_cells, format_duration, scenario_profile, within_budget
+from core.experiment_design import EXAMPLE_SPEC, ExperimentDesign, parse_experiment_spec
+from core.experiments import AdaptiveReplicates, ExperimentCell, ExperimentRun, fixed_replicates, run_negotiation
+from negotiation_rules_state import get_active_rules
+from run_results_index import load_call_history
+from run_results_store import append_global_result
+from scenario_state import list_scenario_files, load_scenario
+
+
+MODEL_OPTIONS = [
+    "claude-opus-4-6",
+    "claude-sonnet-4-5-20250929",
+    "claude-haiku-4-5-20251001",
+]
+MODE_OPTIONS = ["cooperative", "competitive", "mixed"]
+PREVIEW_CELLS = 20
+# Cells priced before starting; larger designs are priced on this prefix.
+ESTIMATED_CELLS = 10_000
+
+
+def _chat_model(model: str, temperature: float, max_tokens: int | None = None):
+    from langchain_anthropic import ChatAnthropic
+
+    if max_tokens is not None:
+        return ChatAnthropic(model=model, temperature=temperature, max_tokens=max_tokens)
+    return ChatAnthropic(model=model, temperature=temperature)
+
+
+def _run_cell(cell: ExperimentCell) -> dict:
+    return run_negotiation(load_scenario(cell.scenario_file), cell.rules, _chat_model, scenario_file=cell.scenario_file)
+
+
+def _scenario_profiles(design: ExperimentDesign, default_scenario_file: str) -> dict[str, ScenarioProfile]:
+    scenario_levels = next(
+        (factor.levels for factor in design.factors if factor.name == "scenario_file"),
+        (default_scenario_file,),
+    )
+    profiles = {}
+    for scenario_file in scenario_levels:
+        scenario = load_scenario(scenario_file)
+        history = load_call_history(scenario_file=scenario_file, scenario_name=scenario.get("name", scenario_file))
+        profiles[scenario_file] = scenario_profile(scenario, history)
+    return profiles
+
+
+def start_experiment(
+    design: ExperimentDesign,
+    default_scenario_file: str,
+    profiles: dict[str, ScenarioProfile],
+    max_run_cost: float,
+    target_half_width: float,
+    min_replicates: int,
+    max_runs: int,
+    parallel: int,
+):
+    # The scheduler pulls cells from the design stream as it needs them;
+    # a cost cap drops cells from the stream before any of them runs.
+    cells = design.cells(default_scenario_file)
+    if max_run_cost > 0:
+        cells = within_budget(cells, profiles.__getitem__, max_run_cost)
+    scheduler = AdaptiveReplicates(
+        cells,
+        target_half_width=target_half_width,
+        min_replicates=min_replicates,
+        max_runs=max_runs,
+    )
+    experiment_run = ExperimentRun(
+        scheduler,
+        _run_cell,
+        append_global_result,
+        max_parallel=parallel,
+        experiment_id=design.experiment_id,
+    )
+    experiment_run.start()
+    st.session_state.experiment_run = experiment_run
+
+
+def _render_summary(experiment_run: ExperimentRun) -> None:
+    import pandas as pd
+    import plotly.express as px
+
+    summary_df = pd.DataFrame(experiment_run.summary())
+    scored = summary_df.dropna(subset=["reached_rate"])
+    if not scored.empty:
+        fig = px.scatter(
+            scored,
+            x="reached_rate",
+            y="cell_id",
+            error_x=scored["ci_high"] - scored["reached_rate"],
+            error_x_minus=scored["reached_rate"] - scored["ci_low"],
+            color="closed",
+            labels={"reached_rate": "Reached rate", "cell_id": "Cell", "closed": "Closed"},
+        )
+        fig.update_xaxes(range=[0, 1], tickformat=".0%")
+        fig.update_layout(margin=dict(l=10, r=10, t=10, b=10))
+        st.plotly_chart(fig, width="stretch")
+    st.dataframe(
+        summary_df,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "reached_rate": st.column_config.NumberColumn("Reached rate", format="percent"),
+            "ci_low": st.column_config.NumberColumn("CI low", format="percent"),
+            "ci_high": st.column_config.NumberColumn("CI high", format="percent"),
+        },
+    )
+    scheduler = experiment_run.scheduler
+    fixed_runs = len(summary_df) * fixed_replicates(scheduler.target_half_width, scheduler.z)
+    st.caption(
+        f"Experiment `{experiment_run.experiment_id}`: {experiment_run.runs_completed} runs completed "
+        f"of a {scheduler.max_runs}-run budget. A fixed design guaranteeing ±{scheduler.target_half_width:.0%} "
+        f"in the {len(summary_df)} cells started so far needs {fixed_runs} runs."
+    )
+    if experiment_run.last_run_error:
+        st.warning(f"Last failed run: {experiment_run.last_run_error}")
+    if experiment_run.error:
+        st.error(f"Experiment stopped: {experiment_run.error}")
+
+
+st.title("Experiments")
+st.markdown(
+    """
+Replicate negotiations across the cells of an experiment design: a quick grid, or a JSON spec
+with a factorial or Latin hypercube design over rules, models and temperatures.
+Replicates are scheduled adaptively: each cell stops once the 95% Wilson interval of its
+reached rate is narrower than the target, and remaining runs go to the most uncertain cells.
+Every run is saved to Global Results, tagged with the experiment id and its cell id.
+"""
+)
+
+if "experiment_run" not in st.session_state:
+    st.session_state.experiment_run = None
+experiment_run = st.session_state.experiment_run
+running = experiment_run is not None and experiment_run.is_running()
+
+rules = get_active_rules()
+scenario_files = list_scenario_files()
+design_col, stopping_col = st.columns(2)
+with design_col:
+    st.markdown("##### Design")
+    default_scenario_file = st.selectbox("Scenario", scenario_files, help="Used by cells that do not vary the scenario.")
+    design_source = st.radio("Cells from", ["Grid", "Spec"], horizontal=True)
+    if design_source == "Grid":
+        selected_scenarios = st.multiselect("Scenarios", scenario_files, default=scenario_files[:1])
+        selected_modes = st.multiselect("Modes", MODE_OPTIONS, default=[rules.get("mode", "competitive")])
+        selected_models = st.multiselect(
+            "Agents Models",
+            MODEL_OPTIONS,
+            default=[rules["agents_model"]] if rules.get("agents_model") in MODEL_OPTIONS else MODEL_OPTIONS[1:2],
+        )
+        spec = {
+            "experiment_id": st.text_input("Experiment ID", value="grid"),
+            "design": "factorial",
+            "factors": {
+                "scenario_file": selected_scenarios,
+                "mode": selected_modes,
+                "agents_model": selected_models,
+            },
+        }
+    else:
+        spec_text = st.text_area(
+            "Experiment Spec (JSON)",
+            value=json.dumps(EXAMPLE_SPEC, indent=2),
+            height=320,
+            help=(
+                'Keys: experiment_id, design ("factorial" or "latin_hypercube"), factors, and optionally '
+                "samples (Latin hypercube), seed, and rules applied to every cell. Factors take a list of "
+                'levels; temperatures also take {"min", "max", "steps"}, or just min/max for Latin hypercube.'
+            ),
+        )
+        try:
+            spec = json.loads(spec_text)
+        except json.JSONDecodeError as exc:
+            spec = None
+            st.error(f"Invalid JSON: {exc}")
+
+with stopping_col:
+    st.markdown("##### Stopping Rule")
+    target_half_width = st.slider(
+        "Target CI Half-Width",
+        min_value=0.05,
+        max_value=0.3,
+        value=0.15,
+        step=0.01,
+        help="A cell stops once its reached-rate interval is within ± this value.",
+    )
+    min_replicates = st.number_input("Min Replicates per Cell", min_value=1, max_value=20, value=3, step=1)
+    max_runs = st.number_input("Run Budget", min_value=1, max_value=1000, value=30, step=1)
+    parallel_runs = st.number_input("Parallel Runs", min_value=1, max_value=8, value=4, step=1)
+    max_run_cost = st.number_input(
+        "Max Est. Cost per Run ($)",
+        min_value=0.0,
+        value=0.0,
+        step=0.05,
+        format="%.2f",
+        help="Cells whose projected cost per run is higher are left out of the experiment. 0 keeps every cell.",
+    )
+
+design = None
+if spec is not None:
+    try:
+        design = parse_experiment_spec(spec, rules)
+    except ValueError as exc:
+        st.error(f"Invalid experiment spec: {exc}")
+if design is not None:
+    st.caption(
+        f"{len(design):,} cells ({design.design.replace('_', ' ')}) · rules not in the design "
+        "come from the Negotiation Rules page."
+    )
+    profiles = _scenario_profiles(design, default_scenario_file)
+    priced_cells = list(itertools.islice(design.cells(default_scenario_file), ESTIMATED_CELLS))
+    estimates = estimate_cells(priced_cells, profiles.__getitem__)
+    affordable = estimates[estimates["run_cost_usd"] <= max_run_cost] if max_run_cost > 0 else estimates
+    with st.expander(f"First {PREVIEW_CELLS} cells"):
+        st.dataframe(
+            [
+                {"cell_id": cell.cell_id, **cell.levels, "run_cost_usd": cost, "run_seconds": seconds}
+                for cell, cost, seconds in zip(
+                    priced_cells[:PREVIEW_CELLS], estimates["run_cost_usd"], estimates["run_seconds"]
+                )
+            ],
+            hide_index=True,
+            width="stretch",
+            column_config={
+                "run_cost_usd": st.column_config.NumberColumn("Est. cost/run", format="dollar"),
+                "run_seconds": st.column_config.NumberColumn("Est. seconds/run", format="%.0f"),
+            },
+        )
+    priced = f"the first {len(priced_cells):,}" if len(priced_cells) < len(design) else f"all {len(priced_cells):,}"
+    if affordable.empty:
+        st.warning(f"None of {priced} cells is projected within the cost cap.")
+    else:
+        # The scheduler spreads the budget over cells; price it at the mean cell.
+        runs = int(max_runs)
+        batches = -(-runs // int(parallel_runs))
+        st.caption(
+            f"Projected for the {runs}-run budget: about {affordable['run_cost_usd'].mean() * runs:,.2f} USD, "
+            f"{(affordable['input_tokens'] + affordable['output_tokens']).mean() * runs:,.0f} tokens and "
+            f"{format_duration(batches * affordable['run_seconds'].mean())} with {int(parallel_runs)} parallel runs "
+            f"({len(affordable):,} of {priced} cells within the cost cap, "
+            f"{affordable['run_cost_usd'].min():.3f}–{affordable['run_cost_usd'].max():.3f} USD per run). "
+            "Upper bounds at list prices: runs that settle early cost less."
+        )
+
+start_col, cancel_col = st.columns(2)
+with start_col:
+    if st.button("Start Experiment", width="stretch", disabled=running or design is None or affordable.empty):
+        start_experiment(
+            design,
+            default_scenario_file,
+            profiles,
+            max_run_cost,
+            target_half_width,
+            int(min_replicates),
+            int(max_runs),
+            int(parallel_runs),
+        )
+        st.rerun()
+with cancel_col:
+    if st.button("Cancel", width="stretch", disabled=not running or experiment_run.cancelled):
+        experiment_run.cancel()
+
+
+@st.fragment(run_every="2s")
+def _experiment_progress() -> None:
+    _render_summary(st.session_state.experiment_run)
+    if not st.session_state.experiment_run.is_running():
+        st.rerun()
+
+
+if running:
+    _experiment_progress()
+elif experiment_run is not None:
+    _render_summary(experiment_run)
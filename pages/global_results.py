@@ -1,10 +1,26 @@
+import io
 import json
+from dataclasses import replace
+from itertools import chain
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from core.bargaining import frontier_distance, scenario_bargaining
+from core.negotiation_space import build_negotiation_space
+from core.proposals import format_proposal
+from core.strategy_sweep import sample_population, simulate_population, summarize_sweep
+from run_results_index import (
+    list_message_agents,
+    load_metric_sums,
+    load_outcome_counts,
+    search_messages,
+    sync_results_index,
+)
 from run_results_store import load_global_results
+from scenario_state import load_scenario, scenario_content_hash
 
 
 OUTCOME_COLOR_MAP = {
@@ -22,60 +38,198 @@ DIAGNOSTIC_COLUMNS = [
     ("Cooperation", "final_cooperation"),
 ]
 SCENARIO_FILTER_OPTIONS = ["Resource Division", "Salary Negotiation", "All"]
+# Transcript-sized columns left out of the "summary" export.
+EXPORT_DETAIL_COLUMNS = ["conversation_history", "utility_total_history", "local_utility_history", "final_summary"]
+EXPORT_CHUNK_ROWS = 5000
+STATUS_LABELS = ["reached", "failed", "ongoing"]
+STATUS_DTYPE = pd.CategoricalDtype([*STATUS_LABELS, "unknown"])
+OUTCOME_CLASS_ORDER = ["reached", "failed", "stalled"]
+OUTCOME_DTYPE = pd.CategoricalDtype([*OUTCOME_CLASS_ORDER, "other"])
+# Shape written by dialogue_simulation._utility_total_history_json; rows that
+# match it are decoded in bulk, anything else falls back to json.loads.
+_UTILITY_POINT_PATTERN = r'\{"round": -?\d+, "utility_total": -?\d+\}'
+_CANONICAL_UTILITY_HISTORY = rf"\[(?:{_UTILITY_POINT_PATTERN}(?:, {_UTILITY_POINT_PATTERN})*)?\]"
+_UTILITY_HISTORY_NOISE = b'{}[]":roundtilya_ '
+BASELINE_SWEEP_TRIALS = [10_000, 100_000, 1_000_000]
+
+
+def _column(source_df: pd.DataFrame, name: str) -> pd.Series:
+    if name in source_df.columns:
+        return source_df[name]
+    return pd.Series(pd.NA, index=source_df.index, dtype=object)
+
+
+def _to_int(values: pd.Series) -> pd.Series:
+    # Columns such as max_rounds repeat a handful of values: parse each distinct one once.
+    codes, uniques = pd.factorize(values)
+    numbers = pd.to_numeric(pd.Series(uniques, dtype=object), errors="coerce")
+    numbers = numbers.where(numbers % 1 == 0).to_numpy(dtype="float64", na_value=np.nan)
+    parsed = np.append(numbers, np.nan)[codes]
+    return pd.Series(parsed, index=values.index).astype("Int64")
+
+
+def _normalize_status(values: pd.Series) -> pd.Series:
+    # Normalize each distinct label once instead of once per row.
+    raw = values.astype("string").fillna("").astype("category")
+    labels = raw.cat.categories.to_series()
+    normalized = labels.str.split(":", n=1).str[0].str.strip().str.lower()
+    normalized = normalized.where(normalized.isin(STATUS_LABELS), "unknown")
+    return raw.map(dict(zip(labels, normalized))).astype(STATUS_DTYPE)
+
+
+def _prepare_runs_frame(source_df: pd.DataFrame) -> pd.DataFrame:
+    """Typed columns shared by every aggregate on this page, computed in one pass."""
+    runs_df = pd.DataFrame(index=source_df.index)
+    status = _normalize_status(_column(source_df, "agreement_status"))
+    effective_rounds = _to_int(_column(source_df, "effective_rounds"))
+    max_rounds = _to_int(_column(source_df, "max_rounds"))
+
+    stalled = (
+        (status == "ongoing")
+        & (max_rounds > 0).fillna(False)
+        & (effective_rounds >= max_rounds).fillna(False)
+    )
+    outcome_class = np.select(
+        [status.isin(["reached", "failed"]), stalled],
+        [status.astype(str), "stalled"],
+        default="other",
+    )
 
+    run_id = _column(source_df, "run_id").fillna("").astype(str).str.strip()
+    row_keys = pd.Series(np.arange(1, len(source_df) + 1), index=source_df.index).astype(str)
 
-def _to_int(value):
+    runs_df["status"] = status
+    runs_df["outcome_class"] = pd.Categorical(outcome_class, dtype=OUTCOME_DTYPE)
+    runs_df["effective_rounds"] = effective_rounds
+    runs_df["max_rounds"] = max_rounds
+    runs_df["mode"] = _column(source_df, "mode").fillna("").astype(str).str.strip().str.lower()
+    runs_df["run_key"] = run_id.where(run_id != "", "row_" + row_keys)
+    return runs_df
+
+
+def _decode_utility_history(value) -> list:
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str) or not value.strip():
+        return []
     try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _normalize_status(value) -> str:
-    if not isinstance(value, str):
-        return "unknown"
-    label = value.split(":", 1)[0].strip().lower()
-    if label in {"reached", "failed", "ongoing"}:
-        return label
-    return "unknown"
-
-
-def _classify_outcome(row: pd.Series) -> str:
-    status = _normalize_status(row.get("agreement_status"))
-    if status in {"reached", "failed"}:
-        return status
-
-    effective_rounds = _to_int(row.get("effective_rounds"))
-    max_rounds = _to_int(row.get("max_rounds"))
-    if (
-        status == "ongoing"
-        and effective_rounds is not None
-        and max_rounds is not None
-        and max_rounds > 0
-        and effective_rounds >= max_rounds
-    ):
-        return "stalled"
-    return "other"
-
-
-def _build_mode_outcome_table(source_df: pd.DataFrame) -> pd.DataFrame:
-    display_columns = ["Mode", "Failed", "Ongoing", "Reached"]
-    if "mode" not in source_df.columns or "agreement_status" not in source_df.columns:
-        return pd.DataFrame(columns=display_columns)
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _explode_utility_histories(histories: pd.Series) -> pd.DataFrame:
+    """Flatten every run's utility_total_history into (row, Round, Utility Total) points."""
+    raw = histories.astype("string").fillna("")
+    canonical = raw.str.fullmatch(_CANONICAL_UTILITY_HISTORY).fillna(False) & (raw != "[]")
+    fast_raw = raw[canonical]
+
+    frames = []
+    if not fast_raw.empty:
+        lengths = fast_raw.str.count(r"\{").to_numpy()
+        digits = ",".join(fast_raw).encode("ascii").translate(None, _UTILITY_HISTORY_NOISE)
+        pairs = np.array(digits.decode("ascii").split(","), dtype=np.int64).reshape(-1, 2)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "row": np.repeat(fast_raw.index.to_numpy(), lengths),
+                    "Round": pairs[:, 0],
+                    "Utility Total": pairs[:, 1],
+                }
+            )
+        )
+
+    slow_raw = histories[~canonical & (raw != "") & (raw != "[]")]
+    if not slow_raw.empty:
+        parsed = [_decode_utility_history(value) for value in slow_raw]
+        lengths = np.fromiter(map(len, parsed), dtype=np.int64, count=len(parsed))
+        items = list(chain.from_iterable(parsed))
+        offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions = pd.Series(np.arange(len(items)) - offsets + 1)
+        rounds = _to_int(
+            pd.Series([item.get("round") if isinstance(item, dict) else None for item in items], dtype=object)
+        )
+        totals = _to_int(
+            pd.Series(
+                [item.get("utility_total") if isinstance(item, dict) else item for item in items],
+                dtype=object,
+            )
+        )
+        frames.append(
+            pd.DataFrame(
+                {
+                    "row": np.repeat(slow_raw.index.to_numpy(), lengths),
+                    "Round": rounds.fillna(positions).astype("int64"),
+                    "Utility Total": totals,
+                }
+            ).dropna(subset=["Utility Total"])
+        )
+
+    if not frames:
+        return pd.DataFrame(columns=["row", "Round", "Utility Total"])
+    return pd.concat(frames, ignore_index=True)
 
-    working_df = source_df[["mode", "agreement_status"]].copy()
-    working_df["mode"] = working_df["mode"].fillna("").astype(str).str.strip().str.lower()
-    working_df["outcome"] = working_df["agreement_status"].apply(_normalize_status)
-    working_df = working_df[
-        working_df["mode"].isin(TABLE_MODE_ORDER)
-        & working_df["outcome"].isin(TABLE_OUTCOME_ORDER)
+
+def _csv_export(source_df: pd.DataFrame, columns: list[str]):
+    # Serialized only when the download is clicked, one chunk of rows at a time.
+    def _build() -> io.BytesIO:
+        buffer = io.BytesIO()
+        for start in range(0, len(source_df), EXPORT_CHUNK_ROWS):
+            chunk = source_df.iloc[start:start + EXPORT_CHUNK_ROWS]
+            buffer.write(chunk.to_csv(index=False, header=start == 0, columns=columns).encode("utf-8"))
+        buffer.seek(0)
+        return buffer
+
+    return _build
+
+
+def _parquet_export(source_df: pd.DataFrame):
+    def _build() -> io.BytesIO:
+        buffer = io.BytesIO()
+        source_df.to_parquet(buffer, index=False)
+        buffer.seek(0)
+        return buffer
+
+    return _build
+
+
+@st.cache_data(show_spinner="Simulating baseline negotiations...", max_entries=8)
+def _baseline_sweep(scenario_file: str, content_hash: str, trials: int, max_rounds: int) -> tuple[pd.DataFrame, float, float]:
+    """Strategy-pair summary plus overall agreement rate and mean rounds to agreement.
+
+    `content_hash` only keys the cache, so an edited scenario is simulated again.
+    """
+    space = build_negotiation_space(load_scenario(scenario_file))
+    result = simulate_population(space, sample_population(len(space.agent_ids), trials), max_rounds)
+    rounds_to_agreement = float(result.rounds[result.agreement].mean()) if result.agreement.any() else float("nan")
+    return summarize_sweep(result, space.agent_names), float(result.agreement.mean()), rounds_to_agreement
+
+
+def _final_local_utilities(histories: pd.Series, agent_names: tuple[str, ...]) -> np.ndarray:
+    """Each run's local utilities at its last round, shaped (runs, agents); NaN where missing."""
+    finals = np.full((len(histories), len(agent_names)), np.nan)
+    for position, value in enumerate(histories):
+        points = _decode_utility_history(value)
+        utilities = points[-1].get("utilities") if points and isinstance(points[-1], dict) else None
+        if isinstance(utilities, dict):
+            finals[position] = [utilities.get(name, np.nan) for name in agent_names]
+    return finals
+
+
+def _build_mode_outcome_table(outcome_counts_df: pd.DataFrame) -> pd.DataFrame:
+    display_columns = ["Mode", "Failed", "Ongoing", "Reached"]
+    working_df = outcome_counts_df[
+        outcome_counts_df["mode"].isin(TABLE_MODE_ORDER)
+        & outcome_counts_df["outcome"].isin(TABLE_OUTCOME_ORDER)
     ]
     if working_df.empty:
         return pd.DataFrame(columns=display_columns)
 
     counts_df = (
-        working_df.groupby(["mode", "outcome"])
-        .size()
+        working_df.groupby(["mode", "outcome"])["runs"]
+        .sum()
         .unstack(fill_value=0)
         .reindex(index=TABLE_MODE_ORDER, columns=TABLE_OUTCOME_ORDER, fill_value=0)
     )
@@ -96,81 +250,38 @@ def _build_mode_outcome_table(source_df: pd.DataFrame) -> pd.DataFrame:
     return percentages_df[display_columns]
 
 
-def _build_diagnostics_outcome_table(source_df: pd.DataFrame) -> pd.DataFrame:
+def _build_diagnostics_outcome_table(
+    outcome_counts_df: pd.DataFrame,
+    metric_sums_df: pd.DataFrame,
+) -> pd.DataFrame:
     display_columns = ["Outcome", "Persuasion", "Deception", "Concession", "Cooperation"]
-    if "agreement_status" not in source_df.columns:
+    if not outcome_counts_df["outcome"].isin(DIAGNOSTIC_OUTCOME_ORDER).any():
         return pd.DataFrame(columns=display_columns)
 
     metric_sources = [source_col for _, source_col in DIAGNOSTIC_COLUMNS]
-    if any(source_col not in source_df.columns for source_col in metric_sources):
-        return pd.DataFrame(columns=display_columns)
-
-    working_df = source_df[["agreement_status", *metric_sources]].copy()
-    working_df["outcome"] = working_df["agreement_status"].apply(_normalize_status)
-    working_df = working_df[working_df["outcome"].isin(DIAGNOSTIC_OUTCOME_ORDER)]
-    if working_df.empty:
-        return pd.DataFrame(columns=display_columns)
-
-    for source_col in metric_sources:
-        working_df[source_col] = pd.to_numeric(working_df[source_col], errors="coerce")
+    working_df = metric_sums_df[metric_sums_df["outcome"].isin(DIAGNOSTIC_OUTCOME_ORDER)]
+    totals_df = working_df.groupby(["outcome", "metric"])[["count", "total"]].sum()
+    means = (totals_df["total"] / totals_df["count"].where(totals_df["count"] > 0)).unstack()
 
     diagnostics_df = (
-        working_df.groupby("outcome", as_index=True)[metric_sources]
-        .mean(numeric_only=True)
-        .reindex(DIAGNOSTIC_OUTCOME_ORDER)
+        means.reindex(index=DIAGNOSTIC_OUTCOME_ORDER, columns=metric_sources)
         .rename(
             index=lambda value: value.capitalize(),
             columns={source_col: label for label, source_col in DIAGNOSTIC_COLUMNS},
         )
+        .rename_axis(index="Outcome", columns=None)
         .reset_index()
-        .rename(columns={"outcome": "Outcome"})
     )
     return diagnostics_df[display_columns]
 
 
-def _parse_utility_total_history(value) -> list[dict[str, int]]:
-    if isinstance(value, list):
-        parsed = value
-    elif isinstance(value, str) and value.strip():
-        try:
-            parsed = json.loads(value)
-        except json.JSONDecodeError:
-            return []
-    else:
-        return []
-
-    if not isinstance(parsed, list):
-        return []
-
-    history = []
-    for idx, item in enumerate(parsed, start=1):
-        if isinstance(item, dict):
-            round_id = _to_int(item.get("round"))
-            utility_total = _to_int(item.get("utility_total"))
-        else:
-            round_id = idx
-            utility_total = _to_int(item)
-
-        if round_id is None:
-            round_id = idx
-        if utility_total is None:
-            continue
-
-        history.append(
-            {
-                "Round": round_id,
-                "Utility Total": utility_total,
-            }
-        )
-    return history
-
-
 st.title("Global Results")
 
 rows = load_global_results()
 if not rows:
     st.info("No saved experiments yet. Complete or stop a simulation to persist a run.")
     st.stop()
+sync_results_index(rows)
 
 df = pd.DataFrame(rows)
 if "timestamp_utc" in df.columns:
@@ -194,12 +305,11 @@ if df_filtered.empty:
     st.info(f"No rows available for scenario filter: {selected_scenario}.")
     st.stop()
 
-status_series = df_filtered.get("agreement_status", pd.Series(index=df_filtered.index, dtype=str)).apply(_normalize_status)
-outcome_series = df_filtered.apply(_classify_outcome, axis=1)
-total_runs = len(df_filtered)
-reached_runs = int((status_series == "reached").sum())
-failed_runs = int((status_series == "failed").sum())
-stalled_runs = int((outcome_series == "stalled").sum())
+runs_df = _prepare_runs_frame(df_filtered)
+total_runs = len(runs_df)
+reached_runs = int((runs_df["status"] == "reached").sum())
+failed_runs = int((runs_df["status"] == "failed").sum())
+stalled_runs = int((runs_df["outcome_class"] == "stalled").sum())
 
 metric_col_1, metric_col_2, metric_col_3, metric_col_4 = st.columns(4)
 with metric_col_1:
@@ -212,16 +322,77 @@ with metric_col_4:
     st.metric("Stalled", stalled_runs)
 
 st.dataframe(df_filtered, width="stretch")
-st.download_button(
-    "Download CSV",
-    data=df_filtered.to_csv(index=False).encode("utf-8"),
-    file_name="global_results_export.csv",
-    mime="text/csv",
+export_options = {
+    "CSV": (
+        _csv_export(df_filtered, list(df_filtered.columns)),
+        "global_results_export.csv",
+        "text/csv",
+    ),
+    "CSV (summary columns)": (
+        _csv_export(
+            df_filtered,
+            [col for col in df_filtered.columns if col not in EXPORT_DETAIL_COLUMNS],
+        ),
+        "global_results_summary.csv",
+        "text/csv",
+    ),
+    "Parquet": (
+        _parquet_export(df_filtered),
+        "global_results_export.parquet",
+        "application/vnd.apache.parquet",
+    ),
+}
+export_format_col, export_button_col = st.columns([1, 3], vertical_alignment="bottom")
+with export_format_col:
+    export_format = st.selectbox("Export format", list(export_options))
+with export_button_col:
+    export_data, export_file_name, export_mime = export_options[export_format]
+    st.download_button(
+        f"Download {export_format}",
+        data=export_data,
+        file_name=export_file_name,
+        mime=export_mime,
+        on_click="ignore",
+    )
+aggregate_scenario = None if selected_scenario == "All" else selected_scenario
+
+st.subheader("Transcript Search")
+search_col, search_mode_col, search_agent_col, search_round_col = st.columns([3, 1, 1, 1])
+with search_col:
+    search_text = st.text_input("Search transcripts", placeholder="e.g. vesting cliff")
+with search_mode_col:
+    search_mode = st.selectbox("Mode", ["All", *TABLE_MODE_ORDER], key="search_mode")
+with search_agent_col:
+    search_agent = st.selectbox(
+        "Agent",
+        ["All", *list_message_agents(aggregate_scenario)],
+        key="search_agent",
+    )
+with search_round_col:
+    search_round = st.number_input("Round", min_value=0, step=1, value=0, help="0 matches any round.")
+
+if search_text.strip():
+    matches_df = search_messages(
+        search_text,
+        scenario_name=aggregate_scenario,
+        mode=None if search_mode == "All" else search_mode,
+        agent=None if search_agent == "All" else search_agent,
+        round_id=int(search_round) or None,
+    )
+    if matches_df.empty:
+        st.caption(f"No messages mention \"{search_text.strip()}\".")
+    else:
+        st.caption(f"{len(matches_df)} message(s) across {matches_df['run_id'].nunique()} run(s).")
+        st.dataframe(matches_df, width="stretch", hide_index=True)
+
+# Summary tables read the aggregates maintained on append instead of the raw rows.
+outcome_counts_df = load_outcome_counts(aggregate_scenario)
+mode_outcome_table_df = _build_mode_outcome_table(outcome_counts_df)
+diagnostics_table_df = _build_diagnostics_outcome_table(
+    outcome_counts_df,
+    load_metric_sums(aggregate_scenario),
 )
 
-mode_outcome_table_df = _build_mode_outcome_table(df_filtered)
-diagnostics_table_df = _build_diagnostics_outcome_table(df_filtered)
-
 summary_table_col_1, summary_table_col_2 = st.columns(2, gap="large")
 with summary_table_col_1:
     st.subheader("Outcome distribution by negotiation mode (percentages)")
@@ -246,34 +417,14 @@ with summary_table_col_2:
         st.table(diagnostics_display_df)
 
 st.subheader("Utility Trends")
-utility_rows = []
-for idx, row in df_filtered.reset_index(drop=True).iterrows():
-    run_id = str(row.get("run_id", "")).strip()
-    scenario_name = str(row.get("scenario_name", "")).strip() or "Unknown"
-    timestamp_utc = str(row.get("timestamp_utc", "")).strip()
-    run_key = run_id or f"row_{idx + 1}"
-    run_label = run_id[:8] if run_id else f"run_{idx + 1}"
-    outcome_class = _classify_outcome(row)
-
-    for point in _parse_utility_total_history(row.get("utility_total_history", "")):
-        utility_rows.append(
-            {
-                "run_key": run_key,
-                "run_id": run_id,
-                "run_label": run_label,
-                "scenario_name": scenario_name,
-                "timestamp_utc": timestamp_utc,
-                "outcome_class": outcome_class,
-                "Round": point["Round"],
-                "Utility Total": point["Utility Total"],
-            }
-        )
+utility_points_df = _explode_utility_histories(_column(df_filtered, "utility_total_history"))
+utility_df = utility_points_df.join(runs_df[["run_key", "outcome_class"]], on="row")
 
-if not utility_rows:
+if utility_df.empty:
     st.info(f"Utility history not available yet for scenario: {selected_scenario}.")
 else:
-    utility_df = pd.DataFrame(utility_rows)
-    classified_df = utility_df[utility_df["outcome_class"].isin(["reached", "failed", "stalled"])].copy()
+    classified_df = utility_df[utility_df["outcome_class"].isin(OUTCOME_CLASS_ORDER)].copy()
+    classified_df["outcome_class"] = classified_df["outcome_class"].astype(str)
     if classified_df.empty:
         st.info(f"Not enough classified runs yet for scenario: {selected_scenario}.")
     else:
@@ -295,7 +446,7 @@ else:
             st.plotly_chart(trend_fig, width="stretch")
 
         with final_col:
-            final_utility_df = classified_df.sort_values("Round").groupby("run_key", as_index=False).tail(1)
+            final_utility_df = classified_df.sort_values("Round", kind="stable").drop_duplicates("run_key", keep="last")
             global_avg_df = final_utility_df.groupby("outcome_class", as_index=False).agg(
                 avg_utility=("Utility Total", "mean"),
                 runs=("run_key", "nunique"),
@@ -316,33 +467,22 @@ else:
             st.plotly_chart(avg_fig, width="stretch")
 
 
-        duration_rows = []
-        for idx, row in df_filtered.reset_index(drop=True).iterrows():
-            outcome_class = _classify_outcome(row)
-            if outcome_class not in {"reached", "failed", "stalled"}:
-                continue
-
-            effective_rounds = _to_int(row.get("effective_rounds"))
-            if effective_rounds is None:
-                continue
-
-            run_id = str(row.get("run_id", "")).strip()
-            run_key = run_id or f"row_{idx + 1}"
-            duration_rows.append(
-                {
-                    "outcome_class": outcome_class,
-                    "effective_rounds": effective_rounds,
-                    "run_key": run_key,
-                }
-            )
-
-        if not duration_rows:
+        duration_df = runs_df[
+            runs_df["outcome_class"].isin(OUTCOME_CLASS_ORDER) & runs_df["effective_rounds"].notna()
+        ]
+        if duration_df.empty:
             st.caption(f"Round duration unavailable for scenario: {selected_scenario}.")
         else:
-            duration_df = pd.DataFrame(duration_rows)
-            avg_duration_df = duration_df.groupby("outcome_class", as_index=False).agg(
-                avg_rounds=("effective_rounds", "mean"),
-                runs=("run_key", "nunique"),
+            avg_duration_df = (
+                duration_df.assign(
+                    outcome_class=duration_df["outcome_class"].astype(str),
+                    effective_rounds=duration_df["effective_rounds"].astype("float64"),
+                )
+                .groupby("outcome_class", as_index=False)
+                .agg(
+                    avg_rounds=("effective_rounds", "mean"),
+                    runs=("run_key", "nunique"),
+                )
             )
             duration_col, mode_col = st.columns([2, 1], gap="small")
             with duration_col:
@@ -367,19 +507,14 @@ else:
                 st.plotly_chart(duration_fig, width="stretch")
 
             with mode_col:
-                mode_rows = []
-                for _, mode_row in df_filtered.reset_index(drop=True).iterrows():
-                    effective_rounds = _to_int(mode_row.get("effective_rounds"))
-                    if effective_rounds is None:
-                        continue
-                    mode_name = str(mode_row.get("mode", "")).strip().lower() or "unknown"
-                    mode_rows.append({"mode": mode_name, "rounds": effective_rounds})
-
-                if not mode_rows:
+                mode_rounds_df = runs_df[runs_df["effective_rounds"].notna()]
+                if mode_rounds_df.empty:
                     st.caption(f"Mode data unavailable for scenario: {selected_scenario}.")
                 else:
-                    mode_df = pd.DataFrame(mode_rows).groupby("mode", as_index=False).agg(
-                        rounds=("rounds", "sum")
+                    mode_df = (
+                        mode_rounds_df.assign(mode=mode_rounds_df["mode"].replace("", "unknown"))
+                        .groupby("mode", as_index=False)
+                        .agg(rounds=("effective_rounds", "sum"))
                     )
                     mode_fig = px.pie(
                         mode_df,
@@ -389,3 +524,150 @@ else:
                     )
                     mode_fig.update_layout(margin=dict(l=10, r=10, t=40, b=10))
                     st.plotly_chart(mode_fig, width="stretch")
+
+if aggregate_scenario is not None:
+    st.subheader("Analytic Baseline")
+    st.caption(
+        "Rule-based concession strategies (see Negotiation Rules > Agent Policies) simulated on this "
+        "scenario's private goals, without any model call, as a reference for the LLM runs above."
+    )
+    scenario_files = _column(df_filtered, "scenario_file").dropna().astype(str)
+    baseline_col_1, baseline_col_2 = st.columns([1, 3], vertical_alignment="bottom")
+    with baseline_col_1:
+        sweep_trials = st.selectbox(
+            "Simulated negotiations",
+            BASELINE_SWEEP_TRIALS,
+            format_func=lambda value: f"{value:,}",
+        )
+    with baseline_col_2:
+        run_sweep = st.toggle("Compare with baseline strategies", value=False)
+
+    if run_sweep and scenario_files.empty:
+        st.info("Scenario file unknown for these runs.")
+    elif run_sweep:
+        sweep_file = scenario_files.mode().iloc[0]
+        llm_max_rounds = runs_df["max_rounds"].dropna()
+        sweep_max_rounds = int(llm_max_rounds.median()) if not llm_max_rounds.empty else 10
+        try:
+            sweep_summary_df, baseline_agreement_rate, baseline_rounds = _baseline_sweep(
+                sweep_file,
+                scenario_content_hash(sweep_file),
+                int(sweep_trials),
+                sweep_max_rounds,
+            )
+        except (OSError, ValueError) as exc:
+            st.warning(f"Baseline simulation unavailable: {exc}")
+        else:
+            reached_rounds = runs_df.loc[runs_df["status"] == "reached", "effective_rounds"].dropna()
+            compare_col_1, compare_col_2, compare_col_3, compare_col_4 = st.columns(4)
+            with compare_col_1:
+                st.metric("LLM agreement rate", f"{reached_runs / total_runs:.1%}")
+            with compare_col_2:
+                st.metric("Baseline agreement rate", f"{baseline_agreement_rate:.1%}")
+            with compare_col_3:
+                st.metric(
+                    "LLM rounds to agreement",
+                    "-" if reached_rounds.empty else f"{reached_rounds.astype('float64').mean():.1f}",
+                )
+            with compare_col_4:
+                st.metric(
+                    "Baseline rounds to agreement",
+                    "-" if np.isnan(baseline_rounds) else f"{baseline_rounds:.1f}",
+                )
+            st.caption(f"{int(sweep_trials):,} simulated negotiations, max {sweep_max_rounds} rounds.")
+            st.dataframe(
+                sweep_summary_df,
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "agreement_rate": st.column_config.ProgressColumn(
+                        "agreement_rate", min_value=0.0, max_value=1.0, format="percent"
+                    ),
+                },
+            )
+
+if aggregate_scenario is not None:
+    st.subheader("Bargaining Efficiency")
+    st.caption(
+        "Pareto frontier, zone of possible agreement (ZOPA) and Nash bargaining point of the scenario, "
+        "scored on the agents' private goals (0 = reservation, 1 = aspiration) and computed once per scenario version."
+    )
+    scenario_files = _column(df_filtered, "scenario_file").dropna().astype(str)
+    if scenario_files.empty:
+        st.info("Scenario file unknown for these runs.")
+    else:
+        frontier_file = scenario_files.mode().iloc[0]
+        try:
+            frontier_payload = load_scenario(frontier_file)
+            analysis = scenario_bargaining(frontier_payload, scenario_content_hash(frontier_file))
+        except (OSError, ValueError) as exc:
+            st.warning(f"Bargaining analysis unavailable: {exc}")
+        else:
+            final_utilities = _final_local_utilities(_column(df_filtered, "local_utility_history"), analysis.agent_names)
+            scored = ~np.isnan(final_utilities).any(axis=1)
+            # Runs store their distance at save time; only legacy rows without one are scored here.
+            distances = pd.to_numeric(_column(df_filtered, "frontier_distance"), errors="coerce").to_numpy(dtype=float)
+            legacy = scored & np.isnan(distances)
+            if legacy.any():
+                distances[legacy] = frontier_distance(analysis, final_utilities[legacy])
+            reached = (runs_df["status"] == "reached").to_numpy()
+
+            efficiency_col_1, efficiency_col_2, efficiency_col_3, efficiency_col_4 = st.columns(4)
+            with efficiency_col_1:
+                st.metric("ZOPA", f"{analysis.zopa_share:.1%} of offers" if analysis.has_zopa else "Empty")
+            with efficiency_col_2:
+                st.metric(
+                    "Nash utilities",
+                    "-" if analysis.nash_utilities is None else " / ".join(f"{value:.2f}" for value in analysis.nash_utilities),
+                )
+            with efficiency_col_3:
+                st.metric(
+                    "Distance to frontier (reached)",
+                    "-" if not (scored & reached).any() else f"{np.mean(distances[scored & reached]):.3f}",
+                )
+            with efficiency_col_4:
+                st.metric("Runs scored", f"{int(scored.sum())} / {len(scored)}")
+            st.caption(f"{analysis.grid_points:,} feasible offers scored; distance 0 means no offer on the frontier is better for every agent.")
+
+            frontier_col, nash_col = st.columns([3, 2], gap="small")
+            with frontier_col:
+                if len(analysis.agent_names) == 2:
+                    first_agent, second_agent = analysis.agent_names
+                    frontier_df = pd.DataFrame(analysis.frontier_utilities, columns=[first_agent, second_agent])
+                    frontier_fig = px.line(frontier_df, x=first_agent, y=second_agent, markers=True, title="Pareto Frontier")
+                    frontier_fig.data[0].name = "Pareto frontier"
+                    frontier_fig.data[0].showlegend = True
+                    if scored.any():
+                        runs_points_df = pd.DataFrame(final_utilities[scored], columns=[first_agent, second_agent])
+                        runs_points_df["outcome_class"] = runs_df["outcome_class"].astype(str).to_numpy()[scored]
+                        for trace in px.scatter(
+                            runs_points_df,
+                            x=first_agent,
+                            y=second_agent,
+                            color="outcome_class",
+                            color_discrete_map=OUTCOME_COLOR_MAP,
+                        ).data:
+                            frontier_fig.add_trace(trace)
+                    if analysis.nash_utilities is not None:
+                        frontier_fig.add_scatter(
+                            x=[analysis.nash_utilities[0]],
+                            y=[analysis.nash_utilities[1]],
+                            mode="markers",
+                            marker={"symbol": "star", "size": 16, "color": "#ff7f0e"},
+                            name="Nash point",
+                        )
+                    frontier_fig.update_layout(margin=dict(l=10, r=10, t=40, b=10))
+                    frontier_fig.update_xaxes(range=[-0.05, 1.05])
+                    frontier_fig.update_yaxes(range=[-0.05, 1.05])
+                    st.plotly_chart(frontier_fig, width="stretch")
+                else:
+                    st.caption("The frontier chart is drawn for two-party scenarios only.")
+            with nash_col:
+                if analysis.nash_offer is None:
+                    st.info("No offer meets every agent's reservation values.")
+                else:
+                    # The canonical frame is the first agent's own view of an offer; categorical
+                    # terms are not part of the analysis, so they are left out of the block.
+                    numeric_space = replace(build_negotiation_space(frontier_payload), categorical_issues=())
+                    st.markdown(f"**Nash bargaining point**, as {analysis.agent_names[0]} would state it:")
+                    st.code(format_proposal(numeric_space, np.round(analysis.nash_offer, 2), {}), language=None)
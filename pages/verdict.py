@@ -1,16 +1,9 @@
-import pandas as pd
-import plotly.express as px
 import streamlit as st
 
+from round_ledger import get_evaluations_df
 from scenario_state import get_active_scenario
 
 
-METRIC_ALIASES = {
-    "fairness": ["fairness", "perceived_fairness"],
-    "manipulativeness": ["manipulativeness", "manipulation_risk"],
-}
-
-
 def _to_int(value):
     try:
         return int(value)
@@ -25,20 +18,6 @@ def _first_non_empty(*values):
     return None
 
 
-def _metric_value(row: dict, metric_name: str):
-    keys = [metric_name] + METRIC_ALIASES.get(metric_name, [])
-    for key in keys:
-        value = _to_int(row.get(key))
-        if value is not None:
-            return value
-    return None
-
-
-def _utility_sign(metric_spec: dict) -> int:
-    utility_score = str(metric_spec.get("utility_score", "positive")).strip().lower()
-    return -1 if utility_score in {"negative", "minus", "-1"} else 1
-
-
 st.title("Outcome Explanation")
 
 active_file, active_payload = get_active_scenario()
@@ -59,8 +38,12 @@ if not final_ready:
     )
     st.stop()
 
-evaluations_df = st.session_state.get("evaluations_df")
-if not isinstance(evaluations_df, pd.DataFrame) or evaluations_df.empty:
+# Charting libraries load only once a verdict is available.
+import plotly.express as px
+from derived_metrics import get_round_metrics
+
+evaluations_df = get_evaluations_df()
+if evaluations_df.empty:
     st.info("No round data available to build verdict charts.")
     st.stop()
 
@@ -72,26 +55,7 @@ evaluations_df = evaluations_df.sort_values("round").reset_index(drop=True)
 records = evaluations_df.to_dict(orient="records")
 
 metrics = active_payload.get("metrics", {}) if isinstance(active_payload, dict) else {}
-numeric_metric_names = [
-    metric_name
-    for metric_name, metric_spec in metrics.items()
-    if isinstance(metric_spec, dict)
-    and str(metric_spec.get("type", "")).lower() not in {"boolean", "enum", "multiclass", "categorical"}
-]
-
-utility_rows = []
-for row in records:
-    total = 0
-    has_values = False
-    for metric_name in numeric_metric_names:
-        metric_value = _metric_value(row, metric_name)
-        if metric_value is None:
-            continue
-        total += _utility_sign(metrics.get(metric_name, {})) * metric_value
-        has_values = True
-    utility_rows.append({"Round": row.get("round"), "Utility Total": total if has_values else None})
-
-utility_df = pd.DataFrame(utility_rows).dropna(subset=["Utility Total"])
+utility_df = get_round_metrics(metrics).utility_frame().dropna(subset=["Utility Total"])
 if utility_df.empty:
     st.info("Utility total is not available yet.")
     st.stop()
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def flatten_evaluation(round_id: int, evaluation: dict) -> dict:
+    """Flatten one round judge payload into a scalar table row."""
+    row = {"round": round_id}
+    for key, value in evaluation.items():
+        if isinstance(value, list):
+            row[key] = ", ".join(str(item) for item in value)
+        elif isinstance(value, dict):
+            row[key] = str(value)
+        else:
+            row[key] = value
+    return row
+
+
+def _ledger() -> list[dict]:
+    if "round_ledger" not in st.session_state:
+        st.session_state.round_ledger = []
+    return st.session_state.round_ledger
+
+
+def append_round_evaluation(round_id: int, evaluation: dict, extra: dict | None = None) -> None:
+    """Record a round judge evaluation in the session's append-only ledger.
+
+    `extra` holds locally computed columns (e.g. offer_gap) stored next to the judge's.
+    """
+    row = flatten_evaluation(round_id, evaluation)
+    if extra:
+        row.update(extra)
+    _ledger().append(row)
+
+
+def get_round_count() -> int:
+    return len(_ledger())
+
+
+def reset_round_ledger() -> None:
+    st.session_state.round_ledger = []
+    st.session_state.round_ledger_df = None
+
+
+def get_evaluations_df() -> "pd.DataFrame":
+    """Materialize the ledger as a DataFrame, rebuilt only when rounds were added.
+
+    The returned frame is shared across reruns and pages; treat it as read-only.
+    """
+    import pandas as pd
+
+    rows = _ledger()
+    cache_key = (st.session_state.get("run_id"), len(rows))
+    cached = st.session_state.get("round_ledger_df")
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    df = pd.DataFrame(rows) if rows else pd.DataFrame()
+    st.session_state.round_ledger_df = (cache_key, df)
+    return df
@@ -0,0 +1,499 @@
+import json
+import math
+import sqlite3
+import statistics
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+RESULTS_INDEX_PATH = Path("output") / "results_index.sqlite"
+AGGREGATE_METRIC_COLUMNS = [
+    "final_persuasion",
+    "final_deception",
+    "final_concession",
+    "final_cooperation",
+]
+STATUS_LABELS = {"reached", "failed", "ongoing"}
+NON_NUMERIC_METRIC_TYPES = {"boolean", "enum", "multiclass", "categorical"}
+# Most recent rounds and messages behind the call-history figures.
+CALL_HISTORY_SAMPLE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outcome_counts (
+    scenario_name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    agents_model TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    PRIMARY KEY (scenario_name, mode, outcome, agents_model)
+);
+CREATE TABLE IF NOT EXISTS metric_sums (
+    scenario_name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    agents_model TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    total_sq REAL NOT NULL,
+    PRIMARY KEY (scenario_name, mode, outcome, agents_model, metric)
+);
+CREATE TABLE IF NOT EXISTS round_evaluations (
+    run_id TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    scenario_file TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    agreement_status TEXT,
+    summary TEXT,
+    judge_latency_ms REAL,
+    judge_tier TEXT,
+    PRIMARY KEY (run_id, round)
+);
+CREATE INDEX IF NOT EXISTS round_evaluations_scenario
+    ON round_evaluations (scenario_file, mode, round);
+CREATE TABLE IF NOT EXISTS round_metrics (
+    run_id TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    label TEXT,
+    top_words TEXT,
+    PRIMARY KEY (run_id, round, metric)
+);
+CREATE INDEX IF NOT EXISTS round_metrics_metric ON round_metrics (metric, round);
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    scenario_name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_filters ON messages (scenario_name, mode, agent, round);
+"""
+# External-content FTS5 table over messages.content; rowid is messages.id.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+USING fts5(content, content='messages', content_rowid='id');
+"""
+_fts_available: bool | None = None
+
+
+def _connect() -> sqlite3.Connection:
+    global _fts_available
+    RESULTS_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(RESULTS_INDEX_PATH)
+    connection.executescript(_SCHEMA)
+    round_columns = {row[1] for row in connection.execute("PRAGMA table_info(round_evaluations)")}
+    if "judge_tier" not in round_columns:
+        # Indexes created before judge cascades.
+        connection.execute("ALTER TABLE round_evaluations ADD COLUMN judge_tier TEXT")
+    if _fts_available is not False:
+        try:
+            connection.executescript(_FTS_SCHEMA)
+            _fts_available = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: search falls back to LIKE scans.
+            _fts_available = False
+    return connection
+
+
+def _normalize_outcome(value: Any) -> str:
+    # Same labelling as the Global Results summary tables.
+    if not isinstance(value, str):
+        return "unknown"
+    label = value.split(":", 1)[0].strip().lower()
+    return label if label in STATUS_LABELS else "unknown"
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _aggregate_key(row: dict[str, Any]) -> tuple[str, str, str, str]:
+    return (
+        str(row.get("scenario_name") or ""),
+        str(row.get("mode") or "").strip().lower(),
+        _normalize_outcome(row.get("agreement_status")),
+        str(row.get("agents_model") or "").strip(),
+    )
+
+
+def _conversation_messages(row: dict[str, Any]) -> list[tuple[int, int, str, str]]:
+    # conversation_history stores {"round", "agent", "content"} objects in
+    # speaking order. Rows saved before rounds were recorded hold
+    # "agent: content" strings; for those the round is inferred assuming
+    # one turn per agent per round.
+    raw = row.get("conversation_history")
+    try:
+        messages = json.loads(raw) if isinstance(raw, str) and raw.strip() else []
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(messages, list):
+        return []
+
+    try:
+        num_agents = max(int(row.get("num_agents") or 1), 1)
+    except (TypeError, ValueError):
+        num_agents = 1
+
+    parsed = []
+    for position, message in enumerate(messages):
+        if isinstance(message, dict):
+            try:
+                round_id = int(message.get("round"))
+            except (TypeError, ValueError):
+                round_id = position // num_agents + 1
+            agent, content = str(message.get("agent") or ""), str(message.get("content") or "")
+        elif isinstance(message, str):
+            round_id = position // num_agents + 1
+            agent, separator, content = message.partition(": ")
+            if not separator:
+                agent, content = "", message
+        else:
+            continue
+        parsed.append((round_id, position, agent.strip(), content.strip()))
+    return parsed
+
+
+def _index_messages(connection: sqlite3.Connection, row: dict[str, Any]) -> None:
+    run_id = str(row.get("run_id") or "")
+    scenario_name = str(row.get("scenario_name") or "")
+    mode = str(row.get("mode") or "").strip().lower()
+    for round_id, position, agent, content in _conversation_messages(row):
+        cursor = connection.execute(
+            """
+            INSERT INTO messages (run_id, round, position, agent, scenario_name, mode, content)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (run_id, round_id, position, agent, scenario_name, mode, content),
+        )
+        if _fts_available:
+            connection.execute(
+                "INSERT INTO messages_fts (rowid, content) VALUES (?, ?)",
+                (cursor.lastrowid, content),
+            )
+
+
+def _fold_row(connection: sqlite3.Connection, row: dict[str, Any]) -> None:
+    _index_messages(connection, row)
+    key = _aggregate_key(row)
+    connection.execute(
+        """
+        INSERT INTO outcome_counts (scenario_name, mode, outcome, agents_model, runs)
+        VALUES (?, ?, ?, ?, 1)
+        ON CONFLICT (scenario_name, mode, outcome, agents_model)
+        DO UPDATE SET runs = runs + 1
+        """,
+        key,
+    )
+    for metric in AGGREGATE_METRIC_COLUMNS:
+        value = _to_float(row.get(metric))
+        if value is None:
+            continue
+        connection.execute(
+            """
+            INSERT INTO metric_sums
+                (scenario_name, mode, outcome, agents_model, metric, count, total, total_sq)
+            VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT (scenario_name, mode, outcome, agents_model, metric)
+            DO UPDATE SET
+                count = count + 1,
+                total = total + excluded.total,
+                total_sq = total_sq + excluded.total_sq
+            """,
+            (*key, metric, value, value * value),
+        )
+    connection.execute(
+        """
+        INSERT INTO index_state (key, value) VALUES ('rows_indexed', 1)
+        ON CONFLICT (key) DO UPDATE SET value = value + 1
+        """
+    )
+
+
+def _rows_indexed(connection: sqlite3.Connection) -> int:
+    found = connection.execute(
+        "SELECT value FROM index_state WHERE key = 'rows_indexed'"
+    ).fetchone()
+    return int(found[0]) if found else 0
+
+
+def index_global_result(row: dict[str, Any]) -> None:
+    """Fold one persisted global-results row into the aggregates and the transcript index."""
+    with closing(_connect()) as connection, connection:
+        _fold_row(connection, row)
+
+
+def rebuild_results_index(rows: list[dict[str, Any]]) -> None:
+    with closing(_connect()) as connection, connection:
+        connection.execute("DELETE FROM outcome_counts")
+        connection.execute("DELETE FROM metric_sums")
+        connection.execute("DELETE FROM messages")
+        if _fts_available:
+            connection.execute("INSERT INTO messages_fts (messages_fts) VALUES ('delete-all')")
+        connection.execute("DELETE FROM index_state WHERE key = 'rows_indexed'")
+        for row in rows:
+            _fold_row(connection, row)
+
+
+def sync_results_index(rows: list[dict[str, Any]]) -> None:
+    # Rebuild only when the CSV and the index disagree (first run, manual edits, deleted index).
+    with closing(_connect()) as connection:
+        in_sync = _rows_indexed(connection) == len(rows)
+    if not in_sync:
+        rebuild_results_index(rows)
+
+
+def _read_frame(connection: sqlite3.Connection, query: str, params) -> "pd.DataFrame":
+    # pandas is only needed to read frames back; writers (the dialogue page on
+    # every round) never pay for importing it.
+    import pandas as pd
+
+    return pd.read_sql_query(query, connection, params=params)
+
+
+def load_outcome_counts(scenario_name: str | None = None) -> "pd.DataFrame":
+    query = "SELECT scenario_name, mode, outcome, agents_model, runs FROM outcome_counts"
+    params: tuple[str, ...] = ()
+    if scenario_name is not None:
+        query += " WHERE scenario_name = ?"
+        params = (scenario_name,)
+    with closing(_connect()) as connection:
+        return _read_frame(connection, query, params)
+
+
+def load_metric_sums(scenario_name: str | None = None) -> "pd.DataFrame":
+    query = (
+        "SELECT scenario_name, mode, outcome, agents_model, metric, count, total, total_sq "
+        "FROM metric_sums"
+    )
+    params: tuple[str, ...] = ()
+    if scenario_name is not None:
+        query += " WHERE scenario_name = ?"
+        params = (scenario_name,)
+    with closing(_connect()) as connection:
+        return _read_frame(connection, query, params)
+
+
+def _round_metric_rows(
+    run_id: str,
+    round_id: int,
+    evaluation: dict[str, Any],
+    metrics: dict[str, Any],
+) -> list[tuple[Any, ...]]:
+    rows = []
+    for metric_name, metric_spec in metrics.items():
+        if metric_name == "agreement_status" or metric_name not in evaluation:
+            continue
+        raw_value = evaluation.get(metric_name)
+        metric_type = ""
+        if isinstance(metric_spec, dict):
+            metric_type = str(metric_spec.get("type", "")).lower()
+
+        value = None
+        label = None
+        if metric_type in NON_NUMERIC_METRIC_TYPES:
+            label = None if raw_value is None else str(raw_value)
+        elif not isinstance(raw_value, bool):
+            value = _to_float(raw_value)
+
+        top_words = evaluation.get(f"{metric_name}_top_words")
+        rows.append(
+            (
+                run_id,
+                round_id,
+                metric_name,
+                value,
+                label,
+                json.dumps(top_words, ensure_ascii=True) if isinstance(top_words, list) else None,
+            )
+        )
+    return rows
+
+
+def record_round_evaluation(
+    run_id: str,
+    round_id: int,
+    scenario_file: str,
+    mode: str,
+    evaluation: dict[str, Any],
+    metrics: dict[str, Any],
+    judge_latency_ms: float | None = None,
+) -> None:
+    """Upsert one round-judge evaluation in long format, keyed by (run_id, round).
+
+    `judge_tier` ("cheap" or "escalated") is set for rounds judged by a cascade.
+    """
+    status = evaluation.get("agreement_status")
+    summary = evaluation.get("summary")
+    judge_tier = evaluation.get("judge_tier")
+    with closing(_connect()) as connection, connection:
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO round_evaluations
+                (run_id, round, scenario_file, mode, agreement_status, summary, judge_latency_ms, judge_tier)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                run_id,
+                round_id,
+                scenario_file,
+                str(mode).strip().lower(),
+                _normalize_outcome(status) if status is not None else None,
+                summary if isinstance(summary, str) else None,
+                judge_latency_ms,
+                judge_tier if isinstance(judge_tier, str) else None,
+            ),
+        )
+        connection.execute(
+            "DELETE FROM round_metrics WHERE run_id = ? AND round = ?",
+            (run_id, round_id),
+        )
+        connection.executemany(
+            """
+            INSERT INTO round_metrics (run_id, round, metric, value, label, top_words)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            _round_metric_rows(run_id, round_id, evaluation, metrics),
+        )
+
+
+def load_round_metrics(
+    metric: str | None = None,
+    scenario_file: str | None = None,
+    mode: str | None = None,
+) -> "pd.DataFrame":
+    """Per-round metric values across runs, joined with their round-level fields."""
+    query = (
+        "SELECT e.run_id, e.round, e.scenario_file, e.mode, e.agreement_status, "
+        "e.judge_latency_ms, e.judge_tier, m.metric, m.value, m.label, m.top_words "
+        "FROM round_metrics AS m "
+        "JOIN round_evaluations AS e ON e.run_id = m.run_id AND e.round = m.round"
+    )
+    filters = []
+    params: list[str] = []
+    if metric is not None:
+        filters.append("m.metric = ?")
+        params.append(metric)
+    if scenario_file is not None:
+        filters.append("e.scenario_file = ?")
+        params.append(scenario_file)
+    if mode is not None:
+        filters.append("e.mode = ?")
+        params.append(str(mode).strip().lower())
+    if filters:
+        query += " WHERE " + " AND ".join(filters)
+    query += " ORDER BY e.run_id, e.round"
+    with closing(_connect()) as connection:
+        return _read_frame(connection, query, params)
+
+
+def _call_history(connection: sqlite3.Connection, scenario_file: str | None, scenario_name: str | None) -> dict[str, float | None]:
+    round_filter, round_params = ("WHERE scenario_file = ?", (scenario_file,)) if scenario_file is not None else ("", ())
+    message_filter, message_params = ("WHERE scenario_name = ?", (scenario_name,)) if scenario_name is not None else ("", ())
+    rounds = connection.execute(
+        f"SELECT judge_latency_ms, judge_tier FROM round_evaluations {round_filter} ORDER BY rowid DESC LIMIT ?",
+        (*round_params, CALL_HISTORY_SAMPLE),
+    ).fetchall()
+    (message_chars,) = connection.execute(
+        f"SELECT AVG(LENGTH(content)) FROM (SELECT content FROM messages {message_filter} ORDER BY id DESC LIMIT ?)",
+        (*message_params, CALL_HISTORY_SAMPLE),
+    ).fetchone()
+
+    latencies = [latency for latency, _tier in rounds if latency is not None]
+    tiers = [tier for _latency, tier in rounds if tier in {"cheap", "escalated"}]
+    return {
+        "judge_latency_ms": statistics.median(latencies) if latencies else None,
+        "message_chars": message_chars,
+        "escalation_rate": tiers.count("escalated") / len(tiers) if tiers else None,
+    }
+
+
+def load_call_history(scenario_file: str | None = None, scenario_name: str | None = None) -> dict[str, float | None]:
+    """Recent per-call figures for cost estimates; None where nothing was recorded.
+
+    `judge_latency_ms` is the median wall time of one round judgement,
+    `message_chars` the mean length of an agent message, and
+    `escalation_rate` the share of cascaded rounds escalated past the
+    screening judge. A scenario without history falls back to all runs.
+    """
+    with closing(_connect()) as connection:
+        history = _call_history(connection, scenario_file, scenario_name)
+        if (scenario_file is not None or scenario_name is not None) and None in history.values():
+            overall = _call_history(connection, None, None)
+            history = {key: overall[key] if value is None else value for key, value in history.items()}
+    return history
+
+
+def search_messages(
+    text: str,
+    scenario_name: str | None = None,
+    mode: str | None = None,
+    agent: str | None = None,
+    round_id: int | None = None,
+    limit: int = 200,
+) -> "pd.DataFrame":
+    """Find stored transcript messages containing `text` as a phrase."""
+    columns = ["run_id", "round", "agent", "scenario_name", "mode", "content"]
+    phrase = str(text).strip()
+    if not phrase:
+        import pandas as pd
+
+        return pd.DataFrame(columns=columns)
+
+    with closing(_connect()) as connection:
+        if _fts_available:
+            query = (
+                "SELECT m.run_id, m.round, m.agent, m.scenario_name, m.mode, m.content "
+                "FROM messages_fts JOIN messages AS m ON m.id = messages_fts.rowid "
+                "WHERE messages_fts MATCH ?"
+            )
+            params: list[Any] = ['"' + phrase.replace('"', '""') + '"']
+        else:
+            query = (
+                "SELECT m.run_id, m.round, m.agent, m.scenario_name, m.mode, m.content "
+                "FROM messages AS m WHERE m.content LIKE ? ESCAPE '\\'"
+            )
+            escaped = phrase.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params = [f"%{escaped}%"]
+
+        if scenario_name is not None:
+            query += " AND m.scenario_name = ?"
+            params.append(scenario_name)
+        if mode is not None:
+            query += " AND m.mode = ?"
+            params.append(str(mode).strip().lower())
+        if agent is not None:
+            query += " AND m.agent = ?"
+            params.append(agent)
+        if round_id is not None:
+            query += " AND m.round = ?"
+            params.append(int(round_id))
+        query += " ORDER BY m.run_id, m.position LIMIT ?"
+        params.append(int(limit))
+        return _read_frame(connection, query, params)
+
+
+def list_message_agents(scenario_name: str | None = None) -> list[str]:
+    query = "SELECT DISTINCT agent FROM messages WHERE agent != ''"
+    params: tuple[str, ...] = ()
+    if scenario_name is not None:
+        query += " AND scenario_name = ?"
+        params = (scenario_name,)
+    with closing(_connect()) as connection:
+        return sorted(found[0] for found in connection.execute(query, params))
@@ -1,13 +1,18 @@
 import csv
+import threading
 from pathlib import Path
 from typing import Any
 
+from run_results_index import index_global_result
+
 
 RESULTS_DIR = Path("output")
 GLOBAL_RESULTS_PATH = RESULTS_DIR / "global_results.csv"
 GLOBAL_RESULT_COLUMNS = [
     "timestamp_utc",
     "run_id",
+    "experiment_id",
+    "cell_id",
     "scenario_file",
     "scenario_name",
     "num_agents",
@@ -25,6 +30,8 @@ GLOBAL_RESULT_COLUMNS = [
     "agreement_status",
     "conversation_history",
     "utility_total_history",
+    "local_utility_history",
+    "frontier_distance",
     "unanimous",
     "final_persuasion",
     "final_deception",
@@ -34,6 +41,9 @@ GLOBAL_RESULT_COLUMNS = [
     "interaction_pattern",
     "dominant_agent",
 ]
+# Experiment workers and the dialogue page can save runs at the same time;
+# the CSV (including a header migration) and its index are written under this lock.
+_WRITE_LOCK = threading.Lock()
 
 
 def append_global_result(row: dict[str, Any]) -> None:
@@ -42,7 +52,11 @@ def append_global_result(row: dict[str, Any]) -> None:
     for key in GLOBAL_RESULT_COLUMNS:
         value = row.get(key, "")
         normalized_row[key] = "" if value is None else str(value)
+    with _WRITE_LOCK:
+        _append_normalized_row(normalized_row)
+
 
+def _append_normalized_row(normalized_row: dict[str, str]) -> None:
     existing_rows: list[dict[str, str]] = []
     should_rewrite = False
     if GLOBAL_RESULTS_PATH.exists():
@@ -70,30 +84,33 @@ def append_global_result(row: dict[str, Any]) -> None:
         if not file_exists:
             writer.writeheader()
         writer.writerow(normalized_row)
+    index_global_result(normalized_row)
 
 
 def load_global_results() -> list[dict[str, str]]:
     if not GLOBAL_RESULTS_PATH.exists():
         return []
 
-    with GLOBAL_RESULTS_PATH.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        existing_header = reader.fieldnames or []
-        raw_rows = list(reader)
+    # Held while reading too, so a header migration cannot drop a row appended meanwhile.
+    with _WRITE_LOCK:
+        with GLOBAL_RESULTS_PATH.open("r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            existing_header = reader.fieldnames or []
+            raw_rows = list(reader)
 
-    rows = []
-    for raw_row in raw_rows:
-        normalized = {}
-        for key in GLOBAL_RESULT_COLUMNS:
-            value = raw_row.get(key, "")
-            normalized[key] = "" if value is None else value
-        rows.append(normalized)
+        rows = []
+        for raw_row in raw_rows:
+            normalized = {}
+            for key in GLOBAL_RESULT_COLUMNS:
+                value = raw_row.get(key, "")
+                normalized[key] = "" if value is None else value
+            rows.append(normalized)
 
-    if existing_header != GLOBAL_RESULT_COLUMNS:
-        with GLOBAL_RESULTS_PATH.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=GLOBAL_RESULT_COLUMNS)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+        if existing_header != GLOBAL_RESULT_COLUMNS:
+            with GLOBAL_RESULTS_PATH.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=GLOBAL_RESULT_COLUMNS)
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow(row)
 
     return rows
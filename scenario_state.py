@@ -1,25 +1,225 @@
+import hashlib
 import json
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
 import streamlit as st
 
 
 SCENARIOS_DIR = Path("scenarios")
 
+# Declarative shape of a scenario file. Keys ending in "?" are optional;
+# a one-element list describes a list whose items all match that element.
+SCENARIO_SCHEMA = {
+    "name": str,
+    "description?": str,
+    "agents": [
+        {
+            "id": str,
+            "name": str,
+            "role?": str,
+            "public_description?": str,
+            "objective?": str,
+            "resources?": dict,
+            "constraints?": list,
+            "private_goals?": dict,
+        }
+    ],
+    "resources_to_negotiate?": dict,
+    "metrics?": dict,
+    "negotiation_rules?": dict,
+}
+
+
+class ScenarioValidationError(ValueError):
+    """Raised when a scenario file does not match SCENARIO_SCHEMA."""
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a real dict for json.dumps and isinstance checks."""
+
+    def _readonly(self, *_args, **_kwargs):
+        raise TypeError("Scenario payloads are read-only; copy with dict(...) to modify.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, _memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list; still a real list for json.dumps and isinstance checks."""
+
+    def _readonly(self, *_args, **_kwargs):
+        raise TypeError("Scenario payloads are read-only; copy with list(...) to modify.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, _memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    return value
+
+
+_Validator = Callable[[Any, str, list[str]], None]
+
+
+def _compile_schema(schema: Any) -> _Validator:
+    """Turn a schema node into a validator closure, once at import time."""
+    if isinstance(schema, dict):
+        fields = [
+            (key.rstrip("?"), key.endswith("?"), _compile_schema(child))
+            for key, child in schema.items()
+        ]
+
+        def validate_object(value: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(value, dict):
+                errors.append(f"{path or 'scenario'}: expected an object")
+                return
+            for key, optional, validate_field in fields:
+                field_path = f"{path}.{key}" if path else key
+                if key not in value:
+                    if not optional:
+                        errors.append(f"{field_path}: missing required field")
+                    continue
+                validate_field(value[key], field_path, errors)
+
+        return validate_object
+
+    if isinstance(schema, list):
+        validate_item = _compile_schema(schema[0])
+
+        def validate_list(value: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(value, list) or not value:
+                errors.append(f"{path}: expected a non-empty list")
+                return
+            for index, item in enumerate(value):
+                validate_item(item, f"{path}[{index}]", errors)
+
+        return validate_list
+
+    def validate_type(value: Any, path: str, errors: list[str]) -> None:
+        if not isinstance(value, schema):
+            errors.append(f"{path}: expected {schema.__name__}, got {type(value).__name__}")
+
+    return validate_type
+
+
+_validate_scenario_shape = _compile_schema(SCENARIO_SCHEMA)
+
+
+def validate_scenario(payload: Any) -> None:
+    """Raise ScenarioValidationError listing every problem found in `payload`."""
+    errors: list[str] = []
+    _validate_scenario_shape(payload, "", errors)
+    if not errors:
+        agent_ids = [agent["id"] for agent in payload["agents"]]
+        if len(set(agent_ids)) != len(agent_ids):
+            errors.append("agents: agent ids must be unique")
+    if errors:
+        raise ScenarioValidationError("; ".join(errors))
+
+
+@dataclass(frozen=True)
+class ScenarioEntry:
+    filename: str
+    payload: FrozenDict
+    content_hash: str
+    file_stamp: tuple[int, int]
+
+
+class ScenarioRegistry:
+    """Process-wide cache of validated scenarios, invalidated when files change.
+
+    Change detection is a stat() per lookup (mtime and size), which is far
+    cheaper than re-reading and re-validating the JSON on every rerun.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._entries: dict[str, ScenarioEntry] = {}
+        self._listing: tuple[tuple[int, int] | None, list[str]] = (None, [])
+
+    def list_files(self) -> list[str]:
+        try:
+            directory_stat = self.directory.stat()
+        except FileNotFoundError:
+            return []
+        stamp = (directory_stat.st_mtime_ns, directory_stat.st_ino)
+        with self._lock:
+            if self._listing[0] == stamp:
+                return list(self._listing[1])
+        filenames = sorted(
+            p.name for p in self.directory.iterdir() if p.is_file() and p.suffix.lower() == ".json"
+        )
+        with self._lock:
+            self._listing = (stamp, filenames)
+        return list(filenames)
+
+    def get(self, filename: str) -> ScenarioEntry:
+        path = self.directory / filename
+        file_stat = path.stat()
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self._lock:
+            entry = self._entries.get(filename)
+        if entry is not None and entry.file_stamp == stamp:
+            return entry
+
+        raw = path.read_bytes()
+        payload = json.loads(raw.decode("utf-8"))
+        try:
+            validate_scenario(payload)
+        except ScenarioValidationError as exc:
+            raise ScenarioValidationError(f"{filename}: {exc}") from None
+        entry = ScenarioEntry(
+            filename=filename,
+            payload=_freeze(payload),
+            content_hash=hashlib.sha256(raw).hexdigest(),
+            file_stamp=stamp,
+        )
+        with self._lock:
+            self._entries[filename] = entry
+        return entry
+
+
+_REGISTRY = ScenarioRegistry(SCENARIOS_DIR)
+
 
 def list_scenario_files() -> list[str]:
-    if not SCENARIOS_DIR.exists():
-        return []
-    return sorted(
-        p.name for p in SCENARIOS_DIR.iterdir() if p.is_file() and p.suffix.lower() == ".json"
-    )
+    return _REGISTRY.list_files()
 
 
 def load_scenario(filename: str) -> dict:
-    """Load a scenario JSON file and return its content as a dictionary."""
-    path = SCENARIOS_DIR / filename
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load a validated scenario and return its read-only content."""
+    return _REGISTRY.get(filename).payload
+
+
+def scenario_content_hash(filename: str) -> str:
+    """Return the SHA-256 of the scenario file as currently loaded."""
+    return _REGISTRY.get(filename).content_hash
 
 
 def set_active_scenario(filename: str, payload: dict) -> None:
@@ -29,8 +229,30 @@ def set_active_scenario(filename: str, payload: dict) -> None:
 
 
 def get_active_scenario() -> tuple[str | None, dict | None]:
-    """Get the active scenario from Streamlit session state."""
-    return (
-        st.session_state.get("active_scenario_file"),
-        st.session_state.get("active_scenario"),
-    )
+    """Get the active scenario from Streamlit session state.
+
+    If the scenario file changed on disk since it was selected, the session is
+    switched to the freshly validated payload.
+    """
+    active_file = st.session_state.get("active_scenario_file")
+    active_payload = st.session_state.get("active_scenario")
+    if active_file and active_payload is not None:
+        try:
+            entry = _REGISTRY.get(active_file)
+        except (OSError, ValueError):
+            entry = None
+        if entry is not None and entry.payload is not active_payload:
+            set_active_scenario(active_file, entry.payload)
+            active_payload = entry.payload
+    return active_file, active_payload
+
+
+def get_active_scenario_hash() -> str | None:
+    """Content hash of the active scenario file, or None if it cannot be loaded."""
+    active_file = st.session_state.get("active_scenario_file")
+    if not active_file:
+        return None
+    try:
+        return scenario_content_hash(active_file)
+    except (OSError, ValueError):
+        return None
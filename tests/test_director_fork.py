@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from core.director import NegotiationDirector
+
+
+SCENARIO_PATH = Path(__file__).resolve().parent.parent / "scenarios" / "salary_negotiation.json"
+
+
+class _Reply:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _RecordingModerator:
+    # Records every prompt and always seats the first candidate listed.
+    def __init__(self):
+        self.prompts: list[str] = []
+
+    def invoke(self, prompt: str) -> _Reply:
+        self.prompts.append(prompt)
+        first_candidate = prompt.split("PARTIES WHO HAVE NOT SPOKEN THIS ROUND:\n- ", 1)[1].split("\n", 1)[0]
+        return _Reply(first_candidate)
+
+
+def _moderated_director(moderator: _RecordingModerator) -> NegotiationDirector:
+    scenario = json.loads(SCENARIO_PATH.read_text(encoding="utf-8"))
+    scenario["negotiation_rules"] = {"turn_order": "moderator", "max_rounds": 5}
+    director = NegotiationDirector(scenario, llm_factory=None, moderator_llm_factory=lambda: moderator)
+    for agent in director.agents:
+        # No model calls: each agent says which run and round it is speaking in.
+        agent.reply = lambda message, name=agent.spec.name: f"{name} offer {len(director.history)}"
+    return director
+
+
+def test_fork_moderator_reads_the_branch_transcript():
+    moderator = _RecordingModerator()
+    parent = _moderated_director(moderator)
+    parent.step("Open")
+    parent.step("Continue")
+    parent_round_two = [event["content"] for event in parent.history if event["round"] == 2]
+
+    branch = parent.fork(at_round=1)
+    for agent in branch.agents:
+        agent.reply = lambda message, name=agent.spec.name: f"{name} branch reply"
+    moderator.prompts.clear()
+    branch.step("Continue on the branch")
+
+    assert moderator.prompts
+    for prompt in moderator.prompts:
+        assert all(content not in prompt for content in parent_round_two)
+    # The last pick of the round already sees the branch's own reply.
+    assert "branch reply" in moderator.prompts[-1]
+
+
+def test_fork_rebuilds_the_scheduler():
+    parent = _moderated_director(_RecordingModerator())
+    parent.step("Open")
+    branch = parent.fork()
+
+    assert branch.scheduler is not parent.scheduler
+    branch.step("Continue")
+    assert [event["round"] for event in parent.history] == [1] * len(parent.agents)
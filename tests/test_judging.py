@@ -0,0 +1,207 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.director import NegotiationDirector
+from core.judging import (
+    CascadeJudge,
+    RoundJudge,
+    SingleJudge,
+    TwoTierJudge,
+    aggregate_evaluations,
+    build_round_judge,
+    cascade_hit_rate,
+)
+
+
+SCENARIO_PATH = Path(__file__).resolve().parent.parent / "scenarios" / "salary_negotiation.json"
+
+
+class _Reply:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _ScriptedLLM:
+    # Answers each call with the next scripted reply (dicts as JSON), the last one repeating.
+    def __init__(self, *replies: dict | str):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def invoke(self, prompt: str) -> _Reply:
+        reply = self.replies[min(self.calls, len(self.replies) - 1)]
+        self.calls += 1
+        return _Reply(reply if isinstance(reply, str) else json.dumps(reply))
+
+
+def _director(max_rounds: int = 10) -> NegotiationDirector:
+    scenario = json.loads(SCENARIO_PATH.read_text(encoding="utf-8"))
+    scenario["negotiation_rules"] = {"max_rounds": max_rounds}
+    director = NegotiationDirector(scenario, llm_factory=None)
+    for agent in director.agents:
+        agent.reply = lambda message, name=agent.spec.name: f"{name} offer"
+    return director
+
+
+def test_incomplete_judge_fails_on_instantiation():
+    class NoEvaluate(RoundJudge):
+        pass
+
+    with pytest.raises(TypeError):
+        NoEvaluate()
+
+
+def test_build_round_judge_layers():
+    def factory(model, **options):
+        return (model, options)
+
+    rules = {"judge_model": "judge", "judge_cascade_model": "cheap", "judge_annotate_every": 3}
+    judge = build_round_judge(rules, {}, factory)
+
+    assert isinstance(judge, TwoTierJudge)
+    assert isinstance(judge.annotator, CascadeJudge)
+    assert isinstance(judge.annotator.judge, SingleJudge)
+
+
+def test_two_tier_cascade_compares_metrics_across_status_only_rounds():
+    director = _director()
+    judge_llm = _ScriptedLLM({"agreement_status": "ongoing", "fairness": 8})
+    cheap_llm = _ScriptedLLM(
+        {"agreement_status": "ongoing", "confidence": 9, "fairness": 2},
+        {"agreement_status": "ongoing", "confidence": 9, "fairness": 8},
+    )
+    cascade = CascadeJudge(cheap_llm, SingleJudge(judge_llm), director.scenario["metrics"], max_swing=3)
+    judge = TwoTierJudge(_ScriptedLLM({"agreement_status": "ongoing"}), cascade, annotate_every=2)
+
+    tiers = []
+    for _ in range(4):
+        director.step("Continue")
+        evaluation = judge.evaluate(director)
+        director.register_evaluation(evaluation)
+        tiers.append((evaluation["annotation"], evaluation.get("judge_tier"), evaluation.get("judge_escalation")))
+
+    assert director.last_evaluation["annotation"] == "full"
+    assert tiers == [
+        ("status_only", None, None),
+        ("full", "cheap", None),
+        ("status_only", None, None),
+        # Round 4 is compared with round 2's metrics, not round 3's status-only entry.
+        ("full", "escalated", ["metric_swing"]),
+    ]
+    assert judge_llm.calls == 1
+
+
+@pytest.mark.parametrize(
+    ("cheap_reply", "reasons"),
+    [
+        ({"agreement_status": "ongoing", "confidence": 9, "fairness": 5}, []),
+        ("The parties are still talking.", ["invalid_output"]),
+        ({"agreement_status": "reached", "confidence": 9, "fairness": 5}, ["terminal_status"]),
+        ({"agreement_status": "failed: walked away", "confidence": 9, "fairness": 5}, ["terminal_status"]),
+        ({"confidence": 9, "fairness": 5}, ["terminal_status"]),
+        ({"agreement_status": "ongoing", "confidence": 7, "fairness": 5}, []),
+        ({"agreement_status": "ongoing", "confidence": 6, "fairness": 5}, ["low_confidence"]),
+        ({"agreement_status": "ongoing", "fairness": 5}, ["low_confidence"]),
+        ({"agreement_status": "ongoing", "confidence": 9, "fairness": 8}, []),
+        ({"agreement_status": "ongoing", "confidence": 9, "fairness": 9}, ["metric_swing"]),
+        ({"agreement_status": "ongoing", "confidence": 9, "fairness": 1}, ["metric_swing"]),
+        (
+            {"agreement_status": "reached", "confidence": 2, "fairness": 9},
+            ["terminal_status", "low_confidence", "metric_swing"],
+        ),
+    ],
+)
+def test_cascade_escalation(cheap_reply, reasons):
+    director = _director()
+    director.step("Open")
+    director.register_evaluation({"agreement_status": "ongoing", "fairness": 5})
+    judge_llm = _ScriptedLLM({"agreement_status": "ongoing", "fairness": 5})
+    cascade = CascadeJudge(
+        _ScriptedLLM(cheap_reply), SingleJudge(judge_llm), director.scenario["metrics"], min_confidence=7, max_swing=3
+    )
+
+    evaluation = cascade.evaluate(director)
+
+    if reasons:
+        assert (evaluation["judge_tier"], evaluation["judge_escalation"], judge_llm.calls) == ("escalated", reasons, 1)
+    else:
+        assert (evaluation["judge_tier"], judge_llm.calls) == ("cheap", 0)
+
+
+METRICS = {
+    "agreement_status": {"type": "multiclass"},
+    "fairness": {"type": "score", "scale": "1-10"},
+    "tone": {"type": "enum"},
+}
+
+
+@pytest.mark.parametrize(
+    ("evaluations", "expected"),
+    [
+        (
+            [
+                {"agreement_status": "reached", "fairness": 3},
+                {"agreement_status": "reached: signed", "fairness": 8},
+                {"agreement_status": "ongoing", "fairness": 6},
+            ],
+            {"agreement_status": "reached", "fairness": 6, "judge_votes": {"reached": 2, "ongoing": 1}},
+        ),
+        (
+            [{"agreement_status": "reached", "fairness": 4}, {"agreement_status": "failed", "fairness": 7}],
+            {"agreement_status": "ongoing", "fairness": 4, "judge_votes": {"reached": 1, "failed": 1}},
+        ),
+        (
+            [
+                {"agreement_status": "reached", "fairness": 5.5},
+                {"agreement_status": "failed", "fairness": 6.5},
+                {"agreement_status": "ongoing", "fairness": 9},
+            ],
+            {"agreement_status": "ongoing", "fairness": 6.5},
+        ),
+        (
+            [{"error": "judge_output_not_json", "raw": "?"}, {"agreement_status": "failed", "fairness": 2}],
+            {"agreement_status": "failed", "fairness": 2, "judge_count": 2, "judge_disagreement": 0.0},
+        ),
+        (
+            [{"agreement_status": "ongoing", "tone": "calm"}, {"agreement_status": "ongoing", "tone": "Calm: steady"}],
+            {"agreement_status": "ongoing", "tone": "calm", "judge_disagreement": 0.0},
+        ),
+    ],
+)
+def test_aggregate_evaluations(evaluations, expected):
+    merged = aggregate_evaluations(evaluations, METRICS)
+
+    assert {key: merged.get(key) for key in expected} == expected
+
+
+def test_aggregate_evaluations_disagreement():
+    merged = aggregate_evaluations(
+        [
+            {"agreement_status": "reached", "fairness": 1},
+            {"agreement_status": "reached", "fairness": 10},
+            {"agreement_status": "ongoing", "fairness": 4},
+        ],
+        METRICS,
+    )
+
+    # Status: 1/3 of the votes lost; fairness: spread 9 over the 1-10 scale.
+    assert merged["judge_disagreement"] == round((1 / 3 + 1.0) / 2, 3)
+
+
+def test_aggregate_evaluations_without_valid_output():
+    merged = aggregate_evaluations([{"error": "judge_output_not_json"}, {"error": "timeout"}], METRICS)
+
+    assert merged == {"error": "judge_output_not_json", "judge_count": 2}
+
+
+@pytest.mark.parametrize(
+    ("evaluations", "expected"),
+    [
+        ([], (0, 0)),
+        ([{"agreement_status": "ongoing"}, {"annotation": "status_only"}], (0, 0)),
+        ([{"judge_tier": "cheap"}, {"judge_tier": "escalated"}, None, {"judge_tier": "cheap"}], (2, 3)),
+    ],
+)
+def test_cascade_hit_rate(evaluations, expected):
+    assert cascade_hit_rate(evaluations) == expected
@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.negotiation_space import build_negotiation_space
+from core.proposals import ProposalParser
+
+
+SCENARIOS = Path(__file__).resolve().parent.parent / "scenarios"
+
+
+def _parser(scenario_file: str) -> ProposalParser:
+    scenario = json.loads((SCENARIOS / scenario_file).read_text(encoding="utf-8"))
+    return ProposalParser(build_negotiation_space(scenario))
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ("€72,000", 72000.0),
+        ("€72.5k", 72500.0),
+        ("1,250,000", 1250000.0),
+        ("€70-75k", 72500.0),
+        ("€70k-€75k", 72500.0),
+        ("€70,000 – €75,000", 72500.0),
+        ("70k to 75k", 72500.0),
+    ],
+)
+def test_salary_figures(body, expected):
+    offer = _parser("salary_negotiation.json").extract(f"PROPOSAL:\n- Base Salary: {body}")
+
+    assert offer == {"base_salary": expected}
+
+
+def test_range_scaled_only_at_its_start_is_dropped():
+    offer = _parser("salary_negotiation.json").extract("PROPOSAL:\n- Base Salary: €70k-75\n- Remote Work: 3 days")
+
+    assert offer == {"remote_work": 3.0}
+
+
+def test_budget_category_range():
+    offer = _parser("resource_division.json").extract(
+        "PROPOSAL:\n- Equity: 55% for me, 45% for other party\n"
+        "- Budget: salaries €40-45k, marketing €40,000, development €15k"
+    )
+
+    assert offer["equity"] == 55.0
+    assert offer["budget"] == {"salaries": 42500.0, "marketing": 40000.0, "development": 15000.0}
@@ -0,0 +1,35 @@
+import json
+
+from run_results_index import _conversation_messages
+
+
+def test_messages_keep_their_recorded_round():
+    # Addressed-only turns: round 1 has both agents, round 2 only one.
+    row = {
+        "num_agents": 2,
+        "conversation_history": json.dumps(
+            [
+                {"round": 1, "agent": "Alice", "content": "Offer A"},
+                {"round": 1, "agent": "Bob", "content": "Offer B"},
+                {"round": 2, "agent": "Alice", "content": "Bob, final offer"},
+                {"round": 3, "agent": "Bob", "content": "Accepted"},
+            ]
+        ),
+    }
+
+    assert [(round_id, agent) for round_id, _position, agent, _content in _conversation_messages(row)] == [
+        (1, "Alice"),
+        (1, "Bob"),
+        (2, "Alice"),
+        (3, "Bob"),
+    ]
+
+
+def test_legacy_string_messages_infer_the_round():
+    row = {"num_agents": 2, "conversation_history": json.dumps(["Alice: Offer A", "Bob: Offer B", "Alice: Again"])}
+
+    assert _conversation_messages(row) == [
+        (1, 0, "Alice", "Offer A"),
+        (1, 1, "Bob", "Offer B"),
+        (2, 2, "Alice", "Again"),
+    ]
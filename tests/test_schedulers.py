@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core.director import NegotiationDirector
+from core.schedulers import (
+    TURN_ORDERS,
+    AddressedOnlyScheduler,
+    ModeratorScheduler,
+    SeededRandomScheduler,
+    TurnScheduler,
+    _is_addressed,
+    build_scheduler,
+)
+
+
+SCENARIO_PATH = Path(__file__).resolve().parent.parent / "scenarios" / "salary_negotiation.json"
+
+
+def _agent(agent_id: str, name: str) -> SimpleNamespace:
+    return SimpleNamespace(spec=SimpleNamespace(id=agent_id, name=name))
+
+
+AGENTS = [
+    _agent("agent_a", "Alice Moreau"),
+    _agent("agent_b", "Bob"),
+    _agent("agent_c", "Carla Conti"),
+    _agent("agent_d", "Dev"),
+]
+
+
+def _names(agents) -> list[str]:
+    return [agent.spec.name for agent in agents]
+
+
+def _event(agent: str, content: str) -> dict[str, str]:
+    return {"round": 1, "agent": agent, "content": content}
+
+
+def test_incomplete_scheduler_fails_on_instantiation():
+    class NoTurns(TurnScheduler):
+        pass
+
+    with pytest.raises(TypeError):
+        NoTurns()
+
+
+def test_every_turn_order_builds_a_scheduler():
+    for turn_order in TURN_ORDERS:
+        assert isinstance(build_scheduler(turn_order), TurnScheduler)
+
+
+def test_seeded_random_replays_the_same_order():
+    first, replay = SeededRandomScheduler(seed=7), SeededRandomScheduler(seed=7)
+
+    for round_index in range(5):
+        order = _names(first.turns(AGENTS, [], round_index))
+        assert order == _names(replay.turns(AGENTS, [], round_index))
+        assert sorted(order) == sorted(_names(AGENTS))
+
+
+def test_seeded_random_orders_change_across_rounds_and_seeds():
+    def orders(seed):
+        return [tuple(_names(SeededRandomScheduler(seed).turns(AGENTS, [], round_index))) for round_index in range(10)]
+
+    assert len(set(orders(7))) > 1
+    assert orders(7) != orders(8)
+
+
+@pytest.mark.parametrize(
+    ("agent", "content", "addressed"),
+    [
+        (_agent("agent_a", "Alice Moreau"), "Alice, can you move on salary?", True),
+        (_agent("agent_a", "Alice Moreau"), "I hear you, ALICE MOREAU.", True),
+        (_agent("agent_a", "Alice Moreau"), "As agent_a said before", True),
+        (_agent("agent_a", "Alice Moreau"), "Alicessa will decide.", False),
+        (_agent("agent_b", "The Business Founder"), "The offer stands.", False),
+        (_agent("agent_b", "The Business Founder"), "Over to the business founder.", True),
+        (_agent("x", "Al"), "Al, your turn.", True),
+    ],
+)
+def test_is_addressed(agent, content, addressed):
+    assert _is_addressed(agent, content) is addressed
+
+
+def test_addressed_only_seats_everyone_on_the_first_turn():
+    assert _names(AddressedOnlyScheduler().turns(AGENTS, [], 0)) == _names(AGENTS)
+
+
+def test_addressed_only_skips_agents_nobody_addressed():
+    history = [_event("Alice Moreau", "Bob and Dev, I need your numbers. Alice Moreau out.")]
+
+    assert _names(AddressedOnlyScheduler().turns(AGENTS, history, 1)) == ["Bob", "Dev"]
+
+
+def test_addressed_only_falls_back_to_everyone_but_the_author():
+    history = [_event("Bob", "Here is my proposal.")]
+
+    assert _names(AddressedOnlyScheduler().turns(AGENTS, history, 1)) == ["Alice Moreau", "Carla Conti", "Dev"]
+
+
+def test_moderator_seats_the_chosen_speakers_in_order():
+    picks = iter(["Carla Conti", "Alice Moreau", None])
+    scheduler = ModeratorScheduler(lambda candidates, history: next(picks))
+
+    assert _names(scheduler.turns(AGENTS, [], 0)) == ["Carla Conti", "Alice Moreau"]
+
+
+@pytest.mark.parametrize("answer", [None, "", "Nobody in particular", "alice"])
+def test_moderator_invalid_first_pick_seats_the_least_heard_agent(answer):
+    history = [_event("Alice Moreau", "Offer"), _event("Bob", "Counter"), _event("Dev", "Counter")]
+    calls = []
+
+    def choose(candidates, history):
+        calls.append(_names(candidates))
+        return answer
+
+    # The invalid second answer ends the round: the other agents are skipped.
+    assert _names(ModeratorScheduler(choose).turns(AGENTS, history, 1)) == ["Carla Conti"]
+    assert calls == [_names(AGENTS), ["Alice Moreau", "Bob", "Dev"]]
+
+
+def test_moderator_pick_of_an_agent_who_already_spoke_ends_the_round():
+    picks = iter(["Bob", "Bob"])
+    scheduler = ModeratorScheduler(lambda candidates, history: next(picks))
+
+    assert _names(scheduler.turns(AGENTS, [], 0)) == ["Bob"]
+
+
+def test_moderator_without_chooser_seats_everyone_least_heard_first():
+    history = [_event("Alice Moreau", "Offer"), _event("Carla Conti", "Counter")]
+
+    assert _names(ModeratorScheduler().turns(AGENTS, history, 1)) == ["Bob", "Dev", "Alice Moreau", "Carla Conti"]
+
+
+def test_moderator_none_saves_the_skipped_agents_calls():
+    class Moderator:
+        def invoke(self, prompt):
+            return SimpleNamespace(content="NONE")
+
+    scenario = json.loads(SCENARIO_PATH.read_text(encoding="utf-8"))
+    scenario["negotiation_rules"] = {"turn_order": "moderator", "max_rounds": 5}
+    director = NegotiationDirector(scenario, llm_factory=None, moderator_llm_factory=Moderator)
+    replies = []
+    for agent in director.agents:
+        agent.reply = lambda message, name=agent.spec.name: replies.append(name) or f"{name} offer"
+
+    director.step("Open")
+    director.step("Continue")
+
+    # One speaker per round, the least heard first: the other agent's model is never called.
+    assert replies == [director.agents[0].spec.name, director.agents[1].spec.name]
@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from core.baselines import run_baseline_negotiation
+from core.negotiation_space import build_negotiation_space
+from core.strategy_sweep import named_population, simulate_population
+
+
+SCENARIOS = Path(__file__).resolve().parent.parent / "scenarios"
+
+
+@pytest.mark.parametrize("scenario_file", ["salary_negotiation.json", "resource_division.json"])
+@pytest.mark.parametrize("max_rounds", [5, 10])
+def test_simulate_population_matches_run_baseline_negotiation(scenario_file, max_rounds):
+    space = build_negotiation_space(json.loads((SCENARIOS / scenario_file).read_text(encoding="utf-8")))
+    population = named_population(len(space.agent_ids))
+    result = simulate_population(space, population, max_rounds)
+
+    for trial, labels in enumerate(population.labels()):
+        outcome = run_baseline_negotiation(space, dict(zip(space.agent_ids, labels)), max_rounds)
+        assert (outcome.agreement, outcome.rounds) == (result.agreement[trial], result.rounds[trial])
+        np.testing.assert_allclose(outcome.offer, result.offers[trial])
+        np.testing.assert_allclose(outcome.utilities, result.utilities[trial])